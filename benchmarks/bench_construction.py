@@ -0,0 +1,31 @@
+import argparse
+import contextlib
+import os
+import time
+
+from src.hooks import product_log
+from src.main import Product
+
+
+def construct(n: int) -> float:
+    started = time.perf_counter()
+    for i in range(n):
+        Product(f"Product {i}", "Description", 100.0 + i, 1 + i % 10)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Скорость создания Product с выводом в консоль и без него")
+    parser.add_argument("-n", type=int, default=100000)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        printing = construct(args.n)
+    with product_log.quiet():
+        quiet = construct(args.n)
+    print(f"print:  {args.n / printing:12.0f} товаров/с")
+    print(f"quiet:  {args.n / quiet:12.0f} товаров/с  (x{printing / quiet:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import argparse
+import os
+import tempfile
+import tracemalloc
+
+from benchmarks.datagen import records
+from src.export import FORMATS, export
+from src.loader import build_products
+from src.main import Category
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Скорость и память потоковой выгрузки категорий")
+    parser.add_argument("-n", type=int, default=200000)
+    parser.add_argument("--memory", action="store_true", help="замерить пик памяти выгрузки (медленнее)")
+    args = parser.parse_args()
+    products, _ = build_products(records(args.n))
+    half = len(products) // 2
+    categories = [Category("Список", "Описание", products[:half]),
+                  Category("Колонки", "Описание", products[half:], columnar=True)]
+    with tempfile.TemporaryDirectory() as directory:
+        for fmt in FORMATS:
+            path = os.path.join(directory, f"report.{fmt}")
+            if args.memory:
+                tracemalloc.start()
+            stats = export(categories, path, fmt)
+            peak = tracemalloc.get_traced_memory()[1] if args.memory else 0
+            if args.memory:
+                tracemalloc.stop()
+            line = f"{fmt:>9}: {stats.per_second:9.0f} строк/с, {stats.bytes / 2 ** 20:7.1f} МиБ"
+            print(line + (f", пик {peak / 2 ** 20:.1f} МиБ" if args.memory else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import gc
+import json
+import tracemalloc
+from unittest import mock
+
+from benchmarks.datagen import records
+from src.flyweight import InternPool
+from src.hooks import product_log
+from src.loader import product_class
+from src.main import Category
+
+
+def feed(n: int):
+    # Повторный разбор JSON даёт свежие строки на каждую запись, как при чтении реального фида
+    for record in records(n):
+        if "model" in record or "country" in record:
+            yield json.loads(json.dumps(record, ensure_ascii=False))
+
+
+def retained(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Экономия памяти от интернирования атрибутов подклассов")
+    parser.add_argument("-n", type=int, default=1000000, help="размер синтетического каталога")
+    args = parser.parse_args()
+
+    def objects():
+        return [product_class(record).new_product(record) for record in feed(args.n)]
+
+    def columnar():
+        category = Category("Каталог", "Синтетический каталог", columnar=True)
+        for record in feed(args.n):
+            category.add_product(product_class(record).new_product(record))
+        return category
+
+    with product_log.quiet():
+        with mock.patch.object(InternPool, "intern", lambda self, value: value):
+            plain = retained(objects)
+        interned = retained(objects)
+        compact = retained(columnar)
+    count = sum(1 for _ in feed(args.n))
+    print(f"товаров Smartphone/LawnGrass: {count}")
+    for label, size in (("объекты без пула", plain), ("объекты с пулом", interned), ("колонки с кодами", compact)):
+        print(f"{label:>18}: {size / 2 ** 20:9.1f} MiB  {size / count:7.1f} байт/товар")
+    print(f"экономия пула на объектах: {(plain - interned) / 2 ** 20:.1f} MiB ({1 - interned / plain:.0%})")
+
+
+if __name__ == "__main__":
+    main()
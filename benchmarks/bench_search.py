@@ -0,0 +1,52 @@
+import argparse
+import random
+import statistics
+import time
+
+from src.search import TextIndex
+
+WORDS = ["Серый", "цвет", "камера", "Gray", "space", "экран", "OLED", "зарядка", "быстрая", "Ultra", "газон",
+         "трава", "элитная", "Pro", "Max", "батарея", "Черный", "USB-C", "модуль", "Зеленый", "wireless", "чехол"]
+QUERIES = ["серый камера", "gray space", "oled экран", "трава", "ultra", "быстрая зарядка"]
+PARTIAL = ["камер", "зарядк", "wirel", "газо", "батар", "ultr"]
+
+
+def texts(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    for i in range(n):
+        yield {
+            "name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}",
+            "description": f"{rng.randint(1, 8) * 128}GB, " + " ".join(rng.choices(WORDS, k=6)),
+        }
+
+
+def latencies(index: TextIndex, queries: list, partial: bool, repeat: int) -> list:
+    result = []
+    for _ in range(repeat):
+        for query in queries:
+            started = time.perf_counter()
+            index.search(query, size=20, partial=partial)
+            result.append(time.perf_counter() - started)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Скорость построения полнотекстового индекса и поиска")
+    parser.add_argument("-n", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    records = list(texts(args.n))
+    started = time.perf_counter()
+    index = TextIndex()
+    for row, fields in enumerate(records):
+        index.add(row, fields)
+    seconds = time.perf_counter() - started
+    print(f"построение: {seconds:.2f} с, {args.n / seconds:.0f} строк/с")
+    for title, queries, partial in (("точный", QUERIES, False), ("по части слова", PARTIAL, True)):
+        values = sorted(latencies(index, queries, partial, args.repeat))
+        p95 = values[int(len(values) * 0.95) - 1]
+        print(f"{title:>15}: p50 {statistics.median(values) * 1000:.2f} мс, p95 {p95 * 1000:.2f} мс")
+
+
+if __name__ == "__main__":
+    main()
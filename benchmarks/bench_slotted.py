@@ -0,0 +1,58 @@
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.hooks import product_log
+from src.main import LawnGrass, Product, Smartphone
+from src.slotted import SlottedLawnGrass, SlottedProduct, SlottedSmartphone
+
+ARGS = {
+    "Product": ("Товар", "Описание"),
+    "Smartphone": ("Смартфон", "Описание", 95.5, "S23 Ultra", 256, "Серый"),
+    "LawnGrass": ("Газонная трава", "Описание", "Россия", "7 дней", "Зеленый"),
+}
+PAIRS = [
+    ("Product", Product, SlottedProduct),
+    ("Smartphone", Smartphone, SlottedSmartphone),
+    ("LawnGrass", LawnGrass, SlottedLawnGrass),
+]
+
+
+def build(cls, kind: str, n: int) -> list:
+    name, description, *extra = ARGS[kind]
+    return [cls(name, description, 100.0 + i, 1 + i % 10, *extra) for i in range(n)]
+
+
+def bytes_per_object(cls, kind: str, n: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        products = build(cls, kind, n)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del products
+    return size / n
+
+
+def rate(cls, kind: str, n: int) -> float:
+    started = time.perf_counter()
+    build(cls, kind, n)
+    return n / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение обычных и слотовых классов товаров")
+    parser.add_argument("-n", type=int, default=200000)
+    args = parser.parse_args()
+    print(f"{'класс':>12} {'байт/объект':>22} {'создание, объектов/с':>30}")
+    with product_log.quiet():
+        for kind, regular, slotted in PAIRS:
+            size = bytes_per_object(regular, kind, args.n), bytes_per_object(slotted, kind, args.n)
+            speed = rate(regular, kind, args.n), rate(slotted, kind, args.n)
+            print(f"{kind:>12} {size[0]:10.1f} -> {size[1]:7.1f} {speed[0]:14.0f} -> {speed[1]:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
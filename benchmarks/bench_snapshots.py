@@ -0,0 +1,61 @@
+import argparse
+import threading
+import time
+
+from src.hooks import product_log
+from src.main import Category, Product
+
+
+def run(size: int, readers: int, writers: int, seconds: float, columnar: bool) -> dict:
+    category = Category("Категория", "Описание", [Product(f"Товар {i}", "Описание", 10.0 + i % 100, 100)
+                                                  for i in range(size)], columnar=columnar)
+    category.snapshot()
+    stop = threading.Event()
+    reads = [0] * readers
+    writes = [0] * writers
+
+    def read(worker: int):
+        while not stop.is_set():
+            frozen = category.snapshot()
+            frozen.middle_price()
+            str(frozen)
+            frozen[worker % len(frozen)]
+            reads[worker] += 1
+
+    def write(worker: int):
+        i = 0
+        while not stop.is_set():
+            if i % 2:
+                category.add_product(Product(f"Новый {worker} {i}", "Описание", 50.0, 1))
+            else:
+                category.apply_movements([(f"Товар {(i * 7 + worker) % size}", 1)])
+            writes[worker] += 1
+            i += 1
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=write, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return {"reads_per_second": sum(reads) / seconds, "writes_per_second": sum(writes) / seconds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Чтение срезов категории при параллельной записи")
+    parser.add_argument("-n", type=int, default=100000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    with product_log.quiet():
+        for columnar in (False, True):
+            result = run(args.n, args.readers, args.writers, args.seconds, columnar)
+            print(f"{'колоночное' if columnar else 'список':>10}: чтений {result['reads_per_second']:.0f}/с, "
+                  f"записей {result['writes_per_second']:.0f}/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import random
+
+COLORS = ["Серый", "Черный", "Белый", "Синий", "Gray space", "Зеленый", "Красный"]
+MODELS = ["S23 Ultra", "15", "15 Pro", "Note 11", "Pixel 8", "P60"]
+MEMORY = [64, 128, 256, 512, 1024]
+COUNTRIES = ["Россия", "Казахстан", "Беларусь", "Германия", "Нидерланды"]
+PERIODS = ["5 дней", "7 дней", "10 дней", "14 дней"]
+
+
+def records(n: int, seed: int = 0):
+    """Детерминированный поток словарей для new_product: треть смартфонов, треть травы."""
+    rng = random.Random(seed)
+    for i in range(n):
+        record = {
+            "name": f"Товар {i}",
+            "description": f"Описание {i % 1000}",
+            "price": round(rng.uniform(100.0, 250000.0), 2),
+            "quantity": rng.randint(1, 100),
+        }
+        kind = i % 3
+        if kind == 1:
+            record.update(efficiency=round(rng.uniform(80.0, 100.0), 1), model=rng.choice(MODELS),
+                          memory=rng.choice(MEMORY), color=rng.choice(COLORS))
+        elif kind == 2:
+            record.update(country=rng.choice(COUNTRIES), germination_period=rng.choice(PERIODS),
+                          color=rng.choice(COLORS))
+        yield record
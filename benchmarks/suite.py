@@ -0,0 +1,234 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.datagen import records
+from src.hooks import product_log
+from src.loader import product_class
+from src.main import Category, LawnGrass, Product, Smartphone
+from src.schema import schemas
+
+DEFAULT_SIZES = (1000, 100000, 1000000)
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def _products(n: int) -> list:
+    data = list(records(n))
+    return [product_class(record).new_product(record) for record in data]
+
+
+def _category(n: int, columnar: bool = False) -> Category:
+    return Category("Бенчмарк", "Синтетическая категория", _products(n), columnar=columnar)
+
+
+# Каждый бенчмарк получает размер n, готовит данные (не замеряется)
+# и возвращает функцию, время работы которой измеряется. Если функция
+# выполняет не n операций, их число указывается в атрибуте operations.
+# Созданные объекты функция возвращает, чтобы они были живы до конца
+# замера и попадали в peak_bytes.
+
+@benchmark("construct_product")
+def construct_product(n: int):
+    def run():
+        return [Product("Товар", "Описание", 100.0 + i, 1 + i % 10) for i in range(n)]
+    return run
+
+
+@benchmark("construct_smartphone")
+def construct_smartphone(n: int):
+    def run():
+        return [Smartphone("Смартфон", "Описание", 100.0 + i, 1 + i % 10, 95.5, "S23 Ultra", 256, "Серый")
+                for i in range(n)]
+    return run
+
+
+@benchmark("construct_lawn_grass")
+def construct_lawn_grass(n: int):
+    def run():
+        return [LawnGrass("Газонная трава", "Описание", 100.0 + i, 1 + i % 10, "Россия", "7 дней", "Зеленый")
+                for i in range(n)]
+    return run
+
+
+@benchmark("new_product")
+def new_product(n: int):
+    data = [(product_class(record), record) for record in records(n)]
+
+    def run():
+        return [cls.new_product(record) for cls, record in data]
+    return run
+
+
+@benchmark("schema_build")
+def schema_build(n: int):
+    data = [(schemas.schema(product_class(record)).build, record) for record in records(n)]
+
+    def run():
+        return [build(record) for build, record in data]
+    return run
+
+
+@benchmark("build_products")
+def build_products_bulk(n: int):
+    data = list(records(n))
+
+    def run():
+        return schemas.build_many(data)
+    return run
+
+
+@benchmark("add_product")
+def add_product(n: int):
+    products = _products(n)
+
+    def run():
+        category = Category("Бенчмарк", "Синтетическая категория")
+        for product in products:
+            category.add_product(product)
+    return run
+
+
+@benchmark("add_product_columnar")
+def add_product_columnar(n: int):
+    products = _products(n)
+
+    def run():
+        category = Category("Бенчмарк", "Синтетическая категория", columnar=True)
+        for product in products:
+            category.add_product(product)
+    return run
+
+
+@benchmark("products_render")
+def products_render(n: int):
+    category = _category(n)
+    return lambda: category.products
+
+
+@benchmark("category_str")
+def category_str(n: int):
+    category = _category(n)
+
+    def run():
+        for _ in range(1000):
+            str(category)
+    run.operations = 1000
+    return run
+
+
+@benchmark("middle_price")
+def middle_price(n: int):
+    category = _category(n)
+
+    def run():
+        for _ in range(1000):
+            category.middle_price()
+    run.operations = 1000
+    return run
+
+
+@benchmark("product_add")
+def product_add(n: int):
+    products = [Product("Товар", "Описание", 100.0 + i, 1 + i % 10) for i in range(n)]
+
+    def run():
+        total = 0
+        for first, second in zip(products[::2], products[1::2]):
+            total += first + second
+        return total
+    return run
+
+
+def measure(name: str, n: int, repeat: int = 3, memory: bool = True) -> dict:
+    factory = BENCHMARKS[name]
+    with product_log.quiet():
+        seconds = []
+        for _ in range(repeat):
+            run = factory(n)
+            started = time.perf_counter()
+            built = run()
+            seconds.append(time.perf_counter() - started)
+            del built
+        operations = getattr(run, "operations", n)
+        result = {"name": name, "size": n, "seconds": min(seconds), "per_second": operations / min(seconds)}
+        if memory:
+            run = factory(n)
+            tracemalloc.start()
+            try:
+                run()
+                result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return result
+
+
+def run_suite(sizes=DEFAULT_SIZES, names=None, repeat: int = 3, memory: bool = True, progress=None) -> dict:
+    results = {}
+    for n in sizes:
+        for name in names or BENCHMARKS:
+            result = measure(name, n, repeat, memory)
+            results[f"{name}@{n}"] = result
+            if progress:
+                progress(result)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.25) -> list:
+    """Список регрессий: замеры, ставшие медленнее или тяжелее базовых больше чем на tolerance."""
+    regressions = []
+    for key, result in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if metric in result and metric in base and result[metric] > base[metric] * (1 + tolerance):
+                regressions.append((key, metric, base[metric], result[metric]))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки горячих путей Product и Category")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="запустить только эти бенчмарки")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="не измерять пиковую память")
+    parser.add_argument("--output", type=Path, help="сохранить результаты в JSON")
+    parser.add_argument("--baseline", type=Path, help="сравнить с сохранёнными результатами")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    def progress(result):
+        peak = f"{result['peak_bytes'] / 2 ** 20:9.1f} MiB" if "peak_bytes" in result else ""
+        print(f"{result['name']:>22} {result['size']:>9} {result['seconds']:10.4f} s "
+              f"{result['per_second']:14.0f}/s {peak}")
+
+    current = run_suite(args.sizes, args.only, args.repeat, not args.no_memory, progress)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(current, baseline, args.tolerance)
+        for key, metric, base, value in regressions:
+            print(f"РЕГРЕССИЯ {key} {metric}: {base:.6g} -> {value:.6g}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+import heapq
+import threading
+from array import array
+from itertools import islice
+
+from src.indexes import KeyIndex, SortedIndex
+from src.main import Category, CategoryTotals
+
+
+class Catalog:
+    """Реестр категорий с общими индексами по названию и цене.
+
+    Каждый товар получает в каталоге сквозной номер. Индексы и итоги каталога
+    обновляются по уведомлениям категорий, поэтому запросы по всем категориям
+    не перебирают их товары.
+    """
+
+    def __init__(self, categories=()):
+        self._lock = threading.RLock()
+        self._categories = {}
+        self._ids = {}
+        self._refs = {}
+        self._next_id = 0
+        self._names = KeyIndex()
+        self._prices = SortedIndex()
+        self.totals = CategoryTotals(0, 0, 0, 0)
+        for category in categories:
+            self.add(category)
+
+    def __len__(self):
+        return len(self._categories)
+
+    def __iter__(self):
+        return iter(list(self._categories.values()))
+
+    def __contains__(self, category):
+        return id(category) in self._categories
+
+    def create(self, name: str, description: str, products: list = None, columnar: bool = False) -> Category:
+        return self.add(Category(name, description, products, columnar))
+
+    def add(self, category: Category) -> Category:
+        if not isinstance(category, Category):
+            raise TypeError("В каталог можно добавить только экземпляр Category")
+        with category._write_lock, self._lock:
+            if category in self:
+                raise ValueError(f"Категория {category.name!r} уже есть в каталоге")
+            category._retain()
+            self._categories[id(category)] = category
+            self._ids[id(category)] = array("Q")
+            self._register(category, range(category.totals.count))
+            category.subscribe(self._on_change)
+        return category
+
+    def remove(self, category: Category):
+        """Убирает категорию из каталога, индексов, итогов и счётчиков Category."""
+        with category._write_lock, self._lock:
+            if category not in self:
+                raise KeyError(f"Категории {category.name!r} нет в каталоге")
+            category.unsubscribe(self._on_change)
+            del self._categories[id(category)]
+            ids = self._ids.pop(id(category))
+            for product_id in ids:
+                _, row, _ = self._refs.pop(product_id)
+                self._names.discard(category._state(row).name, product_id)
+            self._prices.remove_rows(set(ids))
+            count, quantity, price_sum, stock_value = self.totals
+            removed = category.totals
+            self.totals = CategoryTotals(count - removed.count, quantity - removed.quantity,
+                                         price_sum - removed.price_sum, stock_value - removed.stock_value)
+            category._release()
+
+    def _on_change(self, category: Category, row: int, field, old, new):
+        with self._lock:
+            count, quantity, price_sum, stock_value = self.totals
+            if field is None:
+                self._register(category, (row,))
+                return
+            product_id = self._ids[id(category)][row]
+            if field == "name":
+                self._names.rekey(product_id, old, new)
+            elif field == "price":
+                self._prices.replace(old, new, product_id)
+                stock = category._state(row).quantity
+                price_sum += new - old
+                stock_value += (new - old) * stock
+            elif field == "quantity":
+                quantity += new - old
+                stock_value += category._state(row).price * (new - old)
+            self.totals = CategoryTotals(count, quantity, price_sum, stock_value)
+
+    def _register(self, category: Category, rows):
+        count, quantity, price_sum, stock_value = self.totals
+        ids = self._ids[id(category)]
+        prices = []
+        for row in rows:
+            state = category._state(row)
+            product_id = self._next_id
+            self._next_id += 1
+            ids.append(product_id)
+            self._refs[product_id] = (category, row, state.cls)
+            self._names.add(state.name, product_id)
+            prices.append((state.price, product_id))
+            count += 1
+            quantity += state.quantity
+            price_sum += state.price
+            stock_value += state.price * state.quantity
+        if len(prices) == 1:
+            self._prices.add(*prices[0])
+        else:
+            self._prices.extend(prices)
+        self.totals = CategoryTotals(count, quantity, price_sum, stock_value)
+
+    def product(self, product_id: int):
+        category, row, _ = self._refs[product_id]
+        return category.product_at(row)
+
+    def category_of(self, product_id: int) -> Category:
+        return self._refs[product_id][0]
+
+    def find(self, name: str) -> list:
+        """Все товары с таким названием во всех категориях, в порядке добавления в каталог."""
+        with self._lock:
+            return [self.product(product_id) for product_id in self._names.rows(name)]
+
+    def _ranked(self, ids, k: int, cls):
+        with self._lock:
+            if cls is not None:
+                ids = (product_id for product_id in ids if issubclass(self._refs[product_id][2], cls))
+            return [self.product(product_id) for product_id in islice(ids, max(k, 0))]
+
+    def cheapest(self, k: int = 1, cls: type = None) -> list:
+        """k самых дешёвых товаров каталога; cls ограничивает выборку классом товара."""
+        return self._ranked(self._prices.rows(), k, cls)
+
+    def most_expensive(self, k: int = 1, cls: type = None) -> list:
+        return self._ranked(self._prices.rows(reverse=True), k, cls)
+
+    def most_valuable(self, k: int = 1) -> list:
+        """k товаров с наибольшей стоимостью остатка среди лидеров каждой категории."""
+        candidates = [(product.price * product.quantity, product)
+                      for category in self for product in category.most_valuable(k)]
+        return [product for _, product in heapq.nlargest(k, candidates, key=lambda item: item[0])]
+
+    @property
+    def product_count(self) -> int:
+        return self.totals.count
+
+    @property
+    def stock_value(self) -> float:
+        return self.totals.stock_value
+
+    def middle_price(self):
+        count, _, price_sum, _ = self.totals
+        try:
+            return price_sum / count
+        except ZeroDivisionError:
+            return 0
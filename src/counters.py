@@ -0,0 +1,105 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class ShardedCounter:
+    """Счётчик с отдельной ячейкой для каждого потока.
+
+    Поток пишет только в свою ячейку, поэтому увеличение не требует
+    блокировки; при чтении ячейки суммируются.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._base = 0
+        self._lock = threading.Lock()
+
+    def _shard(self) -> list:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = [0]
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def add(self, amount: int = 1):
+        self._shard()[0] += amount
+
+    @property
+    def value(self) -> int:
+        return self._base + sum(shard[0] for shard in list(self._shards))
+
+    def set(self, value: int):
+        with self._lock:
+            self._base = value - sum(shard[0] for shard in self._shards)
+
+
+class CounterRegistry:
+    def __init__(self):
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str) -> ShardedCounter:
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(name, ShardedCounter())
+        return counter
+
+    def reset(self):
+        for counter in list(self._counters.values()):
+            counter.set(0)
+
+    def snapshot(self) -> dict:
+        return {name: counter.value for name, counter in list(self._counters.items())}
+
+
+default_registry = CounterRegistry()
+_current_registry = ContextVar("counter_registry", default=default_registry)
+
+
+def current_registry() -> CounterRegistry:
+    return _current_registry.get()
+
+
+@contextmanager
+def scoped_registry(registry: CounterRegistry = None):
+    """Подменяет реестр счётчиков в текущем контексте (тесты, отдельные арендаторы).
+
+    Новые потоки не наследуют контекст и пишут в реестр по умолчанию,
+    если не войдут в scoped_registry сами.
+    """
+    registry = registry if registry is not None else CounterRegistry()
+    token = _current_registry.set(registry)
+    try:
+        yield registry
+    finally:
+        _current_registry.reset(token)
+
+
+class ClassCounter:
+    """Счётчик реестра, доступный как атрибут класса (через метакласс)."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, owner, owner_type=None):
+        return current_registry().counter(self.name).value
+
+    def __set__(self, owner, value: int):
+        current_registry().counter(self.name).set(value)
+
+
+class InstanceCounter:
+    """Тот же счётчик при чтении через экземпляр: берётся реестр экземпляра."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        registry = current_registry() if instance is None else instance._registry
+        return registry.counter(self.name).value
@@ -0,0 +1,212 @@
+import csv
+import io
+import json
+import struct
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.storage import extra_fields
+
+FORMATS = ("csv", "jsonl", "columnar")
+BASE_COLUMNS = ("record", "category", "class", "name", "description", "price", "quantity")
+SUMMARY_COLUMNS = ("count", "stock_value", "middle_price", "summary")
+
+MAGIC = b"CATCOLS\0"
+VERSION = 1
+HEADER = struct.Struct("<8sHH4x")
+BLOCK = struct.Struct("<B7xQ")
+LENGTH = struct.Struct("<Q")
+CATEGORY, ROWS, SUMMARY, END = 1, 2, 3, 0
+
+
+class ExportError(Exception):
+    pass
+
+
+@dataclass
+class ExportStats:
+    categories: int = 0
+    rows: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def extra_columns(categories) -> tuple:
+    """Дополнительные поля классов товаров из категорий в порядке первого появления.
+
+    Заголовок зависит только от выгружаемых данных, а не от того, какие
+    подклассы Product успели объявить к моменту выгрузки.
+    """
+    columns = {}
+    for category in categories:
+        for cls in category._classes():
+            columns.update(dict.fromkeys(extra_fields(cls)))
+    return tuple(columns)
+
+
+def product_records(category):
+    """Строки товаров категории по одной, без сборки Category.products."""
+    for row in range(category.totals.count):
+        state = category._state(row)
+        record = {"record": "product", "category": category.name, "class": state.cls.__name__,
+                  "name": state.name, "description": state.description,
+                  "price": state.price, "quantity": state.quantity}
+        record.update(zip(extra_fields(state.cls), state.extras))
+        yield record
+
+
+def summary_record(category) -> dict:
+    count, quantity, _, stock_value = category.totals
+    return {"record": "summary", "category": category.name, "quantity": quantity, "count": count,
+            "stock_value": stock_value, "middle_price": category.middle_price(), "summary": str(category)}
+
+
+def export(categories, path, fmt: str = None, buffer_size: int = 1 << 16, group_size: int = 8192) -> ExportStats:
+    """Потоково выгружает категории в CSV, JSON Lines или колоночный бинарный файл.
+
+    Записи создаются генератором и сразу уходят в буферизованный файл,
+    поэтому расход памяти не зависит от размера категорий.
+    """
+    fmt = fmt or {".csv": "csv", ".jsonl": "jsonl"}.get(Path(path).suffix.lower(), "columnar")
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат выгрузки: {fmt}")
+    stats = ExportStats()
+    started = time.perf_counter()
+    if fmt == "columnar":
+        with open(path, "wb", buffering=buffer_size) as file:
+            _write_columnar(file, categories, stats, group_size)
+            stats.bytes = file.tell()
+    else:
+        with open(path, "w", encoding="utf-8", newline="", buffering=buffer_size) as file:
+            writer = _write_csv if fmt == "csv" else _write_jsonl
+            writer(file, categories, stats)
+            file.flush()
+            stats.bytes = file.buffer.tell()
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def _counted(categories, stats: ExportStats):
+    for category in categories:
+        stats.categories += 1
+        for record in product_records(category):
+            stats.rows += 1
+            yield record
+        yield summary_record(category)
+
+
+def _write_csv(file, categories, stats: ExportStats):
+    categories = list(categories)
+    columns = BASE_COLUMNS + extra_columns(categories) + SUMMARY_COLUMNS
+    writer = csv.DictWriter(file, columns)
+    writer.writeheader()
+    writer.writerows(_counted(categories, stats))
+
+
+def _write_jsonl(file, categories, stats: ExportStats):
+    dumps = json.JSONEncoder(ensure_ascii=False).encode
+    file.writelines(dumps(record) + "\n" for record in _counted(categories, stats))
+
+
+def _block(file, kind: int, payload: bytes):
+    file.write(BLOCK.pack(kind, len(payload)))
+    file.write(payload)
+
+
+def _strings(values) -> bytes:
+    offsets = array("Q", [0])
+    blob = bytearray()
+    for value in values:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+    return _sections(offsets.tobytes(), bytes(blob))
+
+
+def _sections(*parts) -> bytes:
+    return b"".join(LENGTH.pack(len(part)) + part for part in parts)
+
+
+def _json(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def _write_columnar(file, categories, stats: ExportStats, group_size: int):
+    """Файл: заголовок и блоки (тип, длина). Товары идут группами строк по колонкам."""
+    file.write(HEADER.pack(MAGIC, VERSION, 0))
+    for category in categories:
+        stats.categories += 1
+        _block(file, CATEGORY, _json({"name": category.name, "description": category.description}))
+        for start in range(0, category.totals.count, group_size):
+            states = [category._state(row) for row in range(start, min(start + group_size, category.totals.count))]
+            types = list(dict.fromkeys(state.cls for state in states))
+            codes = {cls: code for code, cls in enumerate(types)}
+            meta = {"rows": len(states), "types": [[cls.__name__, list(extra_fields(cls))] for cls in types]}
+            _block(file, ROWS, _sections(
+                _json(meta),
+                array("d", [state.price for state in states]).tobytes(),
+                array("q", [state.quantity for state in states]).tobytes(),
+                bytes(codes[state.cls] for state in states),
+            ) + _strings(state.name for state in states)
+              + _strings(state.description for state in states)
+              + _strings(json.dumps(state.extras, ensure_ascii=False) for state in states))
+            stats.rows += len(states)
+        _block(file, SUMMARY, _json(summary_record(category)))
+    _block(file, END, b"")
+
+
+def read_columnar(path):
+    """Читает колоночный файл выгрузки и отдаёт те же записи, что и JSON Lines."""
+    with open(path, "rb") as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size or HEADER.unpack(header)[0] != MAGIC:
+            raise ExportError("Файл не является колоночной выгрузкой каталога")
+        if HEADER.unpack(header)[1] != VERSION:
+            raise ExportError(f"Неподдерживаемая версия выгрузки: {HEADER.unpack(header)[1]}")
+        category = None
+        while True:
+            block = file.read(BLOCK.size)
+            if len(block) < BLOCK.size:
+                raise ExportError("Выгрузка оборвана")
+            kind, length = BLOCK.unpack(block)
+            payload = file.read(length)
+            if len(payload) < length:
+                raise ExportError("Выгрузка оборвана")
+            if kind == END:
+                return
+            if kind == CATEGORY:
+                category = json.loads(payload)["name"]
+            elif kind == SUMMARY:
+                yield json.loads(payload)
+            elif kind == ROWS:
+                yield from _read_rows(category, payload)
+            else:
+                raise ExportError(f"Неизвестный блок выгрузки: {kind}")
+
+
+def _read_rows(category: str, payload: bytes):
+    stream = io.BytesIO(payload)
+    parts = []
+    while stream.tell() < len(payload):
+        (length,) = LENGTH.unpack(stream.read(LENGTH.size))
+        parts.append(stream.read(length))
+    meta = json.loads(parts[0])
+    prices, quantities = array("d", parts[1]), array("q", parts[2])
+    codes = parts[3]
+    names, descriptions, extras = (_decode(parts[i], parts[i + 1]) for i in (4, 6, 8))
+    for row in range(meta["rows"]):
+        class_name, fields = meta["types"][codes[row]]
+        record = {"record": "product", "category": category, "class": class_name, "name": names[row],
+                  "description": descriptions[row], "price": prices[row], "quantity": quantities[row]}
+        record.update(zip(fields, json.loads(extras[row])))
+        yield record
+
+
+def _decode(offsets: bytes, blob: bytes) -> list:
+    offsets = array("Q", offsets)
+    return [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
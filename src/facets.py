@@ -0,0 +1,107 @@
+from array import array
+
+DEFAULT_FACETS = ("class", "memory", "color", "model", "country")
+
+
+def _bitmap(rows, start: int = 0) -> int:
+    """Битовая карта из возрастающих номеров строк не меньше start."""
+    if not rows:
+        return 0
+    bits = bytearray((rows[-1] - start) // 8 + 1)
+    for row in rows:
+        row -= start
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, "little") << start
+
+
+def iter_rows(bitmap: int):
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for position, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield (position << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+class Facet:
+    """Условие «поле = значение»; условия объединяются через & и |."""
+
+    def __init__(self, field: str, value):
+        self.field = field
+        self.value = value
+
+    def __and__(self, other):
+        return _Combined(int.__and__, self, other)
+
+    def __or__(self, other):
+        return _Combined(int.__or__, self, other)
+
+    def evaluate(self, index: "FacetIndex") -> int:
+        return index.bitmap(self.field, self.value)
+
+
+class _Combined(Facet):
+    def __init__(self, operator, left: Facet, right: Facet):
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+    def evaluate(self, index: "FacetIndex") -> int:
+        return self.operator(self.left.evaluate(index), self.right.evaluate(index))
+
+
+class FacetIndex:
+    """Списки строк по значениям фасетов с кэшем битовых карт для AND/OR."""
+
+    def __init__(self, fields=DEFAULT_FACETS):
+        self.fields = tuple(fields)
+        self._postings = {field: {} for field in self.fields}
+        self._bitmaps = {}
+
+    def add(self, row: int, attributes: dict):
+        for field in self.fields:
+            value = attributes.get(field)
+            if value is not None:
+                postings = self._postings[field]
+                rows = postings.get(value)
+                if rows is None:
+                    rows = postings[value] = array("I")
+                rows.append(row)
+
+    def bitmap(self, field: str, value) -> int:
+        try:
+            rows = self._postings[field].get(value)
+        except KeyError:
+            raise KeyError(f"Поле {field!r} не индексируется") from None
+        if rows is None:
+            return 0
+        key = (field, value)
+        bitmap, built = self._bitmaps.get(key, (0, 0))
+        if built < len(rows):
+            bitmap |= _bitmap(rows[built:], rows[built])
+            self._bitmaps[key] = bitmap, len(rows)
+        return bitmap
+
+    def select(self, expression: Facet = None, **facets) -> int:
+        """Битовая карта строк: expression И все условия facets.
+
+        Значение в facets может быть списком, тогда условия по нему объединяются через ИЛИ.
+        """
+        result = expression.evaluate(self) if expression is not None else None
+        for field, values in facets.items():
+            if not isinstance(values, (list, tuple, set, frozenset)):
+                values = (values,)
+            bitmap = 0
+            for value in values:
+                bitmap |= self.bitmap(field, value)
+            result = bitmap if result is None else result & bitmap
+        if result is None:
+            raise ValueError("Не задано ни одного условия фильтра")
+        return result
+
+    def counts(self, field: str, within: int = None) -> dict:
+        """Число строк для каждого значения поля, при within — только среди выбранных."""
+        if within is None:
+            return {value: len(rows) for value, rows in self._postings[field].items()}
+        return {value: count for value in self._postings[field]
+                if (count := (self.bitmap(field, value) & within).bit_count())}
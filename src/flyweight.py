@@ -0,0 +1,54 @@
+import threading
+
+
+class _Canonical(dict):
+    """Словарь «значение -> каноничный объект»; незнакомое значение регистрируется в пуле."""
+
+    def __init__(self, pool: "InternPool"):
+        super().__init__()
+        self.pool = pool
+
+    def __missing__(self, value):
+        return self.pool.values[self.pool.code(value)]
+
+
+class InternPool:
+    """Пул повторяющихся значений одного домена атрибутов.
+
+    Каждое значение хранится один раз и получает небольшой целочисленный код,
+    по которому колоночное хранилище держит ссылки на него.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.values = []
+        self._codes = {}
+        self._canonical = _Canonical(self)
+        self._lock = threading.Lock()
+        # Горячий путь конструкторов: для уже известного значения это один поиск в словаре
+        self.intern = self._canonical.__getitem__
+
+    def __len__(self):
+        return len(self.values)
+
+    def code(self, value) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(value)
+                if code is None:
+                    code = len(self.values)
+                    self.values.append(value)
+                    self._codes[value] = code
+                    self._canonical[value] = value
+        return code
+
+    def value(self, code: int):
+        return self.values[code]
+
+
+colors = InternPool("color")
+models = InternPool("model")
+memory_sizes = InternPool("memory")
+countries = InternPool("country")
+germination_periods = InternPool("germination_period")
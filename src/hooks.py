@@ -0,0 +1,65 @@
+from collections import namedtuple
+from contextlib import contextmanager
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+OFF = 100
+
+LogEvent = namedtuple("LogEvent", ["level", "kind", "message", "product", "field", "value"])
+
+
+def print_handler(event: LogEvent):
+    print(event.message)
+
+
+class ProductLog:
+    """Журнал создания товаров и ошибок валидации.
+
+    Флаги construction и validation пересчитываются при настройке, поэтому
+    при выключенном журнале горячий путь сводится к одной проверке атрибута.
+    Настройки глобальные для процесса.
+    """
+
+    def __init__(self, handler=print_handler, level: int = INFO):
+        self.handler = handler
+        self.level = level
+        self._update()
+
+    def _update(self):
+        self.construction = self.handler is not None and self.level <= INFO
+        self.validation = self.handler is not None and self.level <= WARNING
+
+    def configure(self, handler=None, level: int = None):
+        if handler is not None:
+            self.handler = handler
+        if level is not None:
+            self.level = level
+        self._update()
+
+    def emit(self, level: int, kind: str, message: str, product=None, field: str = None, value=None):
+        if self.handler is not None and level >= self.level:
+            self.handler(LogEvent(level, kind, message, product, field, value))
+
+    @contextmanager
+    def configured(self, handler=None, level: int = None):
+        saved = self.handler, self.level
+        self.configure(handler, level)
+        try:
+            yield self
+        finally:
+            self.handler, self.level = saved
+            self._update()
+
+    def quiet(self):
+        return self.configured(level=OFF)
+
+    @contextmanager
+    def collect(self, level: int = WARNING):
+        """Вместо печати складывает события в список."""
+        events = []
+        with self.configured(events.append, level):
+            yield events
+
+
+product_log = ProductLog()
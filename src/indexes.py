@@ -0,0 +1,102 @@
+from bisect import bisect_left, bisect_right, insort
+from heapq import merge
+
+
+class SortedIndex:
+    """Отсортированный список пар (ключ, строка) с поиском делением пополам."""
+
+    def __init__(self, items=()):
+        self._items = sorted(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, key, row: int):
+        insort(self._items, (key, row))
+
+    def remove(self, key, row: int):
+        position = bisect_left(self._items, (key, row))
+        if position == len(self._items) or self._items[position] != (key, row):
+            raise KeyError((key, row))
+        del self._items[position]
+
+    def extend(self, items):
+        """Добавляет много пар сразу: одна сортировка вместо вставки по одной."""
+        items = sorted(items)
+        if items:
+            self._items = list(merge(self._items, items)) if self._items else items
+
+    def remove_rows(self, rows):
+        """Удаляет все пары с номерами строк из rows за один проход."""
+        self._items = [item for item in self._items if item[1] not in rows]
+
+    def replace(self, old_key, new_key, row: int):
+        self.remove(old_key, row)
+        self.add(new_key, row)
+
+    def range(self, low=None, high=None):
+        """Строки с ключом в отрезке [low, high] по возрастанию ключа."""
+        start = 0 if low is None else bisect_left(self._items, (low,))
+        end = len(self._items) if high is None else bisect_right(self._items, (high, float("inf")))
+        return [row for _, row in self._items[start:end]]
+
+    def rows(self, reverse: bool = False):
+        """Все строки по возрастанию (или убыванию) ключа, лениво."""
+        items = reversed(self._items) if reverse else iter(self._items)
+        return (row for _, row in items)
+
+    def smallest(self, k: int):
+        return [row for _, row in self._items[:max(k, 0)]]
+
+    def largest(self, k: int):
+        if k <= 0:
+            return []
+        return [row for _, row in reversed(self._items[-k:])]
+
+
+class KeyIndex:
+    """Строки категории по значению ключа (например, названию); при повторах первой идёт более ранняя строка.
+
+    Строки без ключа (None) не индексируются.
+    """
+
+    def __init__(self, keys=()):
+        self._rows = {}
+        for row, key in enumerate(keys):
+            self.add(key, row)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def add(self, key, row: int):
+        if key is None:
+            return
+        rows = self._rows.get(key)
+        if rows is None:
+            self._rows[key] = [row]
+        else:
+            rows.append(row)
+
+    def discard(self, key, row: int):
+        rows = self._rows.get(key)
+        if rows is not None and row in rows:
+            rows.remove(row)
+            if not rows:
+                del self._rows[key]
+
+    def rekey(self, row: int, old, new):
+        self.discard(old, row)
+        if new is None:
+            return
+        rows = self._rows.setdefault(new, [])
+        rows.append(row)
+        rows.sort()
+
+    def get(self, key):
+        if key is None:
+            return None
+        rows = self._rows.get(key)
+        return rows[0] if rows else None
+
+    def rows(self, key) -> list:
+        return list(self._rows.get(key, ()))
@@ -0,0 +1,103 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+from src.loader import BatchStats, LoadReport, build_products
+from src.main import Category
+
+_END = object()
+
+
+@dataclass
+class IngestStats(LoadReport):
+    received: int = 0
+    queued: int = 0
+    running: bool = False
+
+
+async def _records(source):
+    if hasattr(source, "__aiter__"):
+        async for record in source:
+            yield record
+    else:
+        for record in source:
+            yield record
+
+
+class Ingestion:
+    """Асинхронное наполнение категории из асинхронного источника словарей товаров.
+
+    Источник читается в отдельной задаче в ограниченную очередь: когда очередь
+    заполнена, чтение ждёт. Товары создаются и добавляются пакетами, между
+    пакетами управление возвращается циклу событий. Пока идёт загрузка,
+    текущие цифры доступны в stats.
+    """
+
+    def __init__(self, category: Category, batch_size: int = 1000, queue_size: int = 10000,
+                 types: dict = None, merge: bool = False):
+        if batch_size <= 0 or queue_size <= 0:
+            raise ValueError("Размер пакета и очереди должен быть положительным")
+        self.category = category
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.types = types
+        self.merge = merge
+        self.stats = IngestStats()
+        self._error = None
+
+    async def run(self, source) -> IngestStats:
+        queue = asyncio.Queue(self.queue_size)
+        self.stats.running = True
+        producer = asyncio.create_task(self._produce(source, queue))
+        try:
+            await self._consume(queue)
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            self.stats.running = False
+            self.stats.queued = 0
+        if self._error is not None:
+            raise self._error
+        return self.stats
+
+    async def _produce(self, source, queue: asyncio.Queue):
+        try:
+            async for record in _records(source):
+                await queue.put(record)
+                self.stats.received += 1
+                self.stats.queued = queue.qsize()
+        except Exception as e:
+            # Ошибку источника поднимет run(), когда будет добавлено всё прочитанное
+            self._error = e
+        await queue.put(_END)
+
+    async def _consume(self, queue: asyncio.Queue):
+        done = False
+        while not done:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            if batch[-1] is _END:
+                batch.pop()
+                done = True
+            self.stats.queued = queue.qsize()
+            if batch:
+                self._flush(batch)
+            await asyncio.sleep(0)
+
+    def _flush(self, batch: list):
+        started = time.perf_counter()
+        products, failures = build_products(batch, self.types)
+        self.category.add_products(products, merge=self.merge)
+        stats = self.stats
+        stats.batches.append(BatchStats(len(stats.batches), len(products), len(failures),
+                                        time.perf_counter() - started))
+        stats.loaded += len(products)
+        stats.rejected += len(failures)
+        for failure in failures:
+            stats.reasons[failure.reason] += 1
+
+
+async def ingest(source, category: Category, batch_size: int = 1000, queue_size: int = 10000,
+                 types: dict = None, merge: bool = False) -> IngestStats:
+    return await Ingestion(category, batch_size, queue_size, types, merge).run(source)
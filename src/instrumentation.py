@@ -0,0 +1,225 @@
+import cProfile
+import functools
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from src.main import Category, Product
+from src.schema import SchemaRegistry, schemas
+
+BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+
+class Metric:
+    __slots__ = ("calls", "items", "seconds", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.items = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def observe(self, seconds: float, items: int = 1):
+        self.calls += 1
+        self.items += items
+        self.seconds += seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "items": self.items,
+            "seconds": self.seconds,
+            "items_per_second": self.items / self.seconds if self.seconds else 0.0,
+            "histogram": dict(zip([*map(str, BUCKETS), "+Inf"], self.buckets)),
+        }
+
+
+def _timed(metric: Metric, func, items=None, growth=None, returned=None):
+    """Обёртка с замером времени.
+
+    Число товаров — items(args), прирост growth(args) за вызов или returned(result)
+    по результату вызова; по умолчанию один.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        before = growth(args) if growth else 0
+        result = None
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            seconds = time.perf_counter() - started
+            if growth:
+                count = growth(args) - before
+            elif returned:
+                count = returned(result) if result is not None else 0
+            else:
+                count = items(args) if items else 1
+            metric.observe(seconds, count)
+    return wrapper
+
+
+def _product_total(args) -> int:
+    return args[0].totals.count
+
+
+def _built_count(result) -> int:
+    return len(result[0])
+
+
+def _product_classes():
+    classes = [Product]
+    for cls in classes:
+        classes.extend(cls.__subclasses__())
+    return classes
+
+
+class Instrumentation:
+    """Счётчики вызовов и гистограммы задержек для горячих точек входа.
+
+    Обёртки устанавливаются только на время enable(), поэтому в выключенном
+    состоянии код Product и Category работает без каких-либо добавок.
+    """
+
+    def __init__(self):
+        self.metrics = {}
+        self._patches = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._patches)
+
+    def metric(self, name: str) -> Metric:
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = Metric()
+        return metric
+
+    def _patch(self, owner, name: str, replacement):
+        self._patches.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, replacement)
+
+    def enable(self):
+        if self.enabled:
+            return
+        self._patch(Category, "add_product", _timed(self.metric("Category.add_product"), Category.add_product))
+        self._patch(Category, "add_products", _timed(self.metric("Category.add_products"), Category.add_products,
+                                                     growth=_product_total))
+        products = Category.__dict__["products"]
+        self._patch(Category, "products", property(_timed(self.metric("Category.products"), products.fget,
+                                                          items=_product_total)))
+        price = Product.__dict__["price"]
+        self._patch(Product, "price", price.setter(_timed(self.metric("Product.price.setter"), price.fset)))
+        for cls in _product_classes():
+            new_product = cls.__dict__.get("new_product")
+            if isinstance(new_product, classmethod):
+                metric = self.metric(f"{cls.__name__}.new_product")
+                self._patch(cls, "new_product", classmethod(_timed(metric, new_product.__func__)))
+        # Загрузчик создаёт товары собранными по схемам конструкторами, минуя new_product
+        self._patch(SchemaRegistry, "build_many", _timed(self.metric("SchemaRegistry.build_many"),
+                                                         SchemaRegistry.build_many, returned=_built_count))
+        for schema in list(schemas._schemas.values()):
+            metric = self.metric(f"{schema.cls.__name__}.build")
+            self._patch(schema, "build", _timed(metric, schema.build))
+
+    def disable(self):
+        while self._patches:
+            owner, name, original = self._patches.pop()
+            setattr(owner, name, original)
+
+    def reset(self):
+        self.metrics = {}
+        if self.enabled:
+            self.disable()
+            self.enable()
+
+    @contextmanager
+    def enabled_scope(self):
+        was_enabled = self.enabled
+        self.enable()
+        try:
+            yield self
+        finally:
+            if not was_enabled:
+                self.disable()
+
+    def snapshot(self) -> dict:
+        return {name: metric.as_dict() for name, metric in sorted(self.metrics.items())}
+
+    def prometheus(self, prefix: str = "catalog") -> str:
+        lines = [
+            f"# HELP {prefix}_calls_total Число вызовов точки входа.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        metrics = sorted(self.metrics.items())
+        lines += [f'{prefix}_calls_total{{entry="{name}"}} {metric.calls}' for name, metric in metrics]
+        lines += [
+            f"# HELP {prefix}_items_total Число обработанных товаров.",
+            f"# TYPE {prefix}_items_total counter",
+        ]
+        lines += [f'{prefix}_items_total{{entry="{name}"}} {metric.items}' for name, metric in metrics]
+        lines += [
+            f"# HELP {prefix}_latency_seconds Длительность вызова.",
+            f"# TYPE {prefix}_latency_seconds histogram",
+        ]
+        for name, metric in metrics:
+            cumulative = 0
+            for bound, count in zip([*map(repr, BUCKETS), "+Inf"], metric.buckets):
+                cumulative += count
+                lines.append(f'{prefix}_latency_seconds_bucket{{entry="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_latency_seconds_sum{{entry="{name}"}} {metric.seconds!r}')
+            lines.append(f'{prefix}_latency_seconds_count{{entry="{name}"}} {metric.calls}')
+        return "\n".join(lines) + "\n"
+
+
+instrumentation = Instrumentation()
+
+
+@dataclass
+class ProfileResult:
+    metrics: dict = field(default_factory=dict)
+    stats: pstats.Stats = None
+    peak_bytes: int = 0
+    top_allocations: list = field(default_factory=list)
+
+    def report(self, limit: int = 20) -> str:
+        if self.stats is None:
+            return ""
+        stream = io.StringIO()
+        self.stats.stream = stream
+        self.stats.sort_stats("cumulative").print_stats(limit)
+        return stream.getvalue()
+
+
+@contextmanager
+def profile_run(profile: bool = True, trace_memory: bool = True, top: int = 10):
+    """Включает метрики, cProfile и tracemalloc на время одного прогона импорта."""
+    result = ProfileResult()
+    profiler = cProfile.Profile() if profile else None
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    with instrumentation.enabled_scope():
+        if profiler:
+            profiler.enable()
+        try:
+            yield result
+        finally:
+            if profiler:
+                profiler.disable()
+                result.stats = pstats.Stats(profiler)
+            if trace_memory:
+                result.peak_bytes = tracemalloc.get_traced_memory()[1]
+                result.top_allocations = tracemalloc.take_snapshot().statistics("lineno")[:top]
+            if started_tracing:
+                tracemalloc.stop()
+            result.metrics = instrumentation.snapshot()
@@ -0,0 +1,212 @@
+import json
+import os
+import threading
+from bisect import bisect_right
+from collections import namedtuple
+from operator import attrgetter
+
+from src.main import Category, CategoryTotals
+from src.snapshot import _resolve_type, _type_name
+from src.storage import extra_fields
+from src.views import FrozenCategory, RowState
+
+Change = namedtuple("Change", ["seq", "kind", "row", "value"])
+Delta = namedtuple("Delta", ["since", "seq", "changes"])
+
+_seq = attrgetter("seq")
+
+
+def compact(changes) -> list:
+    """Сжимает изменения: последнее значение каждого поля строки, поля новых строк входят в их add.
+
+    Добавления остаются в порядке строк, поэтому результат можно передать в replay.
+    """
+    latest = {}
+    for change in changes:
+        if change.kind == "add":
+            latest[change.row, "add"] = change
+            continue
+        added = latest.get((change.row, "add"))
+        if added is not None:
+            value = added.value._replace(**{change.kind: change.value})
+            latest[change.row, "add"] = added._replace(seq=change.seq, value=value)
+        else:
+            latest[change.row, change.kind] = change
+    return list(latest.values())
+
+
+def _encode(change: Change) -> str:
+    value = change.value
+    if change.kind == "add":
+        value = [_type_name(value.cls), value.name, value.description, value.price, value.quantity,
+                 list(value.extras)]
+    return json.dumps([change.seq, change.kind, change.row, value], ensure_ascii=False)
+
+
+def _decode(line: str) -> Change:
+    seq, kind, row, value = json.loads(line)
+    if kind == "add":
+        cls, name, description, price, quantity, extras = value
+        value = RowState(_resolve_type(cls), name, description, price, quantity, tuple(extras))
+    return Change(seq, kind, row, value)
+
+
+def read_journal(path, since: int = 0) -> list:
+    """Изменения из файла журнала с номером больше since."""
+    with open(path, encoding="utf-8") as file:
+        changes = [_decode(line) for line in file if line.strip()]
+    return changes[bisect_right(changes, since, key=_seq):]
+
+
+class Journal:
+    """Журнал изменений категории: добавления и правки полей с возрастающими номерами.
+
+    Записи хранят новое значение, а не разницу, поэтому повторное применение
+    изменения, уже вошедшего в снимок, ничего не портит. Когда записей
+    становится больше compact_after, журнал сжимается: от каждого поля строки
+    остаётся последняя запись, и размер журнала ограничен размером категории,
+    а не числом правок. При path записи дописываются в файл построчно (JSON).
+    """
+
+    def __init__(self, category: Category, path=None, compact_after: int = 100_000):
+        if compact_after <= 0:
+            raise ValueError("Порог сжатия журнала должен быть положительным")
+        self.category = category
+        self.path = path
+        self.compact_after = compact_after
+        self._lock = threading.Lock()
+        self._changes = []
+        self._file = None
+        if path is not None:
+            if os.path.exists(path):
+                self._changes = read_journal(path)
+            self._file = open(path, "a", encoding="utf-8")
+        self.seq = self._changes[-1].seq if self._changes else 0
+        self._limit = max(compact_after, 2 * len(self._changes))
+        category.subscribe(self._record)
+
+    def __len__(self):
+        return len(self._changes)
+
+    def _record(self, category: Category, row: int, field, old, new):
+        if field is None:
+            change = Change(0, "add", row, category._state(row))
+        else:
+            change = Change(0, field, row, new)
+        with self._lock:
+            self.seq += 1
+            change = change._replace(seq=self.seq)
+            self._changes.append(change)
+            if self._file is not None:
+                self._file.write(_encode(change) + "\n")
+            if len(self._changes) >= self._limit:
+                self._compact()
+
+    def changes(self, since: int = 0) -> list:
+        """Записи журнала с номером больше since, без сжатия."""
+        if since < 0 or since > self.seq:
+            raise ValueError(f"Номер изменения должен быть от 0 до {self.seq}")
+        with self._lock:
+            return self._changes[bisect_right(self._changes, since, key=_seq):]
+
+    def delta(self, since: int = 0) -> Delta:
+        """Сжатые изменения после since: по одной записи на новую строку и на изменённое поле."""
+        with self._lock:
+            seq = self.seq
+        return Delta(since, seq, compact(self.changes(since)))
+
+    def compact(self):
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        changes = self._changes
+        latest = {}
+        for change in changes:
+            latest[change.row, change.kind] = change
+        # Добавление строки всегда раньше правок её полей, поэтому порядок по номеру годится для replay
+        self._changes = sorted(latest.values(), key=_seq)
+        self._limit = max(self.compact_after, 2 * len(self._changes))
+        if self._file is not None:
+            self._file.close()
+            temporary = f"{self.path}.tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                file.writelines(_encode(change) + "\n" for change in self._changes)
+            os.replace(temporary, self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+
+    def flush(self):
+        if self._file is not None:
+            with self._lock:
+                self._file.flush()
+
+    def close(self):
+        self.category.unsubscribe(self._record)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _contribution(state: RowState) -> tuple:
+    return state.quantity, state.price, state.price * state.quantity
+
+
+def _replay_frozen(frozen: FrozenCategory, changes) -> FrozenCategory:
+    rows = frozen._rows
+    count, quantity, price_sum, stock_value = frozen.totals
+    for change in changes:
+        if change.kind == "add" and change.row >= len(rows):
+            state = change.value
+            rows = rows.append(state)
+            count += 1
+        else:
+            old = rows[change.row]
+            state = change.value if change.kind == "add" else old._replace(**{change.kind: change.value})
+            rows = rows.set(change.row, state)
+            old_quantity, old_price, old_value = _contribution(old)
+            quantity -= old_quantity
+            price_sum -= old_price
+            stock_value -= old_value
+        new_quantity, new_price, new_value = _contribution(state)
+        quantity += new_quantity
+        price_sum += new_price
+        stock_value += new_value
+    return FrozenCategory(frozen.name, frozen.description, CategoryTotals(count, quantity, price_sum, stock_value),
+                          rows)
+
+
+def _replay_category(category: Category, changes) -> Category:
+    for change in changes:
+        if change.kind == "add":
+            state = change.value
+            if change.row >= category.totals.count:
+                extra = dict(zip(extra_fields(state.cls), state.extras))
+                product = state.cls._restore(state.name, state.description, state.price, state.quantity, **extra)
+                category.add_product(product)
+                continue
+            fields = {"name": state.name, "description": state.description,
+                      "price": state.price, "quantity": state.quantity}
+        else:
+            fields = {change.kind: change.value}
+        current = category._state(change.row)
+        for field, value in fields.items():
+            if getattr(current, field) == value:
+                continue
+            if field in ("price", "quantity"):
+                category._set(change.row, field, value)
+            else:
+                setattr(category.product_at(change.row), field, value)
+    return category
+
+
+def replay(snapshot, changes):
+    """Применяет изменения журнала к снимку.
+
+    FrozenCategory не меняется — возвращается новая версия; Category, например
+    загруженная через Category.load_snapshot, обновляется на месте.
+    """
+    if isinstance(snapshot, FrozenCategory):
+        return _replay_frozen(snapshot, changes)
+    if isinstance(snapshot, Category):
+        return _replay_category(snapshot, changes)
+    raise TypeError("Журнал можно применить только к FrozenCategory или Category")
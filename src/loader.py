@@ -0,0 +1,114 @@
+import csv
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.hooks import product_log
+from src.main import Category
+# ValidationFailure переехал в src.schema, но по-прежнему импортируется из src.loader
+from src.schema import RejectedRecord, ValidationFailure, schemas  # noqa: F401
+
+PRODUCT_TYPES = schemas.types
+
+
+@dataclass
+class BatchStats:
+    index: int
+    loaded: int
+    rejected: int
+    seconds: float
+
+    @property
+    def per_second(self) -> float:
+        return self.loaded / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class LoadReport:
+    loaded: int = 0
+    rejected: int = 0
+    reasons: Counter = field(default_factory=Counter)
+    batches: list = field(default_factory=list)
+
+    @property
+    def seconds(self) -> float:
+        return sum(batch.seconds for batch in self.batches)
+
+    @property
+    def per_second(self) -> float:
+        return self.loaded / self.seconds if self.seconds else 0.0
+
+
+def product_class(record: dict, types: dict = None):
+    """Класс товара для записи: по полю type или по набору полей."""
+    return schemas.resolve(record, types)
+
+
+def build_product(record: dict, types: dict = None):
+    return schemas.build(record, types)
+
+
+def build_products(records, types: dict = None) -> tuple:
+    """Создаёт товары без вывода в консоль и возвращает их вместе со списком ошибок."""
+    return schemas.build_many(records, types)
+
+
+def read_records(source, fmt: str = None):
+    """Построчно читает записи из JSON Lines или CSV файла."""
+    path = Path(source)
+    fmt = fmt or ("csv" if path.suffix.lower() == ".csv" else "jsonl")
+    with open(path, encoding="utf-8", newline="") as file:
+        if fmt == "csv":
+            for row in csv.DictReader(file):
+                yield {key: value for key, value in row.items() if value != ""}
+        elif fmt == "jsonl":
+            for line in file:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        yield None
+        else:
+            raise ValueError(f"Неизвестный формат файла: {fmt}")
+
+
+def load_records(records, category: Category, batch_size: int = 10000, quiet: bool = True,
+                 types: dict = None) -> LoadReport:
+    if batch_size <= 0:
+        raise ValueError("Размер пакета должен быть положительным")
+    if quiet:
+        with product_log.quiet():
+            return load_records(records, category, batch_size, quiet=False, types=types)
+    report = LoadReport()
+    batch = []
+    rejected = 0
+    started = time.perf_counter()
+    for record in records:
+        try:
+            batch.append(build_product(record, types))
+        except RejectedRecord as e:
+            rejected += 1
+            report.reasons[str(e)] += 1
+        if len(batch) + rejected >= batch_size:
+            _flush(report, category, batch, rejected, started)
+            batch = []
+            rejected = 0
+            started = time.perf_counter()
+    if batch or rejected:
+        _flush(report, category, batch, rejected, started)
+    return report
+
+
+def _flush(report: LoadReport, category: Category, batch: list, rejected: int, started: float):
+    category.add_products(batch)
+    report.batches.append(BatchStats(len(report.batches), len(batch), rejected, time.perf_counter() - started))
+    report.loaded += len(batch)
+    report.rejected += rejected
+
+
+def load_file(source, category: Category, batch_size: int = 10000, fmt: str = None,
+              types: dict = None) -> LoadReport:
+    return load_records(read_records(source, fmt), category, batch_size, types=types)
@@ -1,7 +1,26 @@
-class Product:
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from itertools import islice
+
+from src.counters import ClassCounter, InstanceCounter, ShardedCounter, current_registry
+from src.facets import Facet, FacetIndex, iter_rows
+from src.flyweight import colors, countries, germination_periods, memory_sizes, models
+from src.hooks import INFO, WARNING, product_log
+from src.indexes import KeyIndex, SortedIndex
+from src.movements import MovementReport, RejectedMovement
+from src.persistent import PersistentVector
+from src.search import SearchPage, TextIndex
+from src.snapshot import Snapshot, save as save_snapshot
+from src.storage import ColumnarProducts, ProductList, product_key
+from src.valuation import Valuation, valuate
+from src.views import FrozenCategory, ProductsView, RowState
 
 class BaseProduct(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, name: str, description: str, price: float, quantity: int):
         pass
@@ -30,21 +49,52 @@ class BaseProduct(ABC):
         pass
 
 class ProductMixin:
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
-        print(f"{self.__class__.__name__}({', '.join(map(str, args))})")
+        if product_log.construction:
+            product_log.emit(INFO, "construction", f"{self.__class__.__name__}({', '.join(map(str, args))})", self)
         super().__init__(*args, **kwargs)
 
 class Product(ProductMixin, BaseProduct):
+    _listeners = ()
+
     def __init__(self, name: str, description: str, price: float, quantity: int):
         if quantity == 0:
             raise ValueError("Товар с нулевым количеством не может быть добавлен")
-        self.name = name
-        self.description = description
+        self.__name = name
+        self.__description = description
         self.price = price
         self.__price = price
-        self.quantity = quantity
+        self.__quantity = quantity
         super().__init__(name, description, price, quantity)
 
+    @property
+    def name(self):
+        return self.__name
+
+    @name.setter
+    def name(self, value):
+        if self._listeners:
+            old = self.__name
+            self.__name = value
+            self._notify("name", old, value)
+        else:
+            self.__name = value
+
+    @property
+    def description(self):
+        return self.__description
+
+    @description.setter
+    def description(self, value):
+        if self._listeners:
+            old = self.__description
+            self.__description = value
+            self._notify("description", old, value)
+        else:
+            self.__description = value
+
     @property
     def price(self):
         return self.__price
@@ -52,12 +102,51 @@ class Product(ProductMixin, BaseProduct):
     @price.setter
     def price(self, value):
         if value > 0:
-            self.__price = value
-        else:
-            print("Цена не должна быть нулевой или отрицательной")
+            if self._listeners:
+                old = self.__price
+                self.__price = value
+                self._notify("price", old, value)
+            else:
+                self.__price = value
+        elif product_log.validation:
+            product_log.emit(WARNING, "validation", "Цена не должна быть нулевой или отрицательной",
+                             self, "price", value)
+
+    @property
+    def quantity(self):
+        return self.__quantity
+
+    @quantity.setter
+    def quantity(self, value):
+        if value >= 0:
+            if self._listeners:
+                old = self.__quantity
+                self.__quantity = value
+                self._notify("quantity", old, value)
+            else:
+                self.__quantity = value
+        elif product_log.validation:
+            product_log.emit(WARNING, "validation", "Количество не должно быть отрицательным",
+                             self, "quantity", value)
+
+    def subscribe(self, callback):
+        if not self._listeners:
+            self._listeners = []
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        self._listeners.remove(callback)
+
+    def _notify(self, field: str, old, new):
+        for callback in self._listeners:
+            callback(self, field, old, new)
 
     def __str__(self):
-        return f"{self.name}, {self.price} руб. Остаток: {self.quantity} шт."
+        return self._render(self.name, self.price, self.quantity)
+
+    @staticmethod
+    def _render(name: str, price: float, quantity: int) -> str:
+        return f"{name}, {price} руб. Остаток: {quantity} шт."
 
     def __add__(self, other):
         if isinstance(other, type(self)):
@@ -73,14 +162,27 @@ class Product(ProductMixin, BaseProduct):
             quantity=product_data["quantity"]
         )
 
+    @classmethod
+    def _restore(cls, name: str, description: str, price: float, quantity: int, **extra):
+        product = cls.__new__(cls)
+        product.__name = name
+        product.__description = description
+        product.__price = price
+        product.__quantity = quantity
+        for field, value in extra.items():
+            setattr(product, field, value)
+        return product
+
 class Smartphone(Product):
+    interned_fields = {"model": models, "memory": memory_sizes, "color": colors}
+
     def __init__(self, name: str, description: str, price: float, quantity: int,
                  efficiency: float, model: str, memory: int, color: str):
         super().__init__(name, description, price, quantity)
         self.efficiency = efficiency
-        self.model = model
-        self.memory = memory
-        self.color = color
+        self.model = models.intern(model)
+        self.memory = memory_sizes.intern(memory)
+        self.color = colors.intern(color)
 
     @classmethod
     def new_product(cls, product_data: dict):
@@ -96,12 +198,14 @@ class Smartphone(Product):
         )
 
 class LawnGrass(Product):
+    interned_fields = {"country": countries, "germination_period": germination_periods, "color": colors}
+
     def __init__(self, name: str, description: str, price: float, quantity: int,
                  country: str, germination_period: str, color: str):
         super().__init__(name, description, price, quantity)
-        self.country = country
-        self.germination_period = germination_period
-        self.color = color
+        self.country = countries.intern(country)
+        self.germination_period = germination_periods.intern(germination_period)
+        self.color = colors.intern(color)
 
     @classmethod
     def new_product(cls, product_data: dict):
@@ -115,99 +219,456 @@ class LawnGrass(Product):
             color=product_data["color"]
         )
 
-class Category:
-    category_count = 0
-    product_count = 0
+CategoryTotals = namedtuple("CategoryTotals", ["count", "quantity", "price_sum", "stock_value"])
 
-    def __init__(self, name: str, description: str, products: list):
-    def __init__(self, name: str, description: str, products: list = None):
-        self.name = name
-        self.description = description
-        self.products = products
-        self.__products = products if products is not None else []
-        Category.category_count += 1
-        Category.product_count += len(products)
 
-if __name__ == "__main__":
-    product1 = Product("Samsung Galaxy S23 Ultra", "256GB, Серый цвет, 200MP камера", 180000.0, 5)
-    product2 = Product("Iphone 15", "512GB, Gray space", 210000.0, 8)
-    product3 = Product("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14)
+def _key_fields(key) -> tuple:
+    fields = (key,) if isinstance(key, str) else tuple(key)
+    if not fields:
+        raise ValueError("Ключ слияния должен содержать хотя бы одно поле")
+    return fields
+
+
+class _RowWatcher:
+    """Подписка категории на товар строки row, не удерживающая категорию.
+
+    Когда категория собрана сборщиком мусора, подписка сама убирается из
+    списка слушателей товара.
+    """
+
+    __slots__ = ("category", "row", "product")
+
+    def __init__(self, category, row: int, product):
+        self.category = weakref.ref(category, self._drop)
+        self.row = row
+        self.product = weakref.ref(product)
+
+    def __call__(self, product, field: str, old, new):
+        category = self.category()
+        if category is not None:
+            category._on_product_change(self.row, product, field, old, new)
 
-    print(product1.name)
-    print(product1.description)
-    print(product1.price)
-    print(product1.quantity)
-
-    print(product2.name)
-    print(product2.description)
-    print(product2.price)
-    print(product2.quantity)
-
-    print(product3.name)
-    print(product3.description)
-    print(product3.price)
-    print(product3.quantity)
-
-    category1 = Category("Смартфоны",
-                         "Смартфоны, как средство не только коммуникации, но и получения дополнительных функций для удобства жизни",
-                         [product1, product2, product3])
-
-    print(category1.name == "Смартфоны")
-    print(category1.description)
-    print(len(category1.products))
-    print(category1.category_count)
-    print(category1.product_count)
-
-    product4 = Product("55\" QLED 4K", "Фоновая подсветка", 123000.0, 7)
-    category2 = Category("Телевизоры",
-                         "Современный телевизор, который позволяет наслаждаться просмотром, станет вашим другом и помощником",
-                         [product4])
-
-    print(category2.name)
-    print(category2.description)
-    print(len(category2.products))
-    print(category2.products)
-
-    print(Category.category_count)
-    print(Category.product_count)
-        Category.product_count += len(self.__products)
-
-    def add_product(self, product):
+    def _drop(self, _):
+        product = self.product()
+        if product is not None and self in product._listeners:
+            # Новый список, а не remove: _notify может сейчас обходить старый
+            product._listeners = [callback for callback in product._listeners if callback is not self]
+
+
+class _CategoryMeta(type):
+    category_count = ClassCounter("category_count")
+    product_count = ClassCounter("product_count")
+
+
+class Category(metaclass=_CategoryMeta):
+    category_count = InstanceCounter("category_count")
+    product_count = InstanceCounter("product_count")
+
+    def __init__(self, name: str, description: str, products: list = None, columnar: bool = False):
+        self.name = name
+        self.description = description
+        self._registry = current_registry()
+        self._product_counter = self._registry.counter("product_count")
+        self.__products = ColumnarProducts() if columnar else ProductList()
+        self.__products.on_build = self._watch
+        self.totals = CategoryTotals(0, 0, 0, 0)
+        self._lines = {}
+        self._price_index = None
+        self._value_index = None
+        self._facets = None
+        self._text_index = None
+        self._key_indexes = {}
+        self._write_lock = threading.Lock()
+        self._frozen = None
+        self._observers = []
+        self._released = False
+        for product in products if products is not None else []:
+            self._store(product)
+        self._registry.counter("category_count").add(1)
+        self._product_counter.add(len(self.__products))
+
+    def add_product(self, product, merge: bool = False, key="name"):
+        """Добавляет товар; при merge=True дубликат по ключу key сливается с уже имеющимся товаром.
+
+        Ключ — имя поля или кортеж имён. При слиянии остатки складываются,
+        а цена остаётся большей из двух.
+        """
         if isinstance(product, Product):
-            self.__products.append(product)
-            Category.product_count += 1
+            with self._write_lock:
+                added = self._merge_product(product, _key_fields(key)) if merge else self._store(product)
+            self._product_counter.add(added)
         else:
             raise TypeError("Добавляемый объект должен быть экземпляром класса Product или его наследника")
 
+    def add_products(self, products, merge: bool = False, key="name"):
+        products = list(products)
+        for product in products:
+            if not isinstance(product, Product):
+                raise TypeError("Добавляемый объект должен быть экземпляром класса Product или его наследника")
+            self.__products.check(product)
+        added = 0
+        with self._write_lock:
+            if merge:
+                fields = _key_fields(key)
+                for product in products:
+                    added += self._merge_product(product, fields)
+            else:
+                for product in products:
+                    added += self._store(product)
+        self._product_counter.add(added)
+
+    @classmethod
+    def _from_storage(cls, name: str, description: str, storage: ColumnarProducts, totals: tuple):
+        category = cls(name, description, columnar=True)
+        category._merge_storage(storage, CategoryTotals(*totals))
+        return category
+
+    def _columnar_storage(self) -> ColumnarProducts:
+        return self.__products if self.columnar else ColumnarProducts(self.__products)
+
+    @staticmethod
+    def save_snapshot(path, categories):
+        save_snapshot(path, categories)
+
+    @classmethod
+    def load_snapshot(cls, path, verify: bool = True) -> Snapshot:
+        return Snapshot(path, cls, verify)
+
+    def merge(self, other: "Category"):
+        """Переносит товары другой категории в конец этой категории."""
+        if other is self:
+            raise ValueError("Категорию нельзя слить саму с собой")
+        with self._write_lock:
+            self._merge_storage(other.__products, other.totals)
+
+    def _merge_storage(self, storage, totals: CategoryTotals):
+        start = len(self.__products)
+        if self.columnar and isinstance(storage, ColumnarProducts):
+            self.__products.extend_columns(storage)
+            count, quantity, price_sum, stock_value = self.totals
+            self.totals = CategoryTotals(count + totals.count, quantity + totals.quantity,
+                                         price_sum + totals.price_sum, stock_value + totals.stock_value)
+            products = self.__products
+            added = range(start, len(products))
+            if self._price_index is not None:
+                prices, quantities = products._prices, products._quantities
+                self._price_index.extend((prices[row], row) for row in added)
+                self._value_index.extend((prices[row] * quantities[row], row) for row in added)
+            if self._facets is not None:
+                for row in added:
+                    self._facets.add(row, products.attributes(row))
+            if self._text_index is not None:
+                for row in added:
+                    self._text_index.add(row, products.texts(row))
+            for fields, index in self._key_indexes.items():
+                for row in added:
+                    index.add(products.key(row, fields), row)
+            if self._frozen is not None:
+                rows = self._frozen._rows
+                for row in added:
+                    rows = rows.append(self._state(row))
+                self._publish(rows)
+            if self._observers:
+                for row in added:
+                    self._emit(row, None, None, None)
+        else:
+            for product in storage:
+                self._store(product)
+        self._product_counter.add(len(self.__products) - start)
+
+    def _store(self, product):
+        row = len(self.__products)
+        self.__products.append(product)
+        self._watch(product, row)
+        if self._price_index is not None:
+            self._price_index.add(product.price, row)
+            self._value_index.add(product.price * product.quantity, row)
+        if self._facets is not None:
+            self._facets.add(row, self.__products.attributes(row))
+        if self._text_index is not None:
+            self._text_index.add(row, self.__products.texts(row))
+        for fields, index in self._key_indexes.items():
+            index.add(product_key(product, fields), row)
+        count, quantity, price_sum, stock_value = self.totals
+        self.totals = CategoryTotals(count + 1, quantity + product.quantity, price_sum + product.price,
+                                     stock_value + product.price * product.quantity)
+        if self._frozen is not None:
+            self._publish(self._frozen._rows.append(self._state(row)))
+        self._emit(row, None, None, None)
+        return 1
+
+    def _merge_product(self, product, fields: tuple) -> int:
+        """Сливает товар с дубликатом по ключу; возвращает 1, если товар добавлен как новый."""
+        key = product_key(product, fields)
+        row = None if key is None else self._key_index(fields).get(key)
+        if row is None:
+            return self._store(product)
+        self._adjust(row, product.quantity)
+        self._raise_price(row, product.price)
+        return 0
+
+    def _raise_price(self, row: int, price: float):
+        """Поднимает цену строки до price, если сейчас она ниже."""
+        if price > self.__products.price(row):
+            self._set(row, "price", price)
+
+    def _set(self, row: int, field: str, value):
+        """Меняет цену или остаток строки через товар, а если он не создан — прямо в хранилище."""
+        products = self.__products
+        product = products.cached(row)
+        if product is not None:
+            setattr(product, field, value)
+        else:
+            old = products.price(row) if field == "price" else products.quantity(row)
+            self._on_product_change(row, None, field, old, value)
+
+    def _watch(self, product, row: int):
+        product.subscribe(_RowWatcher(self, row, product))
+
+    def _on_product_change(self, row: int, product, field: str, old, new):
+        products = self.__products
+        stored = products.update(row, field, new)
+        if stored is not None:
+            # Уведомивший объект мог хранить устаревшее значение, итоги считаем от хранилища
+            old = stored
+        self._lines.pop(row, None)
+        count, quantity, price_sum, stock_value = self.totals
+        if field == "price":
+            stock = products.quantity(row)
+            price_sum += new - old
+            stock_value += (new - old) * stock
+            if self._price_index is not None:
+                self._price_index.replace(old, new, row)
+                self._value_index.replace(old * stock, new * stock, row)
+        elif field == "quantity":
+            price = products.price(row)
+            quantity += new - old
+            stock_value += price * (new - old)
+            if self._value_index is not None:
+                self._value_index.replace(price * old, price * new, row)
+        elif self._text_index is not None:
+            self._text_index.update(row, field, old, new)
+        self.totals = CategoryTotals(count, quantity, price_sum, stock_value)
+        for fields, index in self._key_indexes.items():
+            if field in fields:
+                key = products.key(row, fields)
+                if key is None:
+                    continue
+                old_key = old if len(fields) == 1 else tuple(old if name == field else value
+                                                             for name, value in zip(fields, key))
+                index.rekey(row, old_key, key)
+        if self._frozen is not None:
+            rows = self._frozen._rows
+            self._publish(rows.set(row, rows[row]._replace(**{field: new})))
+        self._emit(row, field, old, new)
+
+    def subscribe(self, callback):
+        """Подписка на изменения категории: callback(category, row, field, old, new).
+
+        При добавлении строки field, old и new равны None.
+        """
+        self._observers.append(callback)
+
+    def unsubscribe(self, callback):
+        self._observers.remove(callback)
+
+    def _emit(self, row: int, field, old, new):
+        for callback in self._observers:
+            callback(self, row, field, old, new)
+
+    def _release(self):
+        """Убирает категорию и её товары из счётчиков реестра (удаление из каталога)."""
+        if not self._released:
+            self._released = True
+            self._registry.counter("category_count").add(-1)
+            self._product_counter.add(-self.totals.count)
+            # Пока категория вне каталога, её добавления не попадают в общий счётчик
+            self._product_counter = ShardedCounter()
+
+    def _retain(self):
+        if self._released:
+            self._released = False
+            self._registry.counter("category_count").add(1)
+            self._product_counter = self._registry.counter("product_count")
+            self._product_counter.add(self.totals.count)
+
+    def _state(self, row: int) -> RowState:
+        return RowState(*self.__products.state(row))
+
+    def snapshot(self) -> FrozenCategory:
+        """Неизменяемый срез категории на текущий момент за O(1).
+
+        Первый вызов строит постоянный вектор строк, дальше каждая запись
+        публикует новую версию с общими неизменёнными узлами. Читатели срезов
+        не берут блокировок и всегда видят итоги, согласованные со строками.
+        """
+        frozen = self._frozen
+        if frozen is None:
+            with self._write_lock:
+                if self._frozen is None:
+                    self._publish(PersistentVector(map(self._state, range(len(self.__products)))))
+                frozen = self._frozen
+        return frozen
+
+    def _publish(self, rows: PersistentVector):
+        self._frozen = FrozenCategory(self.name, self.description, self.totals, rows)
+
+    def find(self, name: str):
+        """Товар по точному названию за O(1); при повторах названия — добавленный раньше."""
+        row = self._key_index(("name",)).get(name)
+        return None if row is None else self.__products[row]
+
+    def _key_index(self, fields: tuple) -> KeyIndex:
+        index = self._key_indexes.get(fields)
+        if index is None:
+            products = self.__products
+            if fields == ("name",):
+                keys = products.names()
+            else:
+                keys = (products.key(row, fields) for row in range(len(products)))
+            index = self._key_indexes[fields] = KeyIndex(keys)
+        return index
+
+    def apply_movements(self, movements) -> MovementReport:
+        """Применяет пачку движений остатков (название товара, изменение количества).
+
+        Движения применяются по порядку, каждое целиком или никак: неизвестный
+        товар, нецелое изменение или уход остатка в минус отклоняют только
+        это движение. Записи в категорию сериализуются блокировкой, а итоги
+        заменяются целиком, поэтому читатели без блокировки видят согласованные
+        итоги на каждом шаге пачки.
+        """
+        started = time.perf_counter()
+        report = MovementReport()
+        with self._write_lock:
+            names = self._key_index(("name",))
+            for index, (name, delta) in enumerate(movements):
+                row = names.get(name)
+                if row is None:
+                    reason = "товар не найден"
+                elif not isinstance(delta, int) or isinstance(delta, bool):
+                    reason = "изменение остатка должно быть целым числом"
+                elif not self._adjust(row, delta):
+                    reason = "остаток не может стать отрицательным"
+                else:
+                    report.applied += 1
+                    continue
+                report.rejected.append(RejectedMovement(index, name, delta, reason))
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def _adjust(self, row: int, delta: int) -> bool:
+        """Меняет остаток строки на delta, если он не станет отрицательным."""
+        quantity = self.__products.quantity(row) + delta
+        if quantity < 0:
+            return False
+        self._set(row, "quantity", quantity)
+        return True
+
+    def _build_indexes(self):
+        if self._price_index is None:
+            products = self.__products
+            self._price_index = SortedIndex((price, row) for row, price in enumerate(products.prices()))
+            self._value_index = SortedIndex(
+                (price * quantity, row)
+                for row, (price, quantity) in enumerate(zip(products.prices(), products.quantities())))
+
+    def _columns(self):
+        return self.__products.columns()
+
+    def _classes(self) -> list:
+        return self.__products.classes()
+
+    def valuation(self, bins: int = 10, strict: bool = False) -> Valuation:
+        return valuate([self], bins=bins, strict=strict)
+
+    @property
+    def facets(self) -> FacetIndex:
+        if self._facets is None:
+            facets = FacetIndex()
+            for row in range(len(self.__products)):
+                facets.add(row, self.__products.attributes(row))
+            self._facets = facets
+        return self._facets
+
+    def filter(self, expression: Facet = None, limit: int = None, **facets) -> list:
+        """Товары, подходящие под фасеты, например filter(color="Серый", memory=[256, 512])."""
+        rows = islice(iter_rows(self.facets.select(expression, **facets)), limit)
+        return [self.__products[row] for row in rows]
+
+    def facet_counts(self, field: str, expression: Facet = None, **facets) -> dict:
+        within = self.facets.select(expression, **facets) if expression is not None or facets else None
+        return self.facets.counts(field, within)
+
+    def search(self, query: str, cursor: int = 0, size: int = 20, partial: bool = False) -> SearchPage:
+        """Полнотекстовый поиск по названию и описанию; hits — пары (товар, релевантность)."""
+        if self._text_index is None:
+            index = TextIndex()
+            for row in range(len(self.__products)):
+                index.add(row, self.__products.texts(row))
+            self._text_index = index
+        page = self._text_index.search(query, cursor, size, partial)
+        return page._replace(hits=[(self.__products[row], score) for row, score in page.hits])
+
+    def product_at(self, row: int):
+        return self.__products[row]
+
+    def price_range(self, low: float = None, high: float = None) -> list:
+        self._build_indexes()
+        return [self.__products[row] for row in self._price_index.range(low, high)]
+
+    def cheapest(self, n: int) -> list:
+        self._build_indexes()
+        return [self.__products[row] for row in self._price_index.smallest(n)]
+
+    def most_valuable(self, n: int) -> list:
+        self._build_indexes()
+        return [self.__products[row] for row in self._value_index.largest(n)]
+
+    @property
+    def columnar(self) -> bool:
+        return isinstance(self.__products, ColumnarProducts)
+
     @property
     def products(self):
-        return "\n".join(str(product) for product in self.__products)
+        return "\n".join(self.__products.lines())
+
+    @property
+    def products_view(self) -> ProductsView:
+        return ProductsView(self)
+
+    def _line(self, row: int) -> str:
+        line = self._lines.get(row)
+        if line is None:
+            line = self._lines[row] = self.__products.line(row)
+        return line
 
     def __str__(self):
-        total_quantity = sum(product.quantity for product in self.__products)
-        return f"{self.name}, количество продуктов: {total_quantity} шт."
+        return f"{self.name}, количество продуктов: {self.totals.quantity} шт."
 
     def middle_price(self):
+        count, _, price_sum, _ = self.totals
         try:
-            return sum(product.price for product in self.__products) / len(self.__products)
+            return price_sum / count
         except ZeroDivisionError:
             return 0
 
-    if __name__ == "__main__":
-        try:
-            product_invalid = Product("Бракованный товар", "Неверное количество", 1000.0, 0)
-        except ValueError as e:
-            print(
-                "Возникла ошибка ValueError прерывающая работу программы при попытке добавить продукт с нулевым количеством")
-        else:
-            print("Не возникла ошибка ValueError при попытке добавить продукт с нулевым количеством")
-        product1 = Product("Samsung Galaxy S23 Ultra", "256GB, Серый цвет, 200MP камера", 180000.0, 5)
-        product2 = Product("Iphone 15", "512GB, Gray space", 210000.0, 8)
-        product3 = Product("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14)
 
-        category1 = Category("Смартфоны", "Категория смартфонов", [product1, product2, product3])
+if __name__ == "__main__":
+    try:
+        product_invalid = Product("Бракованный товар", "Неверное количество", 1000.0, 0)
+    except ValueError as e:
+        print(
+            "Возникла ошибка ValueError прерывающая работу программы при попытке добавить продукт с нулевым количеством")
+    else:
+        print("Не возникла ошибка ValueError при попытке добавить продукт с нулевым количеством")
+    product1 = Product("Samsung Galaxy S23 Ultra", "256GB, Серый цвет, 200MP камера", 180000.0, 5)
+    product2 = Product("Iphone 15", "512GB, Gray space", 210000.0, 8)
+    product3 = Product("Xiaomi Redmi Note 11", "1024GB, Синий", 31000.0, 14)
+
+    category1 = Category("Смартфоны", "Категория смартфонов", [product1, product2, product3])
 
-        print(category1.middle_price())
+    print(category1.middle_price())
 
-        category_empty = Category("Пустая категория", "Категория без продуктов", [])
-        print(category_empty.middle_price())
+    category_empty = Category("Пустая категория", "Категория без продуктов", [])
+    print(category_empty.middle_price())
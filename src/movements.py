@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class RejectedMovement:
+    index: int
+    name: str
+    delta: object
+    reason: str
+
+
+@dataclass
+class MovementReport:
+    applied: int = 0
+    rejected: list = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        return (self.applied + len(self.rejected)) / self.seconds if self.seconds else 0.0
@@ -0,0 +1,59 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from src.loader import BatchStats, LoadReport, load_records
+from src.main import Category
+
+
+def _chunks(records, size: int):
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _build_chunk(records: list):
+    """Выполняется в процессе-обработчике: собирает частичную категорию."""
+    started = time.perf_counter()
+    category = Category("partial", "", columnar=True)
+    report = load_records(records, category, batch_size=len(records))
+    seconds = time.perf_counter() - started
+    return category._Category__products, category.totals, report.rejected, dict(report.reasons), seconds
+
+
+def build_category_parallel(records, name: str, description: str, workers: int = None,
+                            chunk_size: int = 100000) -> tuple:
+    """Строит колоночную категорию из словарей в пуле процессов.
+
+    Записи режутся на порции, каждая порция превращается в частичную категорию
+    в отдельном процессе и возвращается в виде колонок. Порции сливаются строго
+    в порядке входных данных, поэтому результат не зависит от числа процессов.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Размер порции должен быть положительным")
+    workers = workers or os.cpu_count() or 1
+    category = Category(name, description, columnar=True)
+    report = LoadReport()
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in _chunks(records, chunk_size):
+            pending.append(executor.submit(_build_chunk, chunk))
+            if len(pending) >= workers * 2:
+                _merge_result(category, report, pending.popleft().result())
+        while pending:
+            _merge_result(category, report, pending.popleft().result())
+    return category, report
+
+
+def _merge_result(category: Category, report: LoadReport, result: tuple):
+    storage, totals, rejected, reasons, seconds = result
+    category._merge_storage(storage, totals)
+    report.batches.append(BatchStats(len(report.batches), totals.count, rejected, seconds))
+    report.loaded += totals.count
+    report.rejected += rejected
+    report.reasons.update(reasons)
@@ -0,0 +1,106 @@
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+
+def _new_path(level: int, node: tuple) -> tuple:
+    while level:
+        node = (node,)
+        level -= BITS
+    return node
+
+
+def _push_tail(count: int, level: int, parent: tuple, tail: tuple) -> tuple:
+    index = ((count - 1) >> level) & MASK
+    if level == BITS:
+        child = tail
+    elif index < len(parent):
+        child = _push_tail(count, level - BITS, parent[index], tail)
+    else:
+        child = _new_path(level - BITS, tail)
+    return parent[:index] + (child,) + parent[index + 1:]
+
+
+def _assoc(node: tuple, level: int, index: int, value) -> tuple:
+    position = (index >> level) & MASK
+    child = value if level == 0 else _assoc(node[position], level - BITS, index, value)
+    return node[:position] + (child,) + node[position + 1:]
+
+
+class PersistentVector:
+    """Неизменяемый вектор: префиксное дерево с ветвлением 32 и отдельным хвостом.
+
+    append и set возвращают новый вектор, копируя только путь от корня до
+    изменённого листа (не больше log32(n) узлов по 32 ссылки), а остальные
+    узлы остаются общими со старой версией.
+    """
+
+    __slots__ = ("_count", "_shift", "_root", "_tail")
+
+    def __init__(self, items=()):
+        items = list(items)
+        self._count = len(items)
+        tail_offset = self._tail_offset()
+        self._tail = tuple(items[tail_offset:])
+        nodes = [tuple(items[i:i + WIDTH]) for i in range(0, tail_offset, WIDTH)]
+        self._shift = BITS
+        while len(nodes) > WIDTH:
+            nodes = [tuple(nodes[i:i + WIDTH]) for i in range(0, len(nodes), WIDTH)]
+            self._shift += BITS
+        self._root = tuple(nodes)
+
+    @classmethod
+    def _make(cls, count: int, shift: int, root: tuple, tail: tuple) -> "PersistentVector":
+        vector = cls.__new__(cls)
+        vector._count = count
+        vector._shift = shift
+        vector._root = root
+        vector._tail = tail
+        return vector
+
+    def _tail_offset(self) -> int:
+        return ((self._count - 1) >> BITS) << BITS if self._count else 0
+
+    def __len__(self):
+        return self._count
+
+    def _leaf(self, index: int) -> tuple:
+        if index >= self._tail_offset():
+            return self._tail
+        node = self._root
+        for level in range(self._shift, 0, -BITS):
+            node = node[(index >> level) & MASK]
+        return node
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Индекс вне диапазона")
+        return self._leaf(index)[index & MASK]
+
+    def __iter__(self):
+        for start in range(0, self._count, WIDTH):
+            yield from self._leaf(start)
+
+    def append(self, value) -> "PersistentVector":
+        count = self._count
+        if count - self._tail_offset() < WIDTH:
+            return self._make(count + 1, self._shift, self._root, self._tail + (value,))
+        shift = self._shift
+        if (count >> BITS) > (1 << shift):
+            root = (self._root, _new_path(shift, self._tail))
+            shift += BITS
+        else:
+            root = _push_tail(count, shift, self._root, self._tail)
+        return self._make(count + 1, shift, root, (value,))
+
+    def set(self, index: int, value) -> "PersistentVector":
+        if not 0 <= index < self._count:
+            raise IndexError("Индекс вне диапазона")
+        tail_offset = self._tail_offset()
+        if index >= tail_offset:
+            position = index - tail_offset
+            tail = self._tail[:position] + (value,) + self._tail[position + 1:]
+            return self._make(self._count, self._shift, self._root, tail)
+        return self._make(self._count, self._shift, _assoc(self._root, self._shift, index, value), self._tail)
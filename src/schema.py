@@ -0,0 +1,240 @@
+import inspect
+import types as pytypes
+from collections import namedtuple
+from dataclasses import dataclass
+
+from src.hooks import INFO, product_log
+from src.main import LawnGrass, Product, Smartphone
+from src.slotted import SlottedLawnGrass, SlottedProduct, SlottedSmartphone
+from src.storage import BASE_FIELDS, extra_fields
+
+Field = namedtuple("Field", ["name", "type", "pool"])
+
+
+@dataclass
+class ValidationFailure:
+    index: int
+    name: str
+    reason: str
+
+
+class RejectedRecord(Exception):
+    pass
+
+
+def declared_fields(cls) -> tuple:
+    """Поля конструктора класса: имя, числовой тип для приведения строк и пул интернирования."""
+    parameters = inspect.signature(cls.__init__).parameters
+    pools = getattr(cls, "interned_fields", {})
+    fields = []
+    for name in BASE_FIELDS + extra_fields(cls):
+        annotation = parameters[name].annotation if name in parameters else None
+        fields.append(Field(name, annotation if annotation in (int, float) else None, pools.get(name)))
+    return tuple(fields)
+
+
+def _convert(record: dict, fields: tuple) -> dict:
+    converted = record
+    for field in fields:
+        value = record.get(field.name)
+        if field.type is not None and isinstance(value, str):
+            if converted is record:
+                converted = dict(record)
+            try:
+                converted[field.name] = field.type(value)
+            except ValueError:
+                raise RejectedRecord(f"некорректное значение поля {field.name}")
+    return converted
+
+
+def _validate(record: dict):
+    try:
+        if record["price"] <= 0:
+            raise RejectedRecord("цена нулевая или отрицательная")
+        if record["quantity"] == 0:
+            raise RejectedRecord("нулевое количество")
+    except KeyError as e:
+        raise RejectedRecord(f"нет поля {e.args[0]}")
+    except TypeError:
+        raise RejectedRecord("некорректная цена или количество")
+
+
+def _generic_builder(cls, fields: tuple):
+    """Медленный путь для классов с собственной логикой в __init__: проверки и cls.new_product.
+
+    Если класс добавил поля, но унаследовал new_product, тот о них не знает,
+    поэтому товар создаётся вызовом cls со всеми полями схемы.
+    """
+    names = [field.name for field in fields]
+    if "new_product" in vars(cls) or len(names) == len(BASE_FIELDS):
+        create = cls.new_product
+    else:
+        def create(record):
+            return cls(**{name: record[name] for name in names})
+
+    def build(record):
+        if not isinstance(record, dict):
+            raise RejectedRecord("некорректная запись")
+        record = _convert(record, fields)
+        _validate(record)
+        try:
+            return create(record)
+        except KeyError as e:
+            raise RejectedRecord(f"нет поля {e.args[0]}")
+        except (TypeError, ValueError) as e:
+            raise RejectedRecord(str(e))
+    return build
+
+
+def _compiled_builder(cls, fields: tuple):
+    """Собирает функцию, которая создаёт товар класса cls из словаря без цепочки __init__.
+
+    Порядок проверок и тексты ошибок те же, что у _generic_builder.
+    """
+    namespace = {"cls": cls, "new": cls.__new__, "RejectedRecord": RejectedRecord, "log": product_log,
+                 "INFO": INFO, "convert": _convert, "validate": _validate, "fields": fields}
+    names = [field.name for field in fields]
+    lines = [
+        "def build(record):",
+        "    if not isinstance(record, dict):",
+        "        raise RejectedRecord('некорректная запись')",
+    ]
+    if any(field.type is not None for field in fields):
+        lines.append("    record = convert(record, fields)")
+    lines += [
+        "    validate(record)",
+        "    try:",
+        *(f"        {name} = record[{name!r}]" for name in names),
+        "    except KeyError as e:",
+        "        raise RejectedRecord(f'нет поля {e.args[0]}')",
+        "    try:",
+        "        product = new(cls)",
+    ]
+    if isinstance(inspect.getattr_static(cls, "_listeners", None), pytypes.MemberDescriptorType):
+        lines.append("        product._listeners = ()")
+    lines += [f"        product._Product__{name} = {name}" for name in BASE_FIELDS]
+    lines += [
+        "        if log.construction:",
+        f"            log.emit(INFO, 'construction', f'{cls.__name__}({{name}}, {{description}}, {{price}}, "
+        "{quantity})', product)",
+    ]
+    for field in fields[len(BASE_FIELDS):]:
+        if field.pool is not None:
+            namespace[f"intern_{field.name}"] = field.pool.intern
+            lines.append(f"        product.{field.name} = intern_{field.name}({field.name})")
+        else:
+            lines.append(f"        product.{field.name} = {field.name}")
+    lines += [
+        "    except (TypeError, ValueError) as e:",
+        "        raise RejectedRecord(str(e))",
+        "    return product",
+    ]
+    exec("\n".join(lines), namespace)
+    return namespace["build"]
+
+
+# Конструкторы, которые _compiled_builder умеет повторять без вызова __init__
+_KNOWN_INITS = frozenset(cls.__init__ for cls in (Product, Smartphone, LawnGrass,
+                                                 SlottedProduct, SlottedSmartphone, SlottedLawnGrass))
+
+
+def compilable(cls) -> bool:
+    """Можно ли собрать конструктор cls: его __init__ — один из известных, без собственной логики."""
+    return cls.__init__ in _KNOWN_INITS
+
+
+class ProductSchema:
+    def __init__(self, cls, name: str, fields: tuple = None, compiled: bool = None):
+        self.cls = cls
+        self.name = name
+        self.fields = tuple(fields) if fields is not None else declared_fields(cls)
+        if compiled is None:
+            compiled = compilable(cls)
+        self.compiled = compiled
+        self.build = (_compiled_builder if compiled else _generic_builder)(cls, self.fields)
+
+    @property
+    def extra(self) -> tuple:
+        return tuple(field.name for field in self.fields[len(BASE_FIELDS):])
+
+
+class SchemaRegistry:
+    """Схемы классов товаров и собранные по ним конструкторы.
+
+    Собранный конструктор не вызывает __init__ класса, а повторяет его по
+    схеме, поэтому по умолчанию собирается только для классов с известным
+    __init__ (см. compilable). Для остальных вызывается cls.new_product с
+    теми же проверками; compiled=True включает сборку явно, если __init__
+    класса ничего не добавляет к схеме.
+    """
+
+    def __init__(self):
+        self.types = {}
+        self._schemas = {}
+
+    def register(self, cls, name: str = None, fields: tuple = None, compiled: bool = None) -> ProductSchema:
+        """Регистрирует класс; с именем name он также участвует в выборе класса по записи."""
+        schema = self._schemas[cls] = ProductSchema(cls, name or cls.__name__, fields, compiled)
+        if name is not None:
+            self.types[name] = cls
+        return schema
+
+    def schema(self, cls) -> ProductSchema:
+        schema = self._schemas.get(cls)
+        if schema is None:
+            # Незарегистрированный класс (например, из types) идёт медленным путём
+            schema = self._schemas[cls] = ProductSchema(cls, cls.__name__, compiled=False)
+        return schema
+
+    def resolve(self, record: dict, types: dict = None):
+        """Класс товара для записи: по полю type или по набору полей."""
+        types = types or self.types
+        kind = record.get("type")
+        if kind is not None:
+            try:
+                return types[kind]
+            except KeyError:
+                raise RejectedRecord(f"неизвестный тип товара {kind!r}")
+        for cls in types.values():
+            fields = extra_fields(cls)
+            if fields and all(name in record for name in fields):
+                return cls
+        return types["product"]
+
+    def build(self, record: dict, types: dict = None):
+        if not isinstance(record, dict):
+            raise RejectedRecord("некорректная запись")
+        return self.schema(self.resolve(record, types)).build(record)
+
+    def build_many(self, records, types: dict = None) -> tuple:
+        """Создаёт товары из словарей без вывода в консоль; возвращает товары и список ошибок.
+
+        Конструктор выбирается один раз на тип, а журнал отключается на весь пакет.
+        """
+        types = types or self.types
+        builders = {}
+        products = []
+        failures = []
+        append = products.append
+        with product_log.quiet():
+            for index, record in enumerate(records):
+                try:
+                    if not isinstance(record, dict):
+                        raise RejectedRecord("некорректная запись")
+                    cls = self.resolve(record, types)
+                    build = builders.get(cls)
+                    if build is None:
+                        build = builders[cls] = self.schema(cls).build
+                    append(build(record))
+                except RejectedRecord as e:
+                    name = record.get("name") if isinstance(record, dict) else None
+                    failures.append(ValidationFailure(index, name, str(e)))
+        return products, failures
+
+
+schemas = SchemaRegistry()
+schemas.register(Product, "product")
+schemas.register(Smartphone, "smartphone")
+schemas.register(LawnGrass, "lawn_grass")
+for slotted in (SlottedProduct, SlottedSmartphone, SlottedLawnGrass):
+    schemas.register(slotted)
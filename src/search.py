@@ -0,0 +1,113 @@
+import heapq
+import math
+import re
+import unicodedata
+from collections import namedtuple
+
+TOKEN = re.compile(r"\w+")
+FIELD_WEIGHTS = {"name": 2.0, "description": 1.0}
+PARTIAL_WEIGHT = 0.5
+
+SearchPage = namedtuple("SearchPage", ["hits", "total", "next_cursor"])
+
+
+def tokenize(text: str) -> list:
+    """Слова текста в нижнем регистре; работает с кириллицей и латиницей, «ё» приравнивается к «е»."""
+    text = unicodedata.normalize("NFKC", text).casefold().replace("ё", "е")
+    return TOKEN.findall(text)
+
+
+def trigrams(token: str) -> set:
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+class TextIndex:
+    """Инвертированный индекс по названию и описанию товаров.
+
+    Для поиска по части слова поддерживается триграммный индекс словаря:
+    он хранит не строки товаров, а слова, поэтому остаётся небольшим.
+    """
+
+    def __init__(self, weights: dict = None):
+        self.weights = weights or FIELD_WEIGHTS
+        self._postings = {}
+        self._trigrams = {}
+        self._rows = 0
+
+    def __len__(self):
+        return self._rows
+
+    def add(self, row: int, fields: dict):
+        self._rows += 1
+        for field, text in fields.items():
+            self._index(row, field, text, 1)
+
+    def update(self, row: int, field: str, old: str, new: str):
+        if field in self.weights:
+            self._index(row, field, old, -1)
+            self._index(row, field, new, 1)
+
+    def _index(self, row: int, field: str, text: str, sign: int):
+        weight = self.weights.get(field)
+        if weight is None or not isinstance(text, str):
+            return
+        for token in tokenize(text):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                for trigram in trigrams(token):
+                    self._trigrams.setdefault(trigram, set()).add(token)
+            score = postings.get(row, 0) + sign * weight
+            if score > 0:
+                postings[row] = score
+            else:
+                postings.pop(row, None)
+                if not postings:
+                    del self._postings[token]
+                    for trigram in trigrams(token):
+                        tokens = self._trigrams[trigram]
+                        tokens.discard(token)
+                        if not tokens:
+                            del self._trigrams[trigram]
+
+    def _expand(self, term: str, partial: bool) -> dict:
+        """Слова словаря, подходящие под слово запроса, с весом совпадения."""
+        matches = {term: 1.0} if term in self._postings else {}
+        if partial and len(term) >= 3:
+            candidates = None
+            for trigram in trigrams(term):
+                tokens = self._trigrams.get(trigram, set())
+                candidates = set(tokens) if candidates is None else candidates & tokens
+                if not candidates:
+                    break
+            for token in candidates or ():
+                if token != term and term in token:
+                    matches[token] = PARTIAL_WEIGHT
+        return matches
+
+    def search(self, query: str, cursor: int = 0, size: int = 20, partial: bool = False) -> SearchPage:
+        """Строки, содержащие все слова запроса, по убыванию TF-IDF."""
+        if cursor < 0 or size <= 0:
+            raise ValueError("Курсор не может быть отрицательным, а размер страницы должен быть положительным")
+        terms = tokenize(query)
+        if not terms:
+            return SearchPage([], 0, None)
+        scores = None
+        for term in dict.fromkeys(terms):
+            term_scores = {}
+            for token, match in self._expand(term, partial).items():
+                postings = self._postings[token]
+                idf = math.log(1 + self._rows / len(postings))
+                for row, tf in postings.items():
+                    score = match * idf * tf
+                    if score > term_scores.get(row, 0):
+                        term_scores[row] = score
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {row: score + term_scores[row] for row, score in scores.items() if row in term_scores}
+            if not scores:
+                return SearchPage([], 0, None)
+        top = heapq.nsmallest(cursor + size, scores.items(), key=lambda item: (-item[1], item[0]))
+        end = cursor + size
+        return SearchPage(top[cursor:end], len(scores), end if end < len(scores) else None)
@@ -0,0 +1,367 @@
+import os
+import pickle
+import struct
+import tempfile
+import threading
+from array import array
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+
+from src.main import Category, CategoryTotals
+from src.storage import ColumnarProducts, extra_fields
+
+try:
+    import fcntl
+except ImportError:  # Windows: блокировки только между потоками одного процесса
+    fcntl = None
+
+MAGIC = b"CATSTOCK"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIQqddQ")
+FIXED_SIZE = "В общую таблицу остатков нельзя добавить товар: её размер фиксирован"
+
+
+class SharedTableError(Exception):
+    pass
+
+
+def _open_memory(name: str, create: bool = False, size: int = 0) -> shared_memory.SharedMemory:
+    if create:
+        return shared_memory.SharedMemory(name, create=True, size=size)
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # До Python 3.13 подключившийся процесс регистрирует блок в resource_tracker,
+        # и тот удалил бы его при выходе процесса, хотя владелец блока другой
+        memory = shared_memory.SharedMemory(name)
+        if os.name == "posix":
+            resource_tracker.unregister(memory._name, "shared_memory")
+        return memory
+
+
+class _StripeLocks:
+    """Блокировки полос таблицы, общие для всех её подключений внутри процесса.
+
+    fcntl-блокировки принадлежат процессу и не исключают друг друга в его
+    потоках, поэтому каждую полосу дополнительно защищает threading.Lock.
+    """
+
+    _opened = {}
+    _guard = threading.Lock()
+
+    def __init__(self, path: str, count: int):
+        self.path = path
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600) if fcntl is not None else None
+        self.threads = [threading.Lock() for _ in range(count)]
+        self.users = 0
+
+    @staticmethod
+    def _path(name: str) -> str:
+        return os.path.join(tempfile.gettempdir(), f"{name.lstrip('/')}.stock.lock")
+
+    @classmethod
+    def acquire(cls, name: str, count: int) -> "_StripeLocks":
+        path = cls._path(name)
+        with cls._guard:
+            locks = cls._opened.get(path)
+            if locks is None:
+                locks = cls._opened[path] = cls(path, count)
+            locks.users += 1
+        return locks
+
+    def release(self):
+        with self._guard:
+            self.users -= 1
+            if self.users == 0:
+                del self._opened[self.path]
+                if self.fd is not None:
+                    os.close(self.fd)
+
+    @classmethod
+    def remove(cls, name: str):
+        try:
+            os.unlink(cls._path(name))
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def hold(self, stripe: int):
+        with self.threads[stripe]:
+            if self.fd is None:
+                yield
+                return
+            fcntl.lockf(self.fd, fcntl.LOCK_EX, 1, stripe)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self.fd, fcntl.LOCK_UN, 1, stripe)
+
+
+class SharedStockTable:
+    """Цены и остатки категории в multiprocessing.shared_memory.
+
+    Блок: заголовок (сигнатура, число полос блокировок, число строк, итоги),
+    массив цен float64, массив остатков int64 и описание товаров (pickle).
+    Запись в строку берёт блокировку её полосы (row % stripes), изменение
+    итогов — отдельную блокировку заголовка; между процессами это
+    fcntl-блокировки байтов файла рядом с блоком, внутри процесса — threading.Lock.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        self._memory = memory
+        self.owner = owner
+        self.name = memory.name
+        buffer = memory.buf
+        magic, version, self.stripes, _, rows, _, _, _, meta_size = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise SharedTableError(f"Блок {memory.name!r} не является таблицей остатков")
+        if version != VERSION:
+            raise SharedTableError(f"Неподдерживаемая версия таблицы остатков: {version}")
+        self.rows = rows
+        prices_end = HEADER.size + 8 * rows
+        quantities_end = prices_end + 8 * rows
+        self.prices = buffer[HEADER.size:prices_end].cast("d")
+        self.quantities = buffer[prices_end:quantities_end].cast("q")
+        self._meta = pickle.loads(buffer[quantities_end:quantities_end + meta_size])
+        self._locks = _StripeLocks.acquire(memory.name, self.stripes + 1)
+
+    @classmethod
+    def create(cls, name: str, category: Category, stripes: int = 64) -> "SharedStockTable":
+        """Копирует цены и остатки категории в новый блок общей памяти с именем name."""
+        if not 0 < stripes < 65536:
+            raise ValueError("Число полос блокировок должно быть от 1 до 65535")
+        storage = category._columnar_storage()
+        state = storage.__getstate__()
+        state["_prices"] = array("d")
+        state["_quantities"] = array("q")
+        meta = pickle.dumps({"name": category.name, "description": category.description, "storage": state})
+        rows = len(storage)
+        memory = _open_memory(name, create=True, size=HEADER.size + 16 * rows + len(meta))
+        buffer = memory.buf
+        HEADER.pack_into(buffer, 0, MAGIC, VERSION, stripes, 0, rows, *category.totals[1:], len(meta))
+        offset = HEADER.size
+        for column in (storage._prices, storage._quantities):
+            data = column.tobytes()
+            buffer[offset:offset + len(data)] = data
+            offset += len(data)
+        buffer[offset:offset + len(meta)] = meta
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedStockTable":
+        try:
+            memory = _open_memory(name)
+        except FileNotFoundError:
+            raise SharedTableError(f"Таблица остатков {name!r} не найдена") from None
+        return cls(memory, owner=False)
+
+    def _locked(self, stripe: int):
+        return self._locks.hold(stripe)
+
+    def _add_totals(self, quantity: int, price_sum: float, stock_value: float):
+        with self._locked(self.stripes):
+            _, _, _, _, _, total_quantity, total_price, total_value, _ = HEADER.unpack_from(self._memory.buf)
+            struct.pack_into("<qdd", self._memory.buf, 24, total_quantity + quantity, total_price + price_sum,
+                             total_value + stock_value)
+
+    def totals(self) -> CategoryTotals:
+        with self._locked(self.stripes):
+            quantity, price_sum, stock_value = struct.unpack_from("<qdd", self._memory.buf, 24)
+        return CategoryTotals(self.rows, quantity, price_sum, stock_value)
+
+    def set(self, row: int, field: str, value) -> object:
+        """Записывает цену или остаток строки и возвращает прежнее значение."""
+        with self._locked(row % self.stripes):
+            if field == "price":
+                old = self.prices[row]
+                self.prices[row] = value
+                self._add_totals(0, value - old, (value - old) * self.quantities[row])
+            else:
+                old = self.quantities[row]
+                self.quantities[row] = value
+                self._add_totals(value - old, 0, self.prices[row] * (value - old))
+        return old
+
+    def adjust(self, row: int, delta: int):
+        """Атомарно меняет остаток на delta; None, если остаток стал бы отрицательным."""
+        with self._locked(row % self.stripes):
+            old = self.quantities[row]
+            if old + delta < 0:
+                return None
+            self.quantities[row] = old + delta
+            self._add_totals(delta, 0, self.prices[row] * delta)
+        return old, old + delta
+
+    def raise_price(self, row: int, price: float):
+        """Атомарно поднимает цену до price; None, если цена уже не ниже."""
+        with self._locked(row % self.stripes):
+            old = self.prices[row]
+            if price <= old:
+                return None
+            self.prices[row] = price
+            self._add_totals(0, price - old, (price - old) * self.quantities[row])
+        return old, price
+
+    def close(self):
+        if self._memory is None:
+            return
+        self.prices.release()
+        self.quantities.release()
+        self._memory.close()
+        self._memory = None
+        self._locks.release()
+
+    def unlink(self):
+        """Удаляет блок общей памяти; вызывает владелец, когда таблица больше не нужна."""
+        memory = self._memory or _open_memory(self.name)
+        self.close()
+        if os.name == "posix":
+            # Подключившиеся процессы могли снять регистрацию блока в общем resource_tracker
+            resource_tracker.register(memory._name, "shared_memory")
+        memory.unlink()
+        memory.close()
+        _StripeLocks.remove(self.name)
+
+
+_shared_classes = {}
+
+
+def shared_class(cls):
+    """Подкласс cls, у которого цена и остаток читаются из общей таблицы и пишутся в неё.
+
+    Свойства Product.price/quantity со всеми проверками и уведомлениями
+    остаются прежними: подменяются только атрибуты, в которых они хранят значения.
+    """
+    shared = _shared_classes.get(cls)
+    if shared is None:
+        shared = _shared_classes[cls] = type(cls.__name__, (cls,), {
+            "__module__": cls.__module__,
+            "__qualname__": f"Shared{cls.__qualname__}",
+            "_Product__price": property(lambda self: self._table.prices[self._row],
+                                        lambda self, value: self._table.set(self._row, "price", value)),
+            "_Product__quantity": property(lambda self: self._table.quantities[self._row],
+                                           lambda self, value: self._table.set(self._row, "quantity", value)),
+        })
+    return shared
+
+
+class SharedProducts(ColumnarProducts):
+    """Колоночное хранилище, в котором массивы цен и остатков — представления общей таблицы."""
+
+    def __init__(self, table: SharedStockTable, state: dict):
+        self.__setstate__(dict(state))
+        self._table = table
+        self._prices = table.prices
+        self._quantities = table.quantities
+
+    def append(self, product):
+        raise TypeError(FIXED_SIZE)
+
+    def update(self, row: int, field: str, value):
+        # Цена и остаток уже записаны в общую таблицу свойствами товара
+        if field not in ("price", "quantity"):
+            return super().update(row, field, value)
+        return None
+
+    def _build(self, row: int):
+        cls = shared_class(self._types[self._type_codes[row]])
+        product = cls.__new__(cls)
+        product._table = self._table
+        product._row = row
+        product._listeners = ()
+        product._Product__name = self._names[row]
+        product._Product__description = self._descriptions[row]
+        for field, value in zip(extra_fields(cls), self.extra_values(row)):
+            setattr(product, field, value)
+        if self.on_build is not None:
+            self.on_build(product, row)
+        return product
+
+
+class SharedCategory(Category):
+    """Категория поверх SharedStockTable: цены, остатки и итоги общие для всех процессов.
+
+    Название, описание и дополнительные поля у каждого процесса свои (копия
+    из таблицы), набор товаров фиксирован при создании таблицы.
+    """
+
+    @classmethod
+    def create(cls, name: str, category: Category, stripes: int = 64) -> "SharedCategory":
+        return cls._from_table(SharedStockTable.create(name, category, stripes))
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedCategory":
+        return cls._from_table(SharedStockTable.attach(name))
+
+    @classmethod
+    def _from_table(cls, table: SharedStockTable) -> "SharedCategory":
+        meta = table._meta
+        category = cls(meta["name"], meta["description"], columnar=True)
+        category.table = table
+        products = SharedProducts(table, meta["storage"])
+        products.on_build = category._watch
+        category._Category__products = products
+        category._product_counter.add(len(products))
+        return category
+
+    @property
+    def totals(self) -> CategoryTotals:
+        table = self.__dict__.get("table")
+        return table.totals() if table is not None else CategoryTotals(0, 0, 0, 0)
+
+    @totals.setter
+    def totals(self, value):
+        # Итоги ведёт общая таблица
+        pass
+
+    def _store(self, product):
+        raise TypeError(FIXED_SIZE)
+
+    def _merge_storage(self, storage, totals: CategoryTotals):
+        raise TypeError(FIXED_SIZE)
+
+    def _set(self, row: int, field: str, value):
+        product = self._Category__products.cached(row)
+        if product is not None:
+            setattr(product, field, value)
+        else:
+            self._on_product_change(row, None, field, self.table.set(row, field, value), value)
+
+    def _adjust(self, row: int, delta: int) -> bool:
+        return self._changed(row, "quantity", self.table.adjust(row, delta))
+
+    def _raise_price(self, row: int, price: float):
+        # Слияние дубликатов идёт через атомарные операции таблицы: блокировка
+        # категории защищает только от потоков своего процесса
+        self._changed(row, "price", self.table.raise_price(row, price))
+
+    def _changed(self, row: int, field: str, change) -> bool:
+        """Уведомляет о записи, уже сделанной в таблице; change — пара (old, new) или None."""
+        if change is None:
+            return False
+        product = self._Category__products.cached(row)
+        if product is not None:
+            product._notify(field, *change)
+        else:
+            self._on_product_change(row, None, field, *change)
+        return True
+
+    def _on_product_change(self, row: int, product, field: str, old, new):
+        # Индексы по цене и стоимости устарели бы от записей других процессов:
+        # они строятся заново на каждый запрос
+        self._price_index = self._value_index = None
+        super()._on_product_change(row, product, field, old, new)
+
+    def _line(self, row: int) -> str:
+        # Строку мог изменить другой процесс, поэтому кэш строк не используется
+        return self._Category__products.line(row)
+
+    def _build_indexes(self):
+        self._price_index = self._value_index = None
+        super()._build_indexes()
+
+    def close(self):
+        self.table.close()
+
+    def unlink(self):
+        self.table.unlink()
@@ -0,0 +1,83 @@
+from src.main import BaseProduct, LawnGrass, Product, ProductMixin, Smartphone
+from src.flyweight import colors, countries, germination_periods, memory_sizes, models
+
+
+class SlottedProduct(ProductMixin, BaseProduct):
+    """Product без __dict__: атрибуты лежат в слотах.
+
+    Свойства price/quantity, __str__, __add__ и new_product взяты у Product,
+    а сам класс зарегистрирован как виртуальный подкласс Product, поэтому
+    проходит проверку isinstance(x, Product) в Category.add_product.
+    """
+
+    __slots__ = ("_Product__name", "_Product__description", "_Product__price", "_Product__quantity",
+                 "_listeners", "__weakref__")
+
+    def __init__(self, name: str, description: str, price: float, quantity: int):
+        if quantity == 0:
+            raise ValueError("Товар с нулевым количеством не может быть добавлен")
+        self._listeners = ()
+        self._Product__name = name
+        self._Product__description = description
+        self.price = price
+        self._Product__price = price
+        self._Product__quantity = quantity
+        super().__init__(name, description, price, quantity)
+
+    name = Product.name
+    description = Product.description
+    price = Product.price
+    quantity = Product.quantity
+    subscribe = Product.subscribe
+    unsubscribe = Product.unsubscribe
+    _notify = Product._notify
+    __str__ = Product.__str__
+    _render = Product.__dict__["_render"]
+    __add__ = Product.__add__
+    new_product = Product.__dict__["new_product"]
+
+    @classmethod
+    def _restore(cls, name: str, description: str, price: float, quantity: int, **extra):
+        product = Product.__dict__["_restore"].__func__(cls, name, description, price, quantity, **extra)
+        product._listeners = ()
+        return product
+
+
+class SlottedSmartphone(SlottedProduct):
+    __slots__ = ("efficiency", "model", "memory", "color")
+    interned_fields = Smartphone.interned_fields
+
+    def __init__(self, name: str, description: str, price: float, quantity: int,
+                 efficiency: float, model: str, memory: int, color: str):
+        super().__init__(name, description, price, quantity)
+        self.efficiency = efficiency
+        self.model = models.intern(model)
+        self.memory = memory_sizes.intern(memory)
+        self.color = colors.intern(color)
+
+    new_product = Smartphone.__dict__["new_product"]
+
+
+class SlottedLawnGrass(SlottedProduct):
+    __slots__ = ("country", "germination_period", "color")
+    interned_fields = LawnGrass.interned_fields
+
+    def __init__(self, name: str, description: str, price: float, quantity: int,
+                 country: str, germination_period: str, color: str):
+        super().__init__(name, description, price, quantity)
+        self.country = countries.intern(country)
+        self.germination_period = germination_periods.intern(germination_period)
+        self.color = colors.intern(color)
+
+    new_product = LawnGrass.__dict__["new_product"]
+
+
+Product.register(SlottedProduct)
+Smartphone.register(SlottedSmartphone)
+LawnGrass.register(SlottedLawnGrass)
+
+SLOTTED_TYPES = {
+    "product": SlottedProduct,
+    "smartphone": SlottedSmartphone,
+    "lawn_grass": SlottedLawnGrass,
+}
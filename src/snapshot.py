@@ -0,0 +1,259 @@
+import importlib
+import json
+import mmap
+import struct
+import zlib
+from array import array
+
+from src.storage import ColumnarProducts, extra_fields
+
+MAGIC = b"CATSNAP\0"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIQI4x")
+TOTALS = struct.Struct("<Qqdd")
+LENGTH = struct.Struct("<Q")
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def _type_name(cls) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _resolve_type(name: str):
+    module, _, qualname = name.partition(":")
+    obj = importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _strings(values) -> tuple:
+    offsets = array("Q", [0])
+    blob = bytearray()
+    for value in values:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+    return offsets.tobytes(), bytes(blob)
+
+
+class _Writer:
+    def __init__(self, file):
+        self.file = file
+        self.crc = 0
+
+    def write(self, data: bytes):
+        self.file.write(data)
+        self.crc = zlib.crc32(data, self.crc)
+
+    def section(self, data: bytes):
+        self.write(LENGTH.pack(len(data)))
+        self.write(data)
+        padding = -len(data) % 8
+        if padding:
+            self.write(b"\0" * padding)
+
+
+def save(path, categories) -> None:
+    """Записывает категории в бинарный снимок.
+
+    Формат: заголовок (сигнатура, версия, CRC32, размер, число категорий),
+    таблица смещений категорий и блоки категорий из выровненных по 8 байт
+    секций: метаданные, итоги, цены float64, остатки int64, коды классов,
+    названия, описания и дополнительные поля подклассов. Строки с целой
+    ценой перечислены в метаданных, чтобы цена читалась обратно как int.
+    """
+    categories = list(categories)
+    with open(path, "wb") as file:
+        table_size = 8 * len(categories)
+        file.write(b"\0" * (HEADER.size + table_size))
+        writer = _Writer(file)
+        offsets = array("Q")
+        for category in categories:
+            offsets.append(file.tell())
+            _write_category(writer, category)
+        payload_size = file.tell() - HEADER.size
+        table = offsets.tobytes()
+        checksum = zlib.crc32(table, writer.crc)
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, 0, checksum, payload_size, len(categories)))
+        file.write(table)
+
+
+def _write_category(writer: _Writer, category):
+    storage = category._columnar_storage()
+    meta = {
+        "name": category.name,
+        "description": category.description,
+        "types": [[_type_name(cls), list(extra_fields(cls))] for cls in storage._types],
+        "int_prices": sorted(storage._int_prices),
+    }
+    writer.section(json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+    writer.section(TOTALS.pack(*category.totals))
+    writer.section(storage._prices.tobytes())
+    writer.section(storage._quantities.tobytes())
+    writer.section(storage._type_codes.tobytes())
+    for strings in (storage._names, storage._descriptions):
+        for data in _strings(strings):
+            writer.section(data)
+    extras = (json.dumps(values, ensure_ascii=False) if values else ""
+              for values in map(storage.extra_values, range(len(storage))))
+    for data in _strings(extras):
+        writer.section(data)
+
+
+class SnapshotCategory:
+    """Категория в снимке, читаемая напрямую из mmap без разбора."""
+
+    def __init__(self, buffer: memoryview, offset: int):
+        sections = []
+        for _ in range(11):
+            (length,) = LENGTH.unpack_from(buffer, offset)
+            offset += LENGTH.size
+            sections.append(buffer[offset:offset + length])
+            offset += length + (-length % 8)
+        meta = json.loads(bytes(sections[0]).decode("utf-8"))
+        self.name = meta["name"]
+        self.description = meta["description"]
+        self._types = [(_resolve_type(name), tuple(fields)) for name, fields in meta["types"]]
+        self._int_prices = frozenset(meta.get("int_prices", ()))
+        self.totals = TOTALS.unpack(sections[1])
+        self.prices = sections[2].cast("d")
+        self.quantities = sections[3].cast("q")
+        self._codes = sections[4]
+        self._names = (sections[5].cast("Q"), sections[6])
+        self._descriptions = (sections[7].cast("Q"), sections[8])
+        self._extras = (sections[9].cast("Q"), sections[10])
+
+    def __len__(self):
+        return len(self.prices)
+
+    def release(self):
+        """Отпускает memoryview на mmap; после этого вид читать нельзя."""
+        for view in (self.prices, self.quantities, self._codes, *self._names, *self._descriptions, *self._extras):
+            view.release()
+
+    def price(self, row: int) -> float:
+        price = self.prices[row]
+        if row in self._int_prices and price.is_integer():
+            return int(price)
+        return price
+
+    @staticmethod
+    def _string(strings: tuple, row: int) -> str:
+        offsets, blob = strings
+        return bytes(blob[offsets[row]:offsets[row + 1]]).decode("utf-8")
+
+    def product(self, row: int):
+        """Создаёт один товар строки row, не трогая остальные."""
+        cls, fields = self._types[self._codes[row]]
+        extras = self._string(self._extras, row)
+        extra = dict(zip(fields, json.loads(extras))) if extras else {}
+        return cls._restore(self._string(self._names, row), self._string(self._descriptions, row),
+                            self.price(row), self.quantities[row], **extra)
+
+    def storage(self) -> ColumnarProducts:
+        storage = ColumnarProducts()
+        for cls, _ in self._types:
+            storage._type_code(cls)
+        storage._type_codes.frombytes(self._codes)
+        storage._prices.frombytes(self.prices.cast("B"))
+        storage._quantities.frombytes(self.quantities.cast("B"))
+        storage._int_prices.update(self._int_prices)
+        for row in range(len(self)):
+            storage._names.append(self._string(self._names, row))
+            storage._descriptions.append(self._string(self._descriptions, row))
+            extras = self._string(self._extras, row)
+            storage._append_extras(self._types[self._codes[row]][0], json.loads(extras) if extras else ())
+        return storage
+
+
+class Snapshot:
+    """Открытый снимок: категории создаются при первом обращении к ним."""
+
+    def __init__(self, path, category_cls, verify: bool = True):
+        self._category_cls = category_cls
+        self._views = {}
+        self._offsets = None
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise SnapshotError("Пустой файл снимка")
+        self._buffer = memoryview(self._mmap)
+        if len(self._buffer) < HEADER.size:
+            self.close()
+            raise SnapshotError("Файл снимка повреждён")
+        magic, version, _, checksum, payload_size, count = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            self.close()
+            raise SnapshotError("Файл не является снимком каталога")
+        if version != VERSION:
+            self.close()
+            raise SnapshotError(f"Неподдерживаемая версия снимка: {version}")
+        if HEADER.size + payload_size != len(self._buffer):
+            self.close()
+            raise SnapshotError("Файл снимка повреждён")
+        self._table_end = HEADER.size + 8 * count
+        self._offsets = self._buffer[HEADER.size:self._table_end].cast("Q")
+        if verify and zlib.crc32(self._offsets, zlib.crc32(self._buffer[self._table_end:])) != checksum:
+            self.close()
+            raise SnapshotError("Контрольная сумма снимка не совпадает")
+        self._categories = {}
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def view(self, index: int) -> SnapshotCategory:
+        view = self._views.get(index)
+        if view is None:
+            view = self._views[index] = SnapshotCategory(self._buffer, self._offsets[index])
+        return view
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Индекс категории вне диапазона")
+        category = self._categories.get(index)
+        if category is None:
+            view = self.view(index)
+            category = self._category_cls._from_storage(view.name, view.description, view.storage(), view.totals)
+            self._categories[index] = category
+        return category
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self):
+        """Закрывает снимок; виды из view() после этого читать нельзя.
+
+        Если снаружи ещё живут memoryview на файл (например, срезы view().prices),
+        снимок остаётся открытым и поднимается SnapshotError — после их
+        освобождения close можно вызвать снова.
+        """
+        if self._mmap.closed:
+            return
+        views, self._views = self._views, {}
+        for view in views.values():
+            view.release()
+        if self._offsets is not None:
+            self._offsets.release()
+        self._buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            self._buffer = memoryview(self._mmap)
+            self._offsets = self._buffer[HEADER.size:self._table_end].cast("Q")
+            raise SnapshotError("Снимок нельзя закрыть, пока используются полученные из него memoryview") from None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
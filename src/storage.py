@@ -0,0 +1,401 @@
+import inspect
+import sys
+import weakref
+from array import array
+
+BASE_FIELDS = ("name", "description", "price", "quantity")
+
+_extra_fields_cache = {}
+
+
+def extra_fields(cls) -> tuple:
+    """Имена полей конструктора класса товара сверх базовых четырёх."""
+    fields = _extra_fields_cache.get(cls)
+    if fields is None:
+        parameters = inspect.signature(cls.__init__).parameters
+        fields = tuple(name for name in parameters if name != "self" and name not in BASE_FIELDS)
+        _extra_fields_cache[cls] = fields
+    return fields
+
+
+_MISSING = object()
+
+
+def product_key(product, fields: tuple):
+    """Значение ключа товара: одно поле даёт само значение, несколько — кортеж.
+
+    Если какого-то поля у товара нет, ключа у него тоже нет (None): такие
+    товары не считаются дубликатами друг друга.
+    """
+    values = tuple(getattr(product, field, _MISSING) for field in fields)
+    if _MISSING in values:
+        return None
+    return values[0] if len(fields) == 1 else values
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_all(values) -> list:
+    intern = sys.intern
+    return [intern(value) if type(value) is str else value for value in values]
+
+
+class ProductList(list):
+    """Хранилище по умолчанию: обычный список объектов Product."""
+
+    on_build = None
+
+    def check(self, product):
+        pass
+
+    def update(self, row: int, field: str, value):
+        """Хранилище и есть объекты товаров, поэтому прежнего значения у него нет."""
+        return None
+
+    def cached(self, row: int):
+        return self[row]
+
+    def price(self, row: int) -> float:
+        return self[row].price
+
+    def quantity(self, row: int) -> int:
+        return self[row].quantity
+
+    def names(self):
+        return (product.name for product in self)
+
+    def state(self, row: int) -> tuple:
+        """Класс, название, описание, цена, остаток и дополнительные поля строки."""
+        product = self[row]
+        cls = type(product)
+        return (cls, product.name, product.description, product.price, product.quantity,
+                tuple(getattr(product, field) for field in extra_fields(cls)))
+
+    def key(self, row: int, fields: tuple):
+        return product_key(self[row], fields)
+
+    def prices(self):
+        return (product.price for product in self)
+
+    def quantities(self):
+        return (product.quantity for product in self)
+
+    def line(self, row: int) -> str:
+        return str(self[row])
+
+    def texts(self, row: int) -> dict:
+        product = self[row]
+        return {"name": product.name, "description": product.description}
+
+    def attributes(self, row: int) -> dict:
+        product = self[row]
+        attributes = {field: getattr(product, field) for field in extra_fields(type(product))}
+        attributes["class"] = type(product).__name__
+        return attributes
+
+    def classes(self) -> list:
+        """Классы товаров хранилища в порядке первого появления."""
+        return list(dict.fromkeys(map(type, self)))
+
+    def columns(self):
+        """Цены, остатки, коды классов и список классов в виде массивов."""
+        types = []
+        codes = array("B")
+        for product in self:
+            cls = type(product)
+            if cls not in types:
+                types.append(cls)
+            codes.append(types.index(cls))
+        return array("d", self.prices()), array("q", self.quantities()), codes, types
+
+    def lines(self):
+        return (str(product) for product in self)
+
+
+class _ExtraTable:
+    """Дополнительные поля одного подкласса: отдельная колонка на каждое поле.
+
+    Поля из cls.interned_fields хранятся кодами пула в массиве array("I").
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.fields = extra_fields(cls)
+        pools = getattr(cls, "interned_fields", {})
+        self.pools = tuple(pools.get(name) for name in self.fields)
+        self.columns = [array("I") if pool is not None else [] for pool in self.pools]
+
+    def __len__(self):
+        return len(self.columns[0])
+
+    def append(self, values) -> int:
+        local = len(self)
+        for column, pool, value in zip(self.columns, self.pools, values):
+            column.append(pool.code(value) if pool is not None else _intern(value))
+        return local
+
+    def values(self, local: int) -> tuple:
+        return tuple(pool.values[column[local]] if pool is not None else column[local]
+                     for column, pool in zip(self.columns, self.pools))
+
+    def extend(self, other: "_ExtraTable") -> int:
+        """Дописывает строки другой таблицы того же класса по колонкам; возвращает сдвиг их номеров."""
+        start = len(self)
+        for column, pool, source in zip(self.columns, self.pools, other.columns):
+            column.extend(source if pool is not None else _intern_all(source))
+        return start
+
+    def __getstate__(self):
+        # Коды пула действительны только в своём процессе, поэтому вместе с ними передаются значения пула
+        return {"cls": self.cls, "columns": self.columns,
+                "pools": [list(pool.values) if pool is not None else None for pool in self.pools]}
+
+    def __setstate__(self, state):
+        self.__init__(state["cls"])
+        for index, (pool, column, values) in enumerate(zip(self.pools, state["columns"], state["pools"])):
+            if pool is None:
+                self.columns[index] = _intern_all(column)
+                continue
+            remap = list(map(pool.code, values))
+            if remap != list(range(len(remap))):
+                column = array("I", map(remap.__getitem__, column))
+            self.columns[index] = column
+
+
+class ColumnarProducts:
+    """Колоночное хранилище товаров категории.
+
+    Цены и остатки лежат в типизированных массивах, названия и описания
+    интернированы, а объекты Product создаются только при обращении к ним.
+    Строки с целой ценой (int) запоминаются в _int_prices, чтобы цена
+    выводилась так же, как у объекта товара.
+    """
+
+    on_build = None
+
+    def __init__(self, products=()):
+        self._types = []
+        self._type_codes = array("B")
+        self._names = []
+        self._descriptions = []
+        self._prices = array("d")
+        self._int_prices = set()
+        self._quantities = array("q")
+        self._tables = {}
+        self._local_rows = array("I")
+        self._materialized = weakref.WeakValueDictionary()
+        for product in products:
+            self.append(product)
+
+    def __len__(self):
+        return len(self._prices)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("Индекс товара вне диапазона")
+        product = self._materialized.get(row)
+        if product is None:
+            product = self._build(row)
+            self._materialized[row] = product
+        return product
+
+    def _type_code(self, cls) -> int:
+        try:
+            return self._types.index(cls)
+        except ValueError:
+            self._types.append(cls)
+            return len(self._types) - 1
+
+    def check(self, product):
+        """Проверяет, что цену и остаток товара можно сохранить в колонках без искажения."""
+        if type(product.price) not in (int, float):
+            raise TypeError("В колоночном хранилище цена товара должна быть числом int или float")
+        if type(product.quantity) is not int:
+            raise TypeError("В колоночном хранилище количество товара должно быть целым числом")
+
+    def append(self, product):
+        self.check(product)
+        cls = type(product)
+        if type(product.price) is int:
+            self._int_prices.add(len(self))
+        # Добавленный объект становится объектом строки, чтобы у строки не было двух живых копий
+        self._materialized[len(self)] = product
+        self._type_codes.append(self._type_code(cls))
+        self._names.append(_intern(product.name))
+        self._descriptions.append(_intern(product.description))
+        self._prices.append(product.price)
+        self._quantities.append(product.quantity)
+        self._append_extras(cls, [getattr(product, field) for field in extra_fields(cls)])
+
+    def _append_extras(self, cls, values):
+        if not values:
+            self._local_rows.append(0)
+            return
+        table = self._tables.get(cls)
+        if table is None:
+            table = self._tables[cls] = _ExtraTable(cls)
+        self._local_rows.append(table.append(values))
+
+    def texts(self, row: int) -> dict:
+        return {"name": self._names[row], "description": self._descriptions[row]}
+
+    def attributes(self, row: int) -> dict:
+        cls = self._types[self._type_codes[row]]
+        attributes = dict(zip(extra_fields(cls), self.extra_values(row)))
+        attributes["class"] = cls.__name__
+        return attributes
+
+    def extra_values(self, row: int) -> tuple:
+        """Значения дополнительных полей строки в порядке extra_fields(cls)."""
+        table = self._tables.get(self._types[self._type_codes[row]])
+        return table.values(self._local_rows[row]) if table is not None else ()
+
+    def extend(self, products):
+        for product in products:
+            self.append(product)
+
+    def extend_columns(self, other: "ColumnarProducts"):
+        start = len(self)
+        self._int_prices.update(row + start for row in other._int_prices)
+        remap = [self._type_code(cls) for cls in other._types]
+        if remap == list(range(len(remap))):
+            self._type_codes.extend(other._type_codes)
+        else:
+            self._type_codes.extend(array("B", map(remap.__getitem__, other._type_codes)))
+        self._names.extend(_intern_all(other._names))
+        self._descriptions.extend(_intern_all(other._descriptions))
+        self._prices.extend(other._prices)
+        self._quantities.extend(other._quantities)
+        offsets = []
+        for cls in other._types:
+            table = other._tables.get(cls)
+            if table is None:
+                offsets.append(0)
+                continue
+            mine = self._tables.get(cls)
+            if mine is None:
+                mine = self._tables[cls] = _ExtraTable(cls)
+            offsets.append(mine.extend(table))
+        if any(offsets):
+            self._local_rows.extend(local + offsets[code] for local, code in zip(other._local_rows, other._type_codes))
+        else:
+            self._local_rows.extend(other._local_rows)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_materialized"]
+        state.pop("on_build", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._materialized = weakref.WeakValueDictionary()
+
+    def _build(self, row: int):
+        cls = self._types[self._type_codes[row]]
+        extra = dict(zip(extra_fields(cls), self.extra_values(row)))
+        product = cls._restore(self._names[row], self._descriptions[row],
+                               self.price(row), self._quantities[row], **extra)
+        if self.on_build is not None:
+            self.on_build(product, row)
+        return product
+
+    def update(self, row: int, field: str, value):
+        """Записывает значение поля строки и возвращает прежнее значение из хранилища."""
+        if field == "price":
+            old = self.price(row)
+            self._prices[row] = value
+            if type(value) is int:
+                self._int_prices.add(row)
+            else:
+                self._int_prices.discard(row)
+        elif field == "quantity":
+            old = self._quantities[row]
+            self._quantities[row] = value
+        elif field == "name":
+            old = self._names[row]
+            self._names[row] = _intern(value)
+        elif field == "description":
+            old = self._descriptions[row]
+            self._descriptions[row] = _intern(value)
+        else:
+            return None
+        product = self._materialized.get(row)
+        if product is not None:
+            # Синхронизируем уже созданный объект без повторного уведомления
+            setattr(product, f"_Product__{field}", value)
+        return old
+
+    def classes(self) -> list:
+        return list(self._types)
+
+    def columns(self):
+        return self._prices, self._quantities, self._type_codes, list(self._types)
+
+    def cached(self, row: int):
+        """Уже созданный объект строки или None, не создавая новый."""
+        return self._materialized.get(row)
+
+    def price(self, row: int) -> float:
+        price = self._prices[row]
+        if row in self._int_prices and price.is_integer():
+            return int(price)
+        return price
+
+    def quantity(self, row: int) -> int:
+        return self._quantities[row]
+
+    def names(self):
+        return self._names
+
+    def state(self, row: int) -> tuple:
+        return (self._types[self._type_codes[row]], self._names[row], self._descriptions[row],
+                self.price(row), self._quantities[row], self.extra_values(row))
+
+    def key(self, row: int, fields: tuple):
+        """Значение ключа строки, как у product_key, без создания объекта."""
+        values = []
+        attributes = None
+        for field in fields:
+            if field == "name":
+                values.append(self._names[row])
+            elif field == "description":
+                values.append(self._descriptions[row])
+            elif field == "price":
+                values.append(self.price(row))
+            elif field == "quantity":
+                values.append(self._quantities[row])
+            else:
+                if attributes is None:
+                    attributes = self.attributes(row)
+                if field not in attributes:
+                    return None
+                values.append(attributes[field])
+        return values[0] if len(values) == 1 else tuple(values)
+
+    def prices(self):
+        return self._prices
+
+    def quantities(self):
+        return self._quantities
+
+    def line(self, row: int) -> str:
+        return self._types[self._type_codes[row]]._render(self._names[row], self.price(row), self._quantities[row])
+
+    def lines(self):
+        types = self._types
+        codes = self._type_codes
+        names = self._names
+        prices = self._prices if not self._int_prices else list(map(self.price, range(len(self))))
+        quantities = self._quantities
+        return (types[codes[row]]._render(names[row], prices[row], quantities[row]) for row in range(len(self)))
@@ -0,0 +1,96 @@
+from array import array
+from dataclasses import dataclass
+from operator import mul
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@dataclass
+class Valuation:
+    total: float
+    by_class: dict
+    histogram: list
+
+    @property
+    def count(self) -> int:
+        return sum(count for _, _, count in self.histogram)
+
+
+def _merge_columns(categories):
+    prices = array("d")
+    quantities = array("q")
+    codes = array("B")
+    types = []
+    for category in categories:
+        category_prices, category_quantities, category_codes, category_types = category._columns()
+        remap = []
+        for cls in category_types:
+            if cls not in types:
+                types.append(cls)
+            remap.append(types.index(cls))
+        prices.extend(category_prices)
+        quantities.extend(category_quantities)
+        if remap == list(range(len(remap))):
+            codes.extend(category_codes)
+        else:
+            codes.extend(remap[code] for code in category_codes)
+    return prices, quantities, codes, types
+
+
+def _histogram(prices, bins: int) -> list:
+    if not prices:
+        return []
+    low, high = min(prices), max(prices)
+    if low == high:
+        return [(low, high, len(prices))]
+    width = (high - low) / bins
+    counts = [0] * bins
+    for price in prices:
+        counts[min(int((price - low) / width), bins - 1)] += 1
+    return [(low + width * i, low + width * (i + 1) if i < bins - 1 else high, counts[i]) for i in range(bins)]
+
+
+def _valuate_python(prices, quantities, codes, types, bins: int) -> Valuation:
+    values = list(map(mul, prices, quantities))
+    subtotals = [0] * len(types)
+    for code, value in zip(codes, values):
+        subtotals[code] += value
+    by_class = {cls.__name__: subtotal for cls, subtotal in zip(types, subtotals)}
+    return Valuation(sum(values), by_class, _histogram(prices, bins))
+
+
+def _valuate_numpy(prices, quantities, codes, types, bins: int) -> Valuation:
+    prices = np.frombuffer(prices, dtype=np.float64)
+    values = prices * np.frombuffer(quantities, dtype=np.int64)
+    subtotals = np.bincount(np.frombuffer(codes, dtype=np.uint8), weights=values, minlength=len(types))
+    by_class = {cls.__name__: float(subtotal) for cls, subtotal in zip(types, subtotals)}
+    if not len(prices):
+        histogram = []
+    elif prices.min() == prices.max():
+        histogram = [(float(prices[0]), float(prices[0]), len(prices))]
+    else:
+        counts, edges = np.histogram(prices, bins=bins)
+        histogram = [(float(edges[i]), float(edges[i + 1]), int(counts[i])) for i in range(bins)]
+    return Valuation(float(values.sum()), by_class, histogram)
+
+
+def valuate(categories, bins: int = 10, strict: bool = False, use_numpy: bool = None) -> Valuation:
+    """Стоимость остатков, подытоги по классам и гистограмма цен за один проход.
+
+    В строгом режиме, как и Product.__add__, все товары должны быть одного класса.
+    """
+    if bins <= 0:
+        raise ValueError("Количество интервалов гистограммы должно быть положительным")
+    prices, quantities, codes, types = _merge_columns(categories)
+    if strict and len(types) > 1:
+        raise TypeError("Операнд должен быть экземпляром того же класса")
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        if np is None:
+            raise RuntimeError("NumPy не установлен")
+        return _valuate_numpy(prices, quantities, codes, types, bins)
+    return _valuate_python(prices, quantities, codes, types, bins)
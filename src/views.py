@@ -0,0 +1,92 @@
+from collections import namedtuple
+
+from src.storage import extra_fields
+
+Page = namedtuple("Page", ["lines", "next_cursor"])
+RowState = namedtuple("RowState", ["cls", "name", "description", "price", "quantity", "extras"])
+
+
+class ProductsView:
+    """Ленивое представление строк Category.products.
+
+    Строка товара формируется только при обращении к ней и кэшируется
+    категорией до изменения цены или количества.
+    """
+
+    def __init__(self, category):
+        self._category = category
+
+    def __len__(self):
+        return self._category.totals.count
+
+    def __iter__(self):
+        line = self._category._line
+        for row in range(len(self)):
+            yield line(row)
+
+    def __getitem__(self, index):
+        size = len(self)
+        if isinstance(index, slice):
+            line = self._category._line
+            return [line(row) for row in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Индекс товара вне диапазона")
+        return self._category._line(index)
+
+    def page(self, cursor: int = 0, size: int = 50) -> Page:
+        if cursor < 0 or size <= 0:
+            raise ValueError("Курсор не может быть отрицательным, а размер страницы должен быть положительным")
+        end = min(cursor + size, len(self))
+        next_cursor = end if end < len(self) else None
+        return Page(self[cursor:end], next_cursor)
+
+    def __str__(self):
+        return "\n".join(self)
+
+
+class FrozenCategory:
+    """Неизменяемое состояние категории на момент Category.snapshot().
+
+    Строки лежат в PersistentVector, общем с более новыми версиями, а итоги
+    сохраняются вместе с ним, поэтому читателю не нужны блокировки.
+    """
+
+    __slots__ = ("name", "description", "totals", "_rows")
+
+    def __init__(self, name: str, description: str, totals: tuple, rows):
+        self.name = name
+        self.description = description
+        self.totals = totals
+        self._rows = rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        for row in range(len(self._rows)):
+            yield self[row]
+
+    def __getitem__(self, row: int):
+        """Отдельная копия товара строки; подписки на изменения у неё нет."""
+        state = self._rows[row]
+        extra = dict(zip(extra_fields(state.cls), state.extras))
+        return state.cls._restore(state.name, state.description, state.price, state.quantity, **extra)
+
+    def lines(self):
+        return (state.cls._render(state.name, state.price, state.quantity) for state in self._rows)
+
+    @property
+    def products(self) -> str:
+        return "\n".join(self.lines())
+
+    def __str__(self):
+        return f"{self.name}, количество продуктов: {self.totals.quantity} шт."
+
+    def middle_price(self):
+        count, _, price_sum, _ = self.totals
+        try:
+            return price_sum / count
+        except ZeroDivisionError:
+            return 0
@@ -0,0 +1,26 @@
+import pytest
+from src.main import Product, Smartphone, LawnGrass
+
+PRODUCTS = {
+    "Samsung Galaxy S23 Ultra": (Smartphone, ("256GB, Серый цвет", 180000.0, 5, 95.5, "S23 Ultra", 256, "Серый")),
+    "Iphone 15": (Smartphone, ("512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")),
+    "Xiaomi Redmi Note 11": (Smartphone, ("1024GB, Синий", 31000.0, 14, 90.3, "Note 11", 1024, "Синий")),
+    "Газонная трава": (LawnGrass, ("Элитная трава для газона", 500.0, 20, "Россия", "7 дней", "Зеленый")),
+    "Газонная трава 2": (LawnGrass, ("Выносливая трава", 450.0, 15, "США", "5 дней", "Темно-зеленый")),
+    "55\" QLED 4K": (Product, ("Фоновая подсветка", 123000.0, 7)),
+    "Чехол": (Product, ("Силиконовый", 1000.0, 40)),
+}
+
+DEFAULT_PRODUCTS = ("Samsung Galaxy S23 Ultra", "Iphone 15", "Газонная трава")
+
+
+@pytest.fixture
+def make_products():
+    """Фабрика тестовых товаров: каждый вызов создаёт новые объекты по именам из PRODUCTS."""
+    def make(*names):
+        products = []
+        for name in names or DEFAULT_PRODUCTS:
+            cls, args = PRODUCTS[name]
+            products.append(cls(name, *args))
+        return products
+    return make
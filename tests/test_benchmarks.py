@@ -0,0 +1,42 @@
+import pytest
+from src.main import Category
+from benchmarks.datagen import records
+from benchmarks.suite import BENCHMARKS, compare, main, run_suite
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def test_records_are_deterministic():
+    first = list(records(30, seed=1))
+    assert first == list(records(30, seed=1))
+    assert {"efficiency", "model", "memory", "color"} <= set(first[1])
+    assert {"country", "germination_period", "color"} <= set(first[2])
+
+
+def test_run_suite_covers_all_benchmarks():
+    report = run_suite(sizes=[20], repeat=1)
+    assert set(report["results"]) == {f"{name}@20" for name in BENCHMARKS}
+    for result in report["results"].values():
+        assert result["seconds"] >= 0
+        assert result["peak_bytes"] >= 0
+
+
+def test_compare_detects_regressions():
+    baseline = {"results": {"add_product@10": {"seconds": 1.0, "peak_bytes": 100}}}
+    current = {"results": {"add_product@10": {"seconds": 1.2, "peak_bytes": 200},
+                           "middle_price@10": {"seconds": 5.0}}}
+    assert compare(current, baseline, tolerance=0.25) == [("add_product@10", "peak_bytes", 100, 200)]
+
+
+def test_main_fails_on_regression(tmp_path, capsys):
+    output = tmp_path / "current.json"
+    assert main(["--sizes", "10", "--only", "middle_price", "--repeat", "1", "--output", str(output)]) == 0
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text('{"results": {"middle_price@10": {"seconds": 0.0}}}', encoding="utf-8")
+    assert main(["--sizes", "10", "--only", "middle_price", "--repeat", "1", "--no-memory",
+                 "--baseline", str(baseline)]) == 1
+    assert "РЕГРЕССИЯ" in capsys.readouterr().out
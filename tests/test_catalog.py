@@ -0,0 +1,85 @@
+import pytest
+from src.catalog import Catalog
+from src.main import Product, Category, Smartphone
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def make_catalog(make_products, columnar=False):
+    catalog = Catalog()
+    phones = catalog.create("Смартфоны", "Описание",
+                            make_products("Samsung Galaxy S23 Ultra", "Iphone 15", "Xiaomi Redmi Note 11"),
+                            columnar=columnar)
+    garden = catalog.create("Сад", "Описание",
+                            make_products("Газонная трава") + [Product("Iphone 15", "Чехол", 1500.0, 2)],
+                            columnar=columnar)
+    return catalog, phones, garden
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_cross_category_queries(columnar, make_products):
+    catalog, phones, garden = make_catalog(make_products, columnar)
+    assert [product.description for product in catalog.find("Iphone 15")] == ["512GB, Gray space", "Чехол"]
+    assert [product.name for product in catalog.cheapest(2)] == ["Газонная трава", "Iphone 15"]
+    assert [product.name for product in catalog.cheapest(1, cls=Smartphone)] == ["Xiaomi Redmi Note 11"]
+    assert [product.name for product in catalog.most_expensive(1)] == ["Iphone 15"]
+    assert [product.name for product in catalog.most_valuable(2)] == ["Iphone 15", "Samsung Galaxy S23 Ultra"]
+    assert catalog.product_count == 5
+    assert catalog.totals.quantity == 49
+    assert catalog.middle_price() == (180000.0 + 210000.0 + 31000.0 + 500.0 + 1500.0) / 5
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_catalog_follows_category_changes(columnar, make_products):
+    catalog, phones, garden = make_catalog(make_products, columnar)
+    phones.add_product(Smartphone("Pixel 8", "128GB", 20000.0, 1, 90.0, "Pixel 8", 128, "Черный"))
+    phones.apply_movements([("Iphone 15", -8)])
+    phones.find("Samsung Galaxy S23 Ultra").price = 100.0
+    garden.find("Газонная трава").name = "Трава"
+    assert catalog.totals == (
+        6, 42, 100.0 + 210000.0 + 31000.0 + 500.0 + 1500.0 + 20000.0,
+        100.0 * 5 + 31000.0 * 14 + 500.0 * 20 + 1500.0 * 2 + 20000.0,
+    )
+    assert [product.name for product in catalog.cheapest(1)] == ["Samsung Galaxy S23 Ultra"]
+    assert catalog.find("Газонная трава") == []
+    assert len(catalog.find("Трава")) == 1
+
+
+def test_remove_category_without_leaking_counts(make_products):
+    catalog, phones, garden = make_catalog(make_products)
+    assert (Category.category_count, Category.product_count) == (2, 5)
+    catalog.remove(phones)
+    assert phones not in catalog and len(catalog) == 1
+    assert (Category.category_count, Category.product_count) == (1, 2)
+    assert catalog.totals == (2, 22, 2000.0, 500.0 * 20 + 1500.0 * 2)
+    assert [product.description for product in catalog.find("Iphone 15")] == ["Чехол"]
+    assert catalog.cheapest(5, cls=Smartphone) == []
+    phones.add_product(Product("Кабель", "USB-C", 100.0, 1))
+    assert catalog.product_count == 2
+    with pytest.raises(KeyError):
+        catalog.remove(phones)
+    catalog.add(phones)
+    assert (Category.category_count, Category.product_count) == (2, 6)
+    assert catalog.product_count == 6
+    with pytest.raises(ValueError):
+        catalog.add(phones)
+    with pytest.raises(TypeError):
+        catalog.add("Смартфоны")
+
+
+def test_catalog_ignores_stale_product_values():
+    catalog = Catalog()
+    stale = Product("Чехол", "Силиконовый", 1000.0, 4)
+    category = catalog.create("Аксессуары", "Описание", [stale], columnar=True)
+    category._Category__products._materialized.pop(0)
+    category.product_at(0).price = 1200.0
+    stale.price = 1100.0
+    stale.name = "Чехол-книжка"
+    assert catalog.totals == (1, 4, 1100.0, 4400.0)
+    assert [product.price for product in catalog.cheapest(1)] == [1100.0]
+    assert catalog.find("Чехол") == []
+    assert [product.name for product in catalog.find("Чехол-книжка")] == ["Чехол-книжка"]
@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+from src.main import Product, Category
+from src.counters import CounterRegistry, ShardedCounter, current_registry, scoped_registry
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def test_sharded_counter_under_threads():
+    counter = ShardedCounter()
+
+    def work():
+        for _ in range(10000):
+            counter.add()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter.value == 80000
+    counter.set(5)
+    counter.add(2)
+    assert counter.value == 7
+
+
+def test_concurrent_add_product_counts():
+    product = Product("Product 1", "Description 1", 100.0, 5)
+
+    def work():
+        category = Category("Test Category", "Test Description")
+        for _ in range(500):
+            category.add_product(product)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert Category.category_count == 4
+    assert Category.product_count == 2000
+
+
+def test_scoped_registry_isolates_counts():
+    Category("Outer", "Description", [Product("Product 1", "Description 1", 100.0, 5)])
+    with scoped_registry() as registry:
+        inner = Category("Inner", "Description")
+        inner.add_product(Product("Product 2", "Description 2", 200.0, 3))
+        inner.add_product(Product("Product 3", "Description 3", 300.0, 2))
+        assert Category.category_count == 1
+        assert Category.product_count == 2
+        assert registry.snapshot() == {"category_count": 1, "product_count": 2}
+    assert Category.category_count == 1
+    assert Category.product_count == 1
+    assert inner.product_count == 2
+
+
+def test_registry_reset():
+    registry = CounterRegistry()
+    with scoped_registry(registry):
+        assert current_registry() is registry
+        Category("Test Category", "Test Description")
+        registry.reset()
+        assert Category.category_count == 0
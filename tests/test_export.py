@@ -0,0 +1,108 @@
+import csv
+import json
+import tracemalloc
+
+import pytest
+from src.export import ExportError, export, extra_columns, read_columnar
+from src.main import Product, Category, Smartphone, LawnGrass
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def make_categories(columnar=False):
+    return [
+        Category("Смартфоны", "Описание", [
+            Smartphone("Samsung Galaxy S23 Ultra", "256GB, Серый цвет", 180000.0, 5, 95.5, "S23 Ultra", 256, "Серый"),
+            Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space"),
+        ], columnar=columnar),
+        Category("Сад", "Описание", [
+            LawnGrass("Газонная трава", "Элитная трава для газона", 500.0, 20, "Россия", "7 дней", "Зеленый"),
+            Product("Лейка", "10 л", 700.0, 3),
+        ], columnar=columnar),
+    ]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_extra_columns(columnar):
+    categories = make_categories(columnar)
+    assert extra_columns(categories) == ("efficiency", "model", "memory", "color", "country", "germination_period")
+    assert extra_columns(categories[1:]) == ("country", "germination_period", "color")
+    assert extra_columns([]) == ()
+
+
+def test_csv_header_ignores_unused_subclasses(tmp_path):
+    class Cable(Product):
+        def __init__(self, name, description, price, quantity, length):
+            super().__init__(name, description, price, quantity)
+            self.length = length
+
+    export(iter(make_categories()), tmp_path / "report.csv")
+    with open(tmp_path / "report.csv", encoding="utf-8", newline="") as file:
+        header = next(csv.reader(file))
+    assert "length" not in header
+    export([Category("Кабели", "Описание", [Cable("USB-C", "1 м", 300.0, 4, 1.0)])], tmp_path / "cables.csv")
+    with open(tmp_path / "cables.csv", encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert rows[0]["length"] == "1.0" and "memory" not in rows[0]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_export_csv(tmp_path, columnar):
+    stats = export(make_categories(columnar), tmp_path / "report.csv")
+    assert (stats.categories, stats.rows) == (2, 4)
+    assert stats.bytes == (tmp_path / "report.csv").stat().st_size
+    with open(tmp_path / "report.csv", encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["record"] for row in rows] == ["product", "product", "summary", "product", "product", "summary"]
+    assert rows[1]["class"] == "Smartphone" and rows[1]["memory"] == "512" and rows[1]["country"] == ""
+    assert rows[3]["germination_period"] == "7 дней"
+    assert rows[2]["summary"] == "Смартфоны, количество продуктов: 13 шт."
+    assert float(rows[2]["middle_price"]) == 195000.0
+    assert rows[5]["stock_value"] == str(500.0 * 20 + 700.0 * 3)
+
+
+def test_export_jsonl_and_columnar_match(tmp_path):
+    categories = make_categories()
+    export(categories, tmp_path / "report.jsonl")
+    stats = export(categories, tmp_path / "report.bin", group_size=1)
+    with open(tmp_path / "report.jsonl", encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+    assert records[0] == {"record": "product", "category": "Смартфоны", "class": "Smartphone",
+                          "name": "Samsung Galaxy S23 Ultra", "description": "256GB, Серый цвет",
+                          "price": 180000.0, "quantity": 5, "efficiency": 95.5, "model": "S23 Ultra",
+                          "memory": 256, "color": "Серый"}
+    assert records[-1]["summary"] == "Сад, количество продуктов: 23 шт."
+    assert list(read_columnar(tmp_path / "report.bin")) == records
+    assert stats.rows == 4 and stats.per_second > 0
+
+
+def test_columnar_errors(tmp_path):
+    export(make_categories(), tmp_path / "report.bin")
+    data = (tmp_path / "report.bin").read_bytes()
+    (tmp_path / "broken.bin").write_bytes(data[:-20])
+    with pytest.raises(ExportError):
+        list(read_columnar(tmp_path / "broken.bin"))
+    (tmp_path / "other.bin").write_bytes(b"not a report")
+    with pytest.raises(ExportError):
+        list(read_columnar(tmp_path / "other.bin"))
+    with pytest.raises(ValueError):
+        export(make_categories(), tmp_path / "report.xml", fmt="xml")
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl", "columnar"])
+def test_export_memory_is_flat(tmp_path, fmt):
+    def peak(size):
+        category = Category("Категория", "Описание",
+                            [Product(f"Товар {i}", "Описание", 100.0, 1) for i in range(size)], columnar=True)
+        tracemalloc.start()
+        try:
+            export([category], tmp_path / f"report.{fmt}", fmt, group_size=1000)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    assert peak(20000) < 2 * peak(2000)
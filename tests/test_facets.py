@@ -0,0 +1,71 @@
+import time
+
+import pytest
+from src.main import Category
+from src.facets import Facet, FacetIndex, iter_rows
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+FACET_PRODUCTS = ("Samsung Galaxy S23 Ultra", "Iphone 15", "Xiaomi Redmi Note 11",
+                  "Газонная трава", "Газонная трава 2", "55\" QLED 4K")
+
+
+def names(products):
+    return [product.name for product in products]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_filter_and_or(columnar, make_products):
+    category = Category("Test Category", "Test Description", make_products(*FACET_PRODUCTS), columnar=columnar)
+    assert names(category.filter(memory=[256, 512])) == ["Samsung Galaxy S23 Ultra", "Iphone 15"]
+    assert names(category.filter(memory=[256, 512], color="Серый")) == ["Samsung Galaxy S23 Ultra"]
+    expression = Facet("country", "США") | (Facet("class", "Smartphone") & Facet("color", "Синий"))
+    assert names(category.filter(expression)) == ["Xiaomi Redmi Note 11", "Газонная трава 2"]
+    assert names(category.filter(Facet("class", "LawnGrass"), limit=1)) == ["Газонная трава"]
+    assert category.filter(color="Фиолетовый") == []
+
+
+def test_facet_counts(make_products):
+    category = Category("Test Category", "Test Description", make_products(*FACET_PRODUCTS))
+    assert category.facet_counts("class") == {"Smartphone": 3, "LawnGrass": 2, "Product": 1}
+    assert category.facet_counts("memory", Facet("color", "Серый") | Facet("color", "Синий")) == {256: 1, 1024: 1}
+    assert category.facet_counts("country", color="Зеленый") == {"Россия": 1}
+
+
+def test_facets_maintained_on_add(make_products):
+    products = make_products(*FACET_PRODUCTS)
+    category = Category("Test Category", "Test Description", products[:2])
+    assert category.facet_counts("color") == {"Серый": 1, "Gray space": 1}
+    category.add_product(products[2])
+    category.add_products(products[3:])
+    assert names(category.filter(memory=1024)) == ["Xiaomi Redmi Note 11"]
+    assert category.facet_counts("country") == {"Россия": 1, "США": 1}
+
+
+def test_unknown_field_and_empty_query():
+    index = FacetIndex()
+    with pytest.raises(KeyError):
+        index.bitmap("weight", 1)
+    with pytest.raises(ValueError):
+        index.select()
+
+
+def test_million_rows_query_is_fast():
+    index = FacetIndex(("color", "memory"))
+    colors = ["Серый", "Синий", "Черный", "Белый"]
+    for row in range(1000000):
+        index.add(row, {"color": colors[row % 4], "memory": 256 if row % 3 else 512})
+    expression = Facet("color", "Серый") | Facet("color", "Синий")
+    index.counts("color", index.select(expression, memory=512))
+    started = time.perf_counter()
+    bitmap = index.select(expression, memory=512)
+    counts = index.counts("color", bitmap)
+    elapsed = time.perf_counter() - started
+    assert counts == {"Серый": 83334, "Синий": 83333}
+    assert next(iter_rows(bitmap)) == 0
+    assert elapsed < 0.05
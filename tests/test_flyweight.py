@@ -0,0 +1,60 @@
+import json
+import pickle
+
+import pytest
+from src.main import Category, Smartphone, LawnGrass
+from src.flyweight import InternPool, colors, models
+from src.storage import ColumnarProducts
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def fresh(value: str) -> str:
+    return json.loads(json.dumps(value))
+
+
+def test_intern_pool():
+    pool = InternPool("test")
+    first = pool.intern(fresh("Серый"))
+    assert pool.intern(fresh("Серый")) is first
+    assert pool.code("Серый") == 0
+    assert pool.code("Синий") == 1
+    assert pool.value(1) == "Синий"
+    assert len(pool) == 2
+    blue = fresh("Синий")
+    assert pool.intern(blue) is pool.value(1) is not blue
+    assert pool.intern(0) == 0 and pool.code(0) == 2
+
+
+def test_subclass_constructors_intern_values():
+    data = {"name": "Iphone 15", "description": "512GB, Gray space", "price": 210000.0, "quantity": 8,
+            "efficiency": 98.2, "model": "15", "memory": 512, "color": "Gray space"}
+    first = Smartphone.new_product(json.loads(json.dumps(data)))
+    second = Smartphone.new_product(json.loads(json.dumps(data)))
+    assert first.color is second.color
+    assert first.model is second.model
+    grass = LawnGrass("Газонная трава", "Элитная трава для газона", 500.0, 20,
+                      fresh("Россия"), fresh("7 дней"), fresh("Gray space"))
+    assert grass.color is first.color
+
+
+def test_columnar_stores_codes():
+    smartphone = Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+    storage = ColumnarProducts([smartphone, smartphone])
+    table = storage._tables[Smartphone]
+    color_column = table.columns[table.fields.index("color")]
+    assert color_column.typecode == "I"
+    assert list(color_column) == [colors.code("Gray space")] * 2
+    assert storage.extra_values(1) == (98.2, "15", 512, "Gray space")
+    assert storage[1].model is models.intern("15")
+
+
+def test_columnar_pickle_keeps_values():
+    grass = LawnGrass("Газонная трава", "Элитная трава для газона", 500.0, 20, "Россия", "7 дней", "Зеленый")
+    storage = pickle.loads(pickle.dumps(ColumnarProducts([grass])))
+    assert storage.extra_values(0) == ("Россия", "7 дней", "Зеленый")
+    assert storage[0].country == "Россия"
@@ -0,0 +1,54 @@
+import pytest
+from src.main import Product, Category
+from src.hooks import INFO, WARNING, product_log
+from src.loader import build_products
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def test_construction_printed_by_default(capsys):
+    Product("Test Product", "Test Description", 100.0, 10)
+    assert capsys.readouterr().out == "Product(Test Product, Test Description, 100.0, 10)\n"
+
+
+def test_quiet_suppresses_output(capsys):
+    with product_log.quiet():
+        product = Product("Test Product", "Test Description", 100.0, 10)
+        product.price = -1
+    assert capsys.readouterr().out == ""
+    assert product_log.construction and product_log.validation
+
+
+def test_collect_validation_events(capsys):
+    with product_log.collect() as events:
+        product = Product("Test Product", "Test Description", 100.0, 10)
+        product.price = 0
+        product.quantity = -3
+    assert capsys.readouterr().out == ""
+    assert [(event.level, event.field, event.value) for event in events] == [
+        (WARNING, "price", 0), (WARNING, "quantity", -3)]
+    assert events[0].product is product
+
+
+def test_custom_handler_and_level():
+    events = []
+    with product_log.configured(events.append, INFO):
+        Product("Test Product", "Test Description", 100.0, 10)
+    assert events[0].kind == "construction"
+    assert events[0].message == "Product(Test Product, Test Description, 100.0, 10)"
+
+
+def test_build_products_reports_failures(capsys):
+    products, failures = build_products([
+        {"name": "Product 1", "description": "Description 1", "price": 100.0, "quantity": 5},
+        {"name": "Product 2", "description": "Description 2", "price": 0, "quantity": 5},
+        {"name": "Product 3", "description": "Description 3", "price": 10.0, "quantity": 0},
+    ])
+    assert capsys.readouterr().out == ""
+    assert [product.name for product in products] == ["Product 1"]
+    assert [(failure.index, failure.name, failure.reason) for failure in failures] == [
+        (1, "Product 2", "цена нулевая или отрицательная"), (2, "Product 3", "нулевое количество")]
@@ -0,0 +1,58 @@
+import pytest
+from src.main import Product, Category
+from src.indexes import KeyIndex, SortedIndex
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def test_sorted_index():
+    index = SortedIndex([(3.0, 0), (1.0, 1), (2.0, 2), (2.0, 3)])
+    assert index.range(2.0, 3.0) == [2, 3, 0]
+    assert index.range(high=1.5) == [1]
+    assert index.smallest(2) == [1, 2]
+    assert index.largest(2) == [0, 3]
+    index.replace(3.0, 0.5, 0)
+    assert index.smallest(1) == [0]
+    with pytest.raises(KeyError):
+        index.remove(3.0, 0)
+    assert index.largest(0) == []
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_category_queries(columnar):
+    product1 = Product("Product 1", "Description 1", 300.0, 1)
+    product2 = Product("Product 2", "Description 2", 100.0, 10)
+    product3 = Product("Product 3", "Description 3", 200.0, 2)
+    category = Category("Test Category", "Test Description", [product1, product2], columnar=columnar)
+    assert [p.name for p in category.cheapest(1)] == ["Product 2"]
+    category.add_product(product3)
+    assert [p.name for p in category.price_range(150.0, 300.0)] == ["Product 3", "Product 1"]
+    assert [p.name for p in category.cheapest(5)] == ["Product 2", "Product 3", "Product 1"]
+    assert [p.name for p in category.most_valuable(2)] == ["Product 2", "Product 3"]
+
+
+def test_category_indexes_follow_changes():
+    product1 = Product("Product 1", "Description 1", 300.0, 1)
+    product2 = Product("Product 2", "Description 2", 100.0, 10)
+    category = Category("Test Category", "Test Description", [product1, product2])
+    assert category.cheapest(1) == [product2]
+    product2.price = 500.0
+    assert category.cheapest(1) == [product1]
+    assert category.price_range(400.0) == [product2]
+    product2.quantity = 1
+    product1.quantity = 5
+    assert category.most_valuable(1) == [product1]
+
+
+def test_key_index_prefers_earlier_rows():
+    index = KeyIndex(["Кабель", "Чехол", "Кабель"])
+    assert index.get("Кабель") == 0
+    index.rekey(0, "Кабель", "Кабель USB")
+    assert index.get("Кабель") == 2
+    index.rekey(2, "Кабель", "Кабель USB")
+    assert index.rows("Кабель USB") == [0, 2]
+    assert index.get("Кабель") is None
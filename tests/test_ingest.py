@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+from src.counters import scoped_registry
+from src.ingest import Ingestion, ingest
+from src.main import Category
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+async def feed(n, prefix="Товар", delay=0):
+    for i in range(n):
+        if delay:
+            await asyncio.sleep(delay)
+        yield {"name": f"{prefix} {i}", "description": "Описание", "price": 100.0 + i, "quantity": 1 + i % 5}
+    yield {"name": "Бракованный", "description": "Описание", "price": -1.0, "quantity": 1}
+
+
+def test_ingest_in_batches():
+    category = Category("Test Category", "Test Description")
+    stats = asyncio.run(ingest(feed(250), category, batch_size=100, queue_size=10))
+    assert (stats.received, stats.loaded, stats.rejected) == (251, 250, 1)
+    assert stats.reasons == {"цена нулевая или отрицательная": 1}
+    assert all(batch.loaded + batch.rejected <= 100 for batch in stats.batches)
+    assert not stats.running
+    assert category.totals.count == 250
+    assert Category.product_count == 250
+
+
+def test_ingest_accepts_plain_iterables_and_merge():
+    records = [{"name": "Кабель", "description": "USB-C", "price": 100.0 + i, "quantity": 1} for i in range(5)]
+    category = Category("Test Category", "Test Description")
+    stats = asyncio.run(ingest(records, category, merge=True))
+    assert stats.loaded == 5
+    assert Category.product_count == 1
+    assert category.find("Кабель").quantity == 5
+
+
+def test_backpressure_and_live_stats():
+    category = Category("Test Category", "Test Description")
+    ingestion = Ingestion(category, batch_size=10, queue_size=5)
+    observed = []
+
+    async def main():
+        task = asyncio.create_task(ingestion.run(feed(200)))
+        while not task.done():
+            observed.append((ingestion.stats.running, ingestion.stats.queued, ingestion.stats.loaded))
+            await asyncio.sleep(0)
+        return await task
+
+    stats = asyncio.run(main())
+    assert stats.loaded == 200
+    assert max(queued for _, queued, _ in observed) <= 5
+    assert any(running and 0 < loaded < 200 for running, _, loaded in observed)
+
+
+def test_concurrent_ingestion_keeps_counters():
+    async def main():
+        categories = [Category(f"Категория {i}", "Описание") for i in range(4)]
+        await asyncio.gather(*(ingest(feed(300, f"Товар {i}", delay=0.0001 * (i % 2)), category, batch_size=64)
+                               for i, category in enumerate(categories)))
+        return categories
+
+    categories = asyncio.run(main())
+    assert [category.totals.count for category in categories] == [300] * 4
+    assert Category.category_count == 4
+    assert Category.product_count == 1200
+
+
+def test_ingestion_in_scoped_registries():
+    async def load(prefix):
+        with scoped_registry():
+            category = Category(prefix, "Описание")
+            await ingest(feed(50, prefix), category, batch_size=8)
+            return Category.product_count, category.product_count
+
+    async def main():
+        return await asyncio.gather(load("А"), load("Б"))
+
+    results = asyncio.run(main())
+    assert results == [(50, 50), (50, 50)]
+    assert Category.product_count == 0
+
+
+def test_source_error_is_raised_after_loading():
+    async def broken():
+        yield {"name": "Кабель", "description": "USB-C", "price": 100.0, "quantity": 1}
+        raise RuntimeError("источник недоступен")
+
+    category = Category("Test Category", "Test Description")
+    with pytest.raises(RuntimeError, match="источник недоступен"):
+        asyncio.run(ingest(broken(), category))
+    assert category.totals.count == 1
+    with pytest.raises(ValueError):
+        Ingestion(category, batch_size=0)
@@ -0,0 +1,96 @@
+import pytest
+from src.main import Product, Category, Smartphone
+from src.instrumentation import instrumentation, profile_run
+from src.loader import build_products, load_records
+from src.schema import schemas
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_leaves_classes_untouched():
+    add_product = Category.__dict__["add_product"]
+    with instrumentation.enabled_scope():
+        assert Category.__dict__["add_product"] is not add_product
+    assert Category.__dict__["add_product"] is add_product
+    assert instrumentation.snapshot()["Category.add_product"]["calls"] == 0
+
+
+def test_counts_entry_points():
+    with instrumentation.enabled_scope():
+        category = Category("Test Category", "Test Description")
+        product = Product.new_product({"name": "Product 1", "description": "Description 1",
+                                       "price": 100.0, "quantity": 5})
+        smartphone = Smartphone.new_product({
+            "name": "Iphone 15", "description": "512GB, Gray space", "price": 210000.0, "quantity": 8,
+            "efficiency": 98.2, "model": "15", "memory": 512, "color": "Gray space"})
+        category.add_product(product)
+        category.add_products([smartphone, product])
+        product.price = 120.0
+        assert category.products
+    metrics = instrumentation.snapshot()
+    assert metrics["Category.add_product"]["calls"] == 1
+    assert metrics["Category.add_products"]["items"] == 2
+    assert metrics["Category.products"]["items"] == 3
+    assert metrics["Product.new_product"]["calls"] == 1
+    assert metrics["Smartphone.new_product"]["calls"] == 1
+    assert metrics["Product.price.setter"]["calls"] == 3
+    assert sum(metrics["Category.add_product"]["histogram"].values()) == 1
+
+
+def test_add_products_accepts_any_iterable():
+    products = [Product(f"Product {i}", "Description", 10.0, 1) for i in range(3)]
+    category = Category("Test Category", "Test Description")
+    with instrumentation.enabled_scope():
+        category.add_products(product for product in products[:2])
+        category.add_products(products=products[2:])
+    assert category.totals.count == 3
+    metric = instrumentation.snapshot()["Category.add_products"]
+    assert (metric["calls"], metric["items"]) == (2, 3)
+
+
+def test_prometheus_export():
+    with instrumentation.enabled_scope():
+        Category("Test Category", "Test Description").add_product(Product("Product 1", "Description 1", 100.0, 5))
+    text = instrumentation.prometheus()
+    assert '# TYPE catalog_latency_seconds histogram' in text
+    assert 'catalog_calls_total{entry="Category.add_product"} 1' in text
+    assert 'catalog_latency_seconds_bucket{entry="Category.add_product",le="+Inf"} 1' in text
+    assert 'catalog_latency_seconds_count{entry="Category.add_product"} 1' in text
+
+
+def test_profile_run():
+    with profile_run() as result:
+        category = Category("Test Category", "Test Description")
+        for i in range(10):
+            category.add_product(Product(f"Product {i}", "Description", 100.0, 1))
+    assert not instrumentation.enabled
+    assert result.metrics["Category.add_product"]["calls"] == 10
+    assert result.peak_bytes > 0
+    assert "add_product" in result.report()
+
+
+def test_counts_schema_builders():
+    build = schemas.schema(Product).build
+    records = [{"name": f"Product {i}", "description": "Description", "price": 10.0, "quantity": i % 3}
+               for i in range(9)]
+    with profile_run(profile=False, trace_memory=False) as result:
+        load_records(records, Category("Test Category", "Test Description"), batch_size=4)
+        build_products(records)
+    assert schemas.schema(Product).build is build
+    assert result.metrics["Product.build"]["calls"] == 18
+    assert result.metrics["Category.add_products"]["items"] == 6
+    assert result.metrics["SchemaRegistry.build_many"]["calls"] == 1
+    assert result.metrics["SchemaRegistry.build_many"]["items"] == 6
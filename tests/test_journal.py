@@ -0,0 +1,109 @@
+import pytest
+from src.journal import Journal, compact, read_journal, replay
+from src.main import Product, Category
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def state(category):
+    return category.products, tuple(category.totals)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_records_changes(columnar, make_products):
+    category = Category("Test Category", "Test Description", make_products()[:2], columnar=columnar)
+    journal = Journal(category)
+    category.add_product(make_products()[2])
+    category.find("Iphone 15").price = 200000.0
+    category.apply_movements([("Газонная трава", -5), ("Газонная трава", -5)])
+    category.find("Iphone 15").name = "Iphone 15 Pro"
+    assert journal.seq == 5
+    assert [(change.seq, change.kind, change.row) for change in journal.changes()] == [
+        (1, "add", 2), (2, "price", 1), (3, "quantity", 2), (4, "quantity", 2), (5, "name", 1),
+    ]
+    assert journal.changes(0)[0].value.name == "Газонная трава"
+    assert [change.value for change in journal.changes(3)] == [10, "Iphone 15 Pro"]
+    with pytest.raises(ValueError):
+        journal.changes(6)
+
+    delta = journal.delta(0)
+    assert delta.seq == 5
+    assert [(change.kind, change.row) for change in delta.changes] == [("add", 2), ("price", 1), ("name", 1)]
+    assert delta.changes[0].value.quantity == 10
+    assert journal.delta(1).changes == [journal.changes()[1], journal.changes()[3], journal.changes()[4]]
+
+    journal.close()
+    category.find("Iphone 15 Pro").quantity = 1
+    assert journal.seq == 5
+
+
+def test_compact_keeps_latest_values(make_products):
+    category = Category("Test Category", "Test Description", make_products())
+    journal = Journal(category, compact_after=10)
+    phone = category.find("Iphone 15")
+    for quantity in range(1, 26):
+        phone.quantity = quantity
+    category.find("Газонная трава").price = 700.0
+    assert len(journal) < 10
+    assert journal.seq == 26
+    journal.compact()
+    assert [(change.seq, change.kind, change.value) for change in journal.changes()] == [
+        (25, "quantity", 25), (26, "price", 700.0),
+    ]
+    assert journal.delta(20).changes == journal.changes()
+    assert journal.delta(25).changes == journal.changes()[1:]
+    assert compact([]) == []
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_replay_onto_snapshot(columnar, make_products):
+    category = Category("Test Category", "Test Description", make_products()[:1], columnar=columnar)
+    journal = Journal(category, compact_after=4)
+    frozen = category.snapshot()
+    seq = journal.seq
+    category.add_products(make_products()[1:])
+    category.apply_movements([("Iphone 15", -3), ("Samsung Galaxy S23 Ultra", 2)])
+    category.find("Газонная трава").price = 600.0
+    category.find("Газонная трава").description = "Трава"
+
+    replayed = replay(frozen, journal.delta(seq).changes)
+    assert replayed.products == category.products
+    assert replayed.totals == pytest.approx(category.totals)
+    assert replayed[2].description == "Трава"
+    assert replay(replayed, journal.changes()).totals == pytest.approx(category.totals)
+    assert frozen.products == "Samsung Galaxy S23 Ultra, 180000.0 руб. Остаток: 5 шт."
+
+
+def test_recovery_from_files(tmp_path, make_products):
+    category = Category("Test Category", "Test Description", make_products(), columnar=True)
+    journal = Journal(category, tmp_path / "journal.jsonl", compact_after=3)
+    seq = journal.seq
+    Category.save_snapshot(tmp_path / "snapshot.bin", [category])
+    category.add_product(Product("Чехол", "Силиконовый", 1000.0, 40))
+    for quantity in (7, 6, 4):
+        category.find("Iphone 15").quantity = quantity
+    category.find("Чехол").price = 1500.0
+    journal.close()
+
+    changes = read_journal(tmp_path / "journal.jsonl", seq)
+    assert len(changes) < 5
+    with Category.load_snapshot(tmp_path / "snapshot.bin") as snapshot:
+        recovered = replay(snapshot[0], changes)
+        assert state(recovered) == state(category)
+        assert recovered.find("Iphone 15").memory == 512
+
+    reopened = Journal(category, tmp_path / "journal.jsonl")
+    assert reopened.seq == journal.seq
+    category.find("Чехол").quantity = 1
+    assert reopened.seq == journal.seq + 1
+    reopened.close()
+    assert read_journal(tmp_path / "journal.jsonl")[-1].value == 1
+
+
+def test_replay_rejects_other_targets():
+    with pytest.raises(TypeError):
+        replay([], [])
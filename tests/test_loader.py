@@ -0,0 +1,81 @@
+import json
+
+import pytest
+from src.main import Product, Category, Smartphone, LawnGrass
+from src.loader import load_file, load_records, product_class, RejectedRecord
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+RECORDS = [
+    {"name": "Samsung Galaxy S23 Ultra", "description": "256GB, Серый цвет, 200MP камера", "price": 180000.0,
+     "quantity": 5, "efficiency": 95.5, "model": "S23 Ultra", "memory": 256, "color": "Серый"},
+    {"name": "Газонная трава", "description": "Элитная трава для газона", "price": 500.0, "quantity": 20,
+     "country": "Россия", "germination_period": "7 дней", "color": "Зеленый"},
+    {"name": "55\" QLED 4K", "description": "Фоновая подсветка", "price": 123000.0, "quantity": 7},
+    {"name": "Бракованный товар", "description": "Неверное количество", "price": 1000.0, "quantity": 0},
+    {"name": "Бесплатный товар", "description": "Неверная цена", "price": -1.0, "quantity": 3},
+    {"name": "Без цены", "description": "Нет поля", "quantity": 3},
+]
+
+
+def test_product_class_detection():
+    assert product_class(RECORDS[0]) is Smartphone
+    assert product_class(RECORDS[1]) is LawnGrass
+    assert product_class(RECORDS[2]) is Product
+    assert product_class({"type": "lawn_grass"}) is LawnGrass
+    with pytest.raises(RejectedRecord):
+        product_class({"type": "unknown"})
+
+
+def test_load_records_in_batches():
+    category = Category("Test Category", "Test Description")
+    report = load_records(iter(RECORDS), category, batch_size=2)
+    assert report.loaded == 3
+    assert report.rejected == 3
+    assert report.reasons["нулевое количество"] == 1
+    assert report.reasons["цена нулевая или отрицательная"] == 1
+    assert [(batch.loaded, batch.rejected) for batch in report.batches] == [(2, 0), (1, 1), (0, 2)]
+    assert all(batch.per_second >= 0 for batch in report.batches)
+    assert Category.product_count == 3
+    assert str(category) == "Test Category, количество продуктов: 32 шт."
+
+
+def test_load_jsonl_file(tmp_path):
+    path = tmp_path / "feed.jsonl"
+    path.write_text("\n".join(json.dumps(record, ensure_ascii=False) for record in RECORDS) + "\n{broken\n",
+                    encoding="utf-8")
+    category = Category("Test Category", "Test Description", columnar=True)
+    report = load_file(path, category, batch_size=100)
+    assert report.loaded == 3
+    assert report.rejected == 4
+    assert len(report.batches) == 1
+    assert category.middle_price() == (180000.0 + 500.0 + 123000.0) / 3
+
+
+def test_load_csv_file(tmp_path):
+    path = tmp_path / "feed.csv"
+    path.write_text(
+        "name,description,price,quantity,efficiency,model,memory,color\n"
+        "Iphone 15,\"512GB, Gray space\",210000.0,8,98.2,15,512,Gray space\n"
+        "Xiaomi Redmi Note 11,\"1024GB, Синий\",abc,14,90.0,Note 11,1024,Синий\n",
+        encoding="utf-8")
+    category = Category("Test Category", "Test Description")
+    report = load_file(path, category)
+    assert report.loaded == 1
+    assert report.rejected == 1
+    smartphone = category._Category__products[0]
+    assert isinstance(smartphone, Smartphone)
+    assert smartphone.memory == 512
+    assert smartphone.price == 210000.0
+
+
+def test_add_products_type_check():
+    category = Category("Test Category", "Test Description")
+    with pytest.raises(TypeError):
+        category.add_products([Product("Product 1", "Description 1", 100.0, 5), "Not a Product"])
+    assert Category.product_count == 0
@@ -1,10 +1,15 @@
 import pytest
-from src.main import Product, Category
 from src.main import Product, Category, Smartphone, LawnGrass
 
 @pytest.fixture(autouse=True)
 def reset_counters():
-@@ -13,21 +13,301 @@ def test_product_initialization():
+    Category.category_count = 0
+    Category.product_count = 0
+
+def test_product_initialization():
+    product = Product("Test Product", "Test Description", 100.0, 10)
+    assert product.name == "Test Product"
+    assert product.description == "Test Description"
     assert product.price == 100.0
     assert product.quantity == 10
 
@@ -47,9 +52,6 @@ def test_lawn_grass_initialization():
     assert lawn_grass.color == "Зеленый"
 
 def test_category_initialization():
-    product1 = Product("Product 1", "Description 1", 100.0, 5)
-    product2 = Product("Product 2", "Description 2", 200.0, 3)
-    category = Category("Test Category", "Test Description", [product1, product2])
     smartphone1 = Smartphone(
         "Samsung Galaxy S23 Ultra",
         "256GB, Серый цвет, 200MP камера",
@@ -73,7 +75,6 @@ def test_category_initialization():
     category = Category("Test Category", "Test Description", [smartphone1, smartphone2])
     assert category.name == "Test Category"
     assert category.description == "Test Description"
-    assert len(category.products) == 2
     assert len(category._Category__products) == 2
     assert Category.category_count == 1
     assert Category.product_count == 2
@@ -167,11 +168,6 @@ def test_price_setter():
     assert smartphone.price == 200000.0
 
 def test_multiple_categories():
-    product1 = Product("Product 1", "Description 1", 100.0, 5)
-    product2 = Product("Product 2", "Description 2", 200.0, 3)
-    product3 = Product("Product 3", "Description 3", 300.0, 2)
-    category1 = Category("Category 1", "Description 1", [product1, product2])
-    category2 = Category("Category 2", "Description 2", [product3])
     smartphone1 = Smartphone(
         "Samsung Galaxy S23 Ultra",
         "256GB, Серый цвет, 200MP камера",
@@ -205,7 +201,6 @@ def test_multiple_categories():
     category2 = Category("Category 2", "Description 2", [lawn_grass])
     assert Category.category_count == 2
     assert Category.product_count == 3
-    assert Category.product_count == 3
 
 def test_product_str():
     smartphone = Smartphone(
@@ -316,3 +311,24 @@ def test_middle_price():
 def test_middle_price_empty_category():
     category = Category("Empty Category", "Test Description", [])
     assert category.middle_price() == 0
+
+def test_quantity_setter():
+    product = Product("Test Product", "Test Description", 100.0, 10)
+    product.quantity = 0
+    assert product.quantity == 0
+    product.quantity = -5
+    assert product.quantity == 0
+
+def test_category_totals_follow_product_changes():
+    product1 = Product("Product 1", "Description 1", 100.0, 5)
+    product2 = Product("Product 2", "Description 2", 200.0, 3)
+    category = Category("Test Category", "Test Description", [product1])
+    category.add_product(product2)
+    assert category.totals == (2, 8, 300.0, 1100.0)
+    product1.price = 300.0
+    product2.quantity = 10
+    assert str(category) == "Test Category, количество продуктов: 15 шт."
+    assert category.middle_price() == (300.0 + 200.0) / 2
+    assert category.totals.stock_value == 300.0 * 5 + 200.0 * 10
+    product1.price = -1
+    assert category.middle_price() == (300.0 + 200.0) / 2
@@ -0,0 +1,65 @@
+import pytest
+from src.main import Product, Category, Smartphone
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def phone(name, price, quantity, color="Серый"):
+    return Smartphone(name, "256GB", price, quantity, 95.5, "S23 Ultra", 256, color)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_add_product_merges_duplicates(columnar):
+    category = Category("Test Category", "Test Description", [phone("Galaxy", 180000.0, 5)], columnar=columnar)
+    category.add_product(phone("Galaxy", 170000.0, 3), merge=True)
+    category.add_product(phone("Galaxy", 190000.0, 2), merge=True)
+    category.add_product(phone("Galaxy", 150000.0, 1))
+    assert Category.product_count == 2
+    assert category.totals.count == 2
+    assert category.totals.quantity == 11
+    galaxy = category.find("Galaxy")
+    assert (galaxy.price, galaxy.quantity) == (190000.0, 10)
+    assert category.middle_price() == (190000.0 + 150000.0) / 2
+    assert category.most_valuable(1) == [galaxy]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_add_products_merges_in_one_pass(columnar):
+    products = [Product(f"Товар {i % 100}", "Описание", 100.0 + i, 1) for i in range(1000)]
+    category = Category("Test Category", "Test Description", columnar=columnar)
+    category.add_products(products, merge=True)
+    assert Category.product_count == 100
+    assert category.totals.quantity == 1000
+    assert category.find("Товар 7").price == 100.0 + 907
+    assert category.find("Товар 7").quantity == 10
+
+
+def test_merge_by_configurable_key():
+    category = Category("Test Category", "Test Description", [phone("Galaxy", 180000.0, 5)])
+    category.add_products([phone("Galaxy", 180000.0, 1, "Черный"), phone("Galaxy", 180000.0, 2)],
+                          merge=True, key=("name", "color"))
+    assert Category.product_count == 2
+    assert category.totals.quantity == 8
+    category.find("Galaxy").name = "Galaxy S23"
+    category.add_product(phone("Galaxy S23", 180000.0, 4), merge=True, key=("name", "color"))
+    assert Category.product_count == 2
+    assert category.find("Galaxy S23").quantity == 11
+    with pytest.raises(ValueError):
+        category.add_product(phone("Galaxy", 1.0, 1), merge=True, key=())
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_missing_key_field_is_never_a_duplicate(columnar):
+    category = Category("Test Category", "Test Description", columnar=columnar)
+    category.add_products([Product("a", "Описание", 100.0, 5), Product("b", "Описание", 200.0, 3)],
+                          merge=True, key="model")
+    category.add_product(Product("c", "Описание", 300.0, 1), merge=True, key=("name", "model"))
+    category.add_products([phone("Galaxy", 180000.0, 1), phone("Galaxy", 180000.0, 2)], merge=True, key="model")
+    assert Category.product_count == 4
+    assert category.products.splitlines()[:2] == ["a, 100.0 руб. Остаток: 5 шт.", "b, 200.0 руб. Остаток: 3 шт."]
+    assert category.totals.quantity == 12
+    assert len(category._key_index(("model",))) == 1
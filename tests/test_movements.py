@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+from src.main import Product, Category
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_apply_movements(columnar, make_products):
+    category = Category("Test Category", "Test Description", make_products(), columnar=columnar)
+    report = category.apply_movements([
+        ("Iphone 15", -3),
+        ("Газонная трава", 10),
+        ("Нет такого", 1),
+        ("Samsung Galaxy S23 Ultra", -6),
+        ("Samsung Galaxy S23 Ultra", -5),
+        ("Iphone 15", 1.5),
+    ])
+    assert report.applied == 3
+    assert [(rejected.index, rejected.reason) for rejected in report.rejected] == [
+        (2, "товар не найден"),
+        (3, "остаток не может стать отрицательным"),
+        (5, "изменение остатка должно быть целым числом"),
+    ]
+    assert category.find("Iphone 15").quantity == 5
+    assert category.find("Газонная трава").quantity == 30
+    assert category.find("Samsung Galaxy S23 Ultra").quantity == 0
+    assert category.totals.quantity == 35
+    assert category.totals.stock_value == 210000.0 * 5 + 500.0 * 30
+    assert category.most_valuable(1)[0].name == "Iphone 15"
+    assert Category.product_count == 3
+
+
+def test_movements_reach_materialized_products(make_products):
+    category = Category("Test Category", "Test Description", make_products(), columnar=True)
+    iphone = category.find("Iphone 15")
+    seen = []
+    iphone.subscribe(lambda product, field, old, new: seen.append((field, old, new)))
+    category.apply_movements([("Iphone 15", 2)])
+    assert iphone.quantity == 10
+    assert seen == [("quantity", 8, 10)]
+    assert "Iphone 15, 210000.0 руб. Остаток: 10 шт." in category.products
+
+
+def test_find_follows_renames_and_additions(make_products):
+    category = Category("Test Category", "Test Description", make_products())
+    assert category.find("Iphone 16") is None
+    category.find("Iphone 15").name = "Iphone 16"
+    assert category.find("Iphone 15") is None
+    category.add_product(Product("Iphone 15", "Восстановленный", 90000.0, 1))
+    assert category.find("Iphone 15").description == "Восстановленный"
+    assert category.find("Iphone 16").quantity == 8
+
+
+def test_concurrent_readers_see_consistent_totals():
+    products = [Product(f"Товар {i}", "Описание", 10.0, 100) for i in range(100)]
+    category = Category("Test Category", "Test Description", products, columnar=True)
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        while not stop.is_set():
+            count, quantity, price_sum, stock_value = category.totals
+            if stock_value != 10.0 * quantity:
+                errors.append((quantity, stock_value))
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for _ in range(20):
+        category.apply_movements([(f"Товар {i}", -1) for i in range(100)])
+    stop.set()
+    for reader in readers:
+        reader.join()
+    assert errors == []
+    assert category.totals.quantity == 8000
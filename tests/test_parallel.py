@@ -0,0 +1,90 @@
+import pickle
+from array import array
+
+import pytest
+from src.main import Product, Category, Smartphone
+from src.loader import load_records
+from src.parallel import build_category_parallel
+from src.storage import _ExtraTable
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def make_records(n):
+    records = []
+    for i in range(n):
+        record = {"name": f"Product {i}", "description": f"Description {i % 7}", "price": float(i % 50),
+                  "quantity": i % 9}
+        if i % 3 == 0:
+            record.update(efficiency=90.0, model=f"Model {i % 4}", memory=256, color="Серый")
+        records.append(record)
+    return records
+
+
+def test_parallel_build_matches_sequential():
+    records = make_records(300)
+    sequential = Category("Sequential", "Description", columnar=True)
+    load_records(records, sequential)
+    Category.category_count = 0
+    Category.product_count = 0
+
+    category, report = build_category_parallel(records, "Parallel", "Description", workers=2, chunk_size=40)
+    assert len(report.batches) == 8
+    assert report.loaded == sequential.totals.count
+    assert report.rejected == 300 - sequential.totals.count
+    assert category.products == sequential.products
+    assert category.totals.quantity == sequential.totals.quantity
+    assert category.middle_price() == pytest.approx(sequential.middle_price())
+    assert Category.category_count == 1
+    assert Category.product_count == sequential.totals.count
+    assert isinstance(category._Category__products[2], Smartphone)
+
+
+def test_merge_categories():
+    first = Category("First", "Description", [Product("Product 1", "Description 1", 100.0, 5)], columnar=True)
+    second = Category("Second", "Description", [Product("Product 2", "Description 2", 200.0, 3)], columnar=True)
+    plain = Category("Plain", "Description", [Product("Product 3", "Description 3", 300.0, 2)])
+    assert first.cheapest(1)[0].name == "Product 1"
+    first.merge(second)
+    first.merge(plain)
+    assert first.products.split("\n")[1:] == [second.products, plain.products]
+    assert str(first) == "First, количество продуктов: 10 шт."
+    assert first.middle_price() == 200.0
+    assert [p.name for p in first.price_range(150.0)] == ["Product 2", "Product 3"]
+    assert Category.product_count == 5
+    with pytest.raises(ValueError):
+        first.merge(first)
+    with pytest.raises(ValueError):
+        plain.merge(plain)
+
+
+def test_merge_keeps_extra_columns():
+    def phones(*pairs):
+        return [Smartphone(name, "256GB", 100.0, 1, 95.5, "S23", 256, color) for name, color in pairs]
+
+    first = Category("First", "Description", phones(("a", "Серый"), ("b", "Синий")), columnar=True)
+    second = Category("Second", "Description", [Product("c", "Описание", 1.0, 1)] + phones(("d", "Черный")),
+                      columnar=True)
+    first.merge(second)
+    first._merge_storage(pickle.loads(pickle.dumps(second._Category__products)), second.totals)
+    assert [(p.name, p.color) for p in first.filter(color=["Черный", "Синий"])] == [
+        ("b", "Синий"), ("d", "Черный"), ("d", "Черный")]
+    assert first.product_at(5).model == "S23"
+    assert first.product_at(4).name == "c"
+
+
+def test_extra_table_pickle_remaps_pool_codes():
+    table = _ExtraTable(Smartphone)
+    table.append((95.5, "S23", 256, "Серый"))
+    state = table.__getstate__()
+    # Порция из другого процесса: там у значения другой код пула
+    color = table.fields.index("color")
+    state["columns"][color] = array("I", [0])
+    state["pools"][color] = ["Цвет из другого процесса"]
+    restored = _ExtraTable.__new__(_ExtraTable)
+    restored.__setstate__(state)
+    assert restored.values(0) == (95.5, "S23", 256, "Цвет из другого процесса")
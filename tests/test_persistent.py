@@ -0,0 +1,96 @@
+import random
+import threading
+
+import pytest
+from src.main import Product, Category, Smartphone
+from src.persistent import PersistentVector
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+def test_persistent_vector_shares_old_versions():
+    rng = random.Random(0)
+    vector = PersistentVector()
+    expected = []
+    versions = []
+    for i in range(5000):
+        vector = vector.append(i)
+        expected.append(i)
+        if rng.random() < 0.3:
+            row = rng.randrange(len(expected))
+            vector = vector.set(row, -i)
+            expected[row] = -i
+        if i % 499 == 0:
+            versions.append((vector, list(expected)))
+    assert list(vector) == expected
+    assert [vector[i] for i in range(len(expected))] == expected
+    assert all(list(version) == items for version, items in versions)
+
+
+@pytest.mark.parametrize("size", [0, 1, 32, 33, 1056, 1057, 32 * 32 * 32 + 5])
+def test_persistent_vector_bulk_build(size):
+    vector = PersistentVector(range(size))
+    assert len(vector) == size
+    vector = vector.append(size)
+    assert list(vector) == list(range(size + 1))
+    assert vector[-1] == size
+    with pytest.raises(IndexError):
+        vector[size + 1]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_snapshot_is_point_in_time(columnar):
+    products = [
+        Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space"),
+        Product("55\" QLED 4K", "Фоновая подсветка", 123000.0, 7),
+    ]
+    category = Category("Телевизоры", "Описание", products, columnar=columnar)
+    before = category.snapshot()
+    assert category.snapshot() is before
+    category.add_product(Product("Кабель", "USB-C", 1000.0, 3))
+    category.apply_movements([("Iphone 15", -2)])
+    after = category.snapshot()
+    assert (len(before), before.totals.quantity, str(before)) == (2, 15, "Телевизоры, количество продуктов: 15 шт.")
+    assert before.products == "Iphone 15, 210000.0 руб. Остаток: 8 шт.\n55\" QLED 4K, 123000.0 руб. Остаток: 7 шт."
+    assert before.middle_price() == (210000.0 + 123000.0) / 2
+    assert (len(after), after.totals.quantity) == (3, 16)
+    assert after.products == category.products
+    phone = before[0]
+    assert (type(phone), phone.quantity, phone.color) == (Smartphone, 8, "Gray space")
+
+
+def test_snapshots_under_concurrent_writers():
+    category = Category("Test Category", "Test Description",
+                        [Product(f"Товар {i}", "Описание", 10.0, 100) for i in range(100)], columnar=True)
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        while not stop.is_set():
+            frozen = category.snapshot()
+            count, quantity, price_sum, _ = frozen.totals
+            rows = list(frozen._rows)
+            if len(rows) != count or sum(row.quantity for row in rows) != quantity or price_sum != 10.0 * count:
+                errors.append(frozen.totals)
+
+    def write(worker):
+        for i in range(200):
+            category.add_product(Product(f"Новый {worker} {i}", "Описание", 10.0, 1))
+            category.apply_movements([(f"Товар {i % 100}", 1 if worker else -1)])
+
+    readers = [threading.Thread(target=read) for _ in range(8)]
+    writers = [threading.Thread(target=write, args=(worker,)) for worker in range(2)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+    assert errors == []
+    assert category.snapshot().totals == category.totals
+    assert category.snapshot().totals.count == 500
@@ -0,0 +1,126 @@
+import random
+
+import pytest
+from src.flyweight import colors, memory_sizes, models
+from src.hooks import product_log
+from src.main import Product, Category, Smartphone, LawnGrass
+from src.schema import Field, RejectedRecord, SchemaRegistry, declared_fields, schemas
+from src.slotted import SlottedSmartphone
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+SMARTPHONE = {"name": "Iphone 15", "description": "512GB, Gray space", "price": 210000.0, "quantity": 8,
+              "efficiency": 98.2, "model": "15", "memory": 512, "color": "Gray space"}
+GRASS = {"name": "Газонная трава", "description": "Элитная трава для газона", "price": 500.0, "quantity": 20,
+         "country": "Россия", "germination_period": "7 дней", "color": "Зеленый"}
+
+
+def state(product):
+    return type(product), vars(product)
+
+
+def test_declared_fields():
+    assert declared_fields(Smartphone)[4:] == (
+        Field("efficiency", float, None), Field("model", None, models),
+        Field("memory", int, memory_sizes), Field("color", None, colors),
+    )
+    assert [field.name for field in declared_fields(Product)] == ["name", "description", "price", "quantity"]
+
+
+def test_compiled_constructor_matches_new_product():
+    for cls, record in ((Smartphone, SMARTPHONE), (LawnGrass, GRASS), (Product, SMARTPHONE)):
+        with product_log.collect(level=0) as compiled_events:
+            compiled = schemas.schema(cls).build(record)
+        with product_log.collect(level=0) as regular_events:
+            regular = cls.new_product(record)
+        assert state(compiled) == state(regular)
+        assert [event.message for event in compiled_events] == [event.message for event in regular_events]
+    assert schemas.schema(Smartphone).build(SMARTPHONE).model is models.intern("15")
+
+
+def mutate(rng, record):
+    record = dict(record)
+    field = rng.choice(list(record))
+    action = rng.randrange(5)
+    if action == 0:
+        del record[field]
+    elif action == 1:
+        record[field] = rng.choice([0, -1, 0.0, "abc", "12", None, [], "0"])
+    elif action == 2:
+        record["price"] = rng.choice([0, -5.0, "0", "1e3", None, "x"])
+    elif action == 3:
+        record["quantity"] = rng.choice([0, "0", -3, "7", 2.5, None])
+    return record
+
+
+def test_bulk_mode_gives_same_validation_results():
+    rng = random.Random(1)
+    records = [mutate(rng, rng.choice([SMARTPHONE, GRASS])) for _ in range(2000)] + ["не словарь", None]
+    generic = SchemaRegistry()
+    for name, cls in schemas.types.items():
+        generic.register(cls, name, compiled=False)
+    fast_products, fast_failures = schemas.build_many(records)
+    slow_products, slow_failures = generic.build_many(records)
+    assert fast_failures == slow_failures
+    assert [state(product) for product in fast_products] == [state(product) for product in slow_products]
+    reasons = {failure.reason for failure in fast_failures}
+    assert {"нулевое количество", "цена нулевая или отрицательная", "некорректная запись"} <= reasons
+    for record in records[:200]:
+        try:
+            expected = state(generic.build(record))
+        except RejectedRecord as e:
+            with pytest.raises(RejectedRecord, match=str(e)):
+                schemas.build(record)
+        else:
+            assert state(schemas.build(record)) == expected
+
+
+def test_register_new_subclass():
+    class Headphones(Product):
+        def __init__(self, name: str, description: str, price: float, quantity: int, wireless: int):
+            super().__init__(name, description, price, quantity)
+            self.wireless = wireless
+
+    registry = SchemaRegistry()
+    registry.register(Product, "product")
+    registry.register(Headphones, "headphones")
+    record = {"type": "headphones", "name": "AirPods", "description": "Pro", "price": "20000", "quantity": 3,
+              "wireless": "1"}
+    products, failures = registry.build_many([record, dict(record, quantity="0")])
+    assert [(type(product), product.price, product.wireless) for product in products] == [(Headphones, 20000.0, 1)]
+    assert [failure.reason for failure in failures] == ["нулевое количество"]
+    assert not registry.schema(Headphones).compiled
+    assert registry.register(Headphones, "headphones", compiled=True).compiled
+    assert registry.build(record).wireless == 1
+
+
+def test_custom_init_is_not_skipped():
+    class Cable(Product):
+        def __init__(self, name: str, description: str, price: float, quantity: int, sku: str):
+            if not sku.isalnum():
+                raise ValueError("Артикул должен состоять из букв и цифр")
+            super().__init__(name, description, price, quantity)
+            self.sku = sku.upper()
+
+    registry = SchemaRegistry()
+    registry.register(Product, "product")
+    registry.register(Cable, "cable")
+    record = {"type": "cable", "name": "USB-C", "description": "1 м", "price": 300.0, "quantity": 4, "sku": "xyz"}
+    assert registry.build(record).sku == "XYZ"
+    with pytest.raises(RejectedRecord, match="Артикул"):
+        registry.build(dict(record, sku="x-1"))
+    assert registry.schema(Product).compiled and registry.schema(SlottedSmartphone).compiled is False
+    assert schemas.schema(SlottedSmartphone).compiled
+
+
+def test_slotted_classes_are_compiled():
+    product = schemas.schema(SlottedSmartphone).build(SMARTPHONE)
+    assert not hasattr(product, "__dict__")
+    category = Category("Test Category", "Test Description", [product])
+    product.quantity = 10
+    assert category.totals.quantity == 10
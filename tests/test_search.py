@@ -0,0 +1,91 @@
+import pytest
+from src.main import Product, Category
+from src.search import TextIndex, tokenize, trigrams
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+SEARCH_PRODUCTS = ("Samsung Galaxy S23 Ultra", "Iphone 15", "Xiaomi Redmi Note 11", "Газонная трава", "55\" QLED 4K")
+
+
+def names(page):
+    return [product.name for product, _ in page.hits]
+
+
+def test_tokenize():
+    assert tokenize("256GB, Серый цвет, 200MP камера") == ["256gb", "серый", "цвет", "200mp", "камера"]
+    assert tokenize("ЁЛКА Ёлка") == ["елка", "елка"]
+    assert tokenize("ＱＬＥＤ") == ["qled"]
+    assert trigrams("газон") == {"газ", "азо", "зон"}
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_search_exact_and_ranking(columnar, make_products):
+    category = Category("Test Category", "Test Description", make_products(*SEARCH_PRODUCTS), columnar=columnar)
+    assert names(category.search("серый")) == ["Samsung Galaxy S23 Ultra"]
+    assert names(category.search("SAMSUNG цвет")) == ["Samsung Galaxy S23 Ultra"]
+    assert names(category.search("samsung iphone")) == []
+    assert names(category.search("трава")) == ["Газонная трава"]
+    assert category.search("").total == 0
+
+
+def test_search_partial(make_products):
+    category = Category("Test Category", "Test Description", make_products(*SEARCH_PRODUCTS))
+    assert names(category.search("газон")) == []
+    assert names(category.search("газон", partial=True)) == ["Газонная трава"]
+    assert names(category.search("sung", partial=True)) == ["Samsung Galaxy S23 Ultra"]
+    assert names(category.search("xi", partial=True)) == []
+
+
+def test_name_weighs_more_than_description():
+    products = [
+        Product("Чехол", "Подходит для Iphone", 1000.0, 1),
+        Product("Iphone 15", "Смартфон", 100000.0, 1),
+    ]
+    category = Category("Test Category", "Test Description", products)
+    page = category.search("iphone")
+    assert names(page) == ["Iphone 15", "Чехол"]
+    assert page.hits[0][1] > page.hits[1][1]
+
+
+def test_search_pagination():
+    products = [Product(f"Кабель {i}", "USB-C", 100.0 + i, 1) for i in range(5)]
+    category = Category("Test Category", "Test Description", products)
+    first = category.search("кабель", size=2)
+    assert first.total == 5 and first.next_cursor == 2
+    second = category.search("кабель", cursor=first.next_cursor, size=2)
+    last = category.search("кабель", cursor=second.next_cursor, size=2)
+    assert last.next_cursor is None
+    assert names(first) + names(second) + names(last) == [f"Кабель {i}" for i in range(5)]
+    with pytest.raises(ValueError):
+        category.search("кабель", size=0)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_index_follows_edits_and_additions(columnar, make_products):
+    category = Category("Test Category", "Test Description", make_products(*SEARCH_PRODUCTS), columnar=columnar)
+    page = category.search("iphone")
+    assert names(page) == ["Iphone 15"]
+    product = page.hits[0][0]
+    product.name = "Apple Iphone 15"
+    product.description = "Черный"
+    assert names(category.search("apple")) == ["Apple Iphone 15"]
+    assert names(category.search("gray")) == []
+    assert names(category.search("черный")) == ["Apple Iphone 15"]
+    category.add_product(Product("Apple Watch", "Часы", 40000.0, 3))
+    assert names(category.search("apple")) == ["Apple Iphone 15", "Apple Watch"]
+    category.merge(Category("Other", "Other", [Product("Apple TV", "Приставка", 20000.0, 1)]))
+    assert category.search("apple").total == 3
+
+
+def test_text_index_drops_unused_tokens():
+    index = TextIndex()
+    index.add(0, {"name": "Газонная трава", "description": "Элитная"})
+    index.update(0, "description", "Элитная", "Выносливая")
+    assert index.search("элитная").total == 0
+    assert index.search("элит", partial=True).total == 0
+    assert index.search("вынос", partial=True).total == 1
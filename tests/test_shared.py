@@ -0,0 +1,148 @@
+import multiprocessing
+import uuid
+
+import pytest
+from src.main import Product, Category, Smartphone
+from src.shared import SharedCategory, SharedTableError
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+@pytest.fixture
+def table_name():
+    return f"catstock-{uuid.uuid4().hex[:12]}"
+
+
+def make_category(make_products, columnar=False):
+    products = make_products("Samsung Galaxy S23 Ultra", "Iphone 15", "Газонная трава", "Чехол")
+    return Category("Смартфоны", "Категория смартфонов", products, columnar=columnar)
+
+
+def _worker(name, rounds, results):
+    category = SharedCategory.attach(name)
+    try:
+        report = category.apply_movements([("Iphone 15", 1), ("Газонная трава", -1)] * rounds)
+        results.put(report.applied)
+    finally:
+        category.close()
+
+
+def _merge_worker(name, rounds, results):
+    category = SharedCategory.attach(name)
+    try:
+        for i in range(rounds):
+            category.add_product(Product("Чехол", "Силиконовый", 1000.0 + i, 1), merge=True)
+        results.put(rounds)
+    finally:
+        category.close()
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_attach_reads_through(table_name, columnar, make_products):
+    source = make_category(make_products, columnar)
+    owner = SharedCategory.create(table_name, source)
+    worker = SharedCategory.attach(table_name)
+    try:
+        assert worker.name == "Смартфоны"
+        assert str(worker) == str(source)
+        assert worker.middle_price() == source.middle_price()
+        assert worker.products == source.products
+
+        phone = worker.find("Iphone 15")
+        assert type(phone).__name__ == "Smartphone"
+        assert isinstance(phone, Smartphone)
+        assert phone.memory == 512
+
+        owner.find("Iphone 15").quantity = 3
+        assert phone.quantity == 3
+        assert str(worker) == "Смартфоны, количество продуктов: 68 шт."
+        assert "Iphone 15, 210000.0 руб. Остаток: 3 шт." in worker.products
+
+        worker.find("Чехол").price = 2000.0
+        assert owner.find("Чехол").price == 2000.0
+        assert owner.middle_price() == (180000.0 + 210000.0 + 500.0 + 2000.0) / 4
+        assert owner.totals == worker.totals
+        assert owner.totals.stock_value == 180000.0 * 5 + 210000.0 * 3 + 500.0 * 20 + 2000.0 * 40
+    finally:
+        worker.close()
+        owner.unlink()
+
+
+def test_movements_and_indexes(table_name, make_products):
+    owner = SharedCategory.create(table_name, make_category(make_products))
+    worker = SharedCategory.attach(table_name)
+    try:
+        assert [product.name for product in worker.cheapest(1)] == ["Газонная трава"]
+        report = owner.apply_movements([("Газонная трава", -20), ("Чехол", -41), ("Iphone 15", 2)])
+        assert report.applied == 2
+        assert [rejected.name for rejected in report.rejected] == ["Чехол"]
+        assert worker.find("Газонная трава").quantity == 0
+        owner.find("Газонная трава").price = 900000.0
+        assert [product.name for product in worker.most_valuable(1)] == ["Iphone 15"]
+        assert [product.name for product in worker.cheapest(1)] == ["Чехол"]
+    finally:
+        worker.close()
+        owner.unlink()
+
+
+def test_fixed_size(table_name, make_products):
+    owner = SharedCategory.create(table_name, make_category(make_products))
+    try:
+        assert Category.product_count == 8
+        with pytest.raises(TypeError):
+            owner.add_product(Product("Новый", "Описание", 10.0, 1))
+        owner.add_product(Product("Чехол", "Силиконовый", 1500.0, 10), merge=True)
+        assert owner.find("Чехол").quantity == 50
+        assert owner.find("Чехол").price == 1500.0
+        assert owner.totals.count == 4
+    finally:
+        owner.unlink()
+    with pytest.raises(SharedTableError):
+        SharedCategory.attach(table_name)
+
+
+def test_processes_share_stock(table_name, make_products):
+    owner = SharedCategory.create(table_name, make_category(make_products, columnar=True), stripes=4)
+    results = multiprocessing.Queue()
+    rounds = 10
+    workers = [multiprocessing.Process(target=_worker, args=(table_name, rounds, results)) for _ in range(4)]
+    try:
+        for process in workers:
+            process.start()
+        applied = [results.get(timeout=60) for _ in workers]
+        for process in workers:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+        # Трава кончается после 20 списаний, остальные отклоняются
+        assert sum(applied) == 4 * rounds + 20
+        assert owner.find("Iphone 15").quantity == 8 + 4 * rounds
+        assert owner.find("Газонная трава").quantity == 0
+        assert owner.totals.quantity == 5 + 8 + 4 * rounds + 40
+        assert owner.totals.stock_value == 180000.0 * 5 + 210000.0 * (8 + 4 * rounds) + 1000.0 * 40
+    finally:
+        owner.unlink()
+
+
+def test_processes_merge_duplicates_atomically(table_name, make_products):
+    owner = SharedCategory.create(table_name, make_category(make_products, columnar=True), stripes=4)
+    results = multiprocessing.Queue()
+    rounds = 50
+    workers = [multiprocessing.Process(target=_merge_worker, args=(table_name, rounds, results)) for _ in range(4)]
+    try:
+        for process in workers:
+            process.start()
+        assert sum(results.get(timeout=60) for _ in workers) == 4 * rounds
+        for process in workers:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+        assert owner.find("Чехол").quantity == 40 + 4 * rounds
+        assert owner.find("Чехол").price == 1000.0 + rounds - 1
+        assert owner.totals.quantity == 5 + 8 + 20 + 40 + 4 * rounds
+        assert owner.totals.stock_value == (180000.0 * 5 + 210000.0 * 8 + 500.0 * 20
+                                            + (1000.0 + rounds - 1) * (40 + 4 * rounds))
+    finally:
+        owner.unlink()
@@ -0,0 +1,65 @@
+import pytest
+from src.main import Product, Category, Smartphone, LawnGrass
+from src.loader import load_records
+from src.slotted import SLOTTED_TYPES, SlottedLawnGrass, SlottedProduct, SlottedSmartphone
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+@pytest.fixture
+def smartphone():
+    return SlottedSmartphone("Samsung Galaxy S23 Ultra", "256GB, Серый цвет, 200MP камера", 180000.0, 5,
+                             95.5, "S23 Ultra", 256, "Серый")
+
+
+def test_slotted_has_no_dict(smartphone):
+    assert not hasattr(smartphone, "__dict__")
+    with pytest.raises(AttributeError):
+        smartphone.unknown = 1
+
+
+def test_slotted_isinstance(smartphone):
+    grass = SlottedLawnGrass("Газонная трава", "Элитная трава для газона", 500.0, 20, "Россия", "7 дней", "Зеленый")
+    assert isinstance(smartphone, Product) and isinstance(smartphone, Smartphone)
+    assert isinstance(grass, LawnGrass) and not isinstance(grass, Smartphone)
+    assert isinstance(SlottedProduct("Product 1", "Description 1", 100.0, 5), Product)
+
+
+def test_slotted_semantics(smartphone):
+    assert str(smartphone) == "Samsung Galaxy S23 Ultra, 180000.0 руб. Остаток: 5 шт."
+    smartphone.price = -1
+    assert smartphone.price == 180000.0
+    other = SlottedSmartphone.new_product({
+        "name": "Iphone 15", "description": "512GB, Gray space", "price": 210000.0, "quantity": 8,
+        "efficiency": 98.2, "model": "15", "memory": 512, "color": "Gray space"})
+    assert smartphone + other == 2580000.0
+    with pytest.raises(TypeError):
+        smartphone + SlottedProduct("Product 1", "Description 1", 100.0, 5)
+    with pytest.raises(ValueError):
+        SlottedProduct("Бракованный товар", "Неверное количество", 1000.0, 0)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_slotted_in_category(smartphone, columnar):
+    category = Category("Test Category", "Test Description", columnar=columnar)
+    category.add_product(smartphone)
+    smartphone.quantity = 7
+    assert str(category) == "Test Category, количество продуктов: 7 шт."
+    restored = category._Category__products[0]
+    assert type(restored) is SlottedSmartphone
+    assert restored.model == "S23 Ultra"
+
+
+def test_loader_with_slotted_types():
+    category = Category("Test Category", "Test Description")
+    report = load_records([
+        {"name": "Product 1", "description": "Description 1", "price": 100.0, "quantity": 5},
+        {"name": "Газонная трава", "description": "Элитная трава", "price": 500.0, "quantity": 20,
+         "country": "Россия", "germination_period": "7 дней", "color": "Зеленый"},
+    ], category, types=SLOTTED_TYPES)
+    assert report.loaded == 2
+    assert [type(p) for p in category._Category__products] == [SlottedProduct, SlottedLawnGrass]
@@ -0,0 +1,105 @@
+import pytest
+from src.main import Product, Category, Smartphone, LawnGrass
+from src.snapshot import SnapshotError
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+@pytest.fixture
+def categories():
+    smartphone = Smartphone("Samsung Galaxy S23 Ultra", "256GB, Серый цвет, 200MP камера", 180000.0, 5,
+                            95.5, "S23 Ultra", 256, "Серый")
+    lawn_grass = LawnGrass("Газонная трава", "Элитная трава для газона", 500.0, 20, "Россия", "7 дней", "Зеленый")
+    tv = Product("55\" QLED 4K", "Фоновая подсветка", 123000.0, 7)
+    return [
+        Category("Смартфоны", "Категория смартфонов", [smartphone, tv]),
+        Category("Сад", "Товары для сада", [lawn_grass], columnar=True),
+        Category("Пустая", "Без товаров"),
+    ]
+
+
+def test_snapshot_round_trip(tmp_path, categories):
+    path = tmp_path / "catalog.snap"
+    Category.save_snapshot(path, categories)
+    Category.category_count = 0
+    Category.product_count = 0
+    with Category.load_snapshot(path) as snapshot:
+        assert len(snapshot) == 3
+        assert Category.category_count == 0
+        loaded = list(snapshot)
+        assert snapshot[0] is loaded[0]
+        for original, restored in zip(categories, loaded):
+            assert restored.name == original.name
+            assert restored.description == original.description
+            assert restored.products == original.products
+            assert str(restored) == str(original)
+            assert restored.middle_price() == original.middle_price()
+        smartphone = loaded[0]._Category__products[0]
+        assert isinstance(smartphone, Smartphone)
+        assert (smartphone.efficiency, smartphone.model, smartphone.memory, smartphone.color) == (
+            95.5, "S23 Ultra", 256, "Серый")
+        assert Category.category_count == 3
+        assert Category.product_count == 3
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_snapshot_keeps_int_prices(tmp_path, columnar):
+    path = tmp_path / "catalog.snap"
+    category = Category("c", "d", [Product("A", "d", 100, 5), Product("B", "d", 100.0, 1)], columnar=columnar)
+    Category.save_snapshot(path, [category])
+    with Category.load_snapshot(path) as snapshot:
+        assert snapshot[0].products == category.products
+        assert snapshot[0].products.startswith("A, 100 руб.")
+        assert snapshot.view(0).product(0).price == 100 and type(snapshot.view(0).product(0).price) is int
+        assert type(snapshot.view(0).product(1).price) is float
+
+
+def test_snapshot_view_reads_single_product(tmp_path, categories):
+    path = tmp_path / "catalog.snap"
+    Category.save_snapshot(path, categories)
+    snapshot = Category.load_snapshot(path)
+    view = snapshot.view(1)
+    assert view.name == "Сад"
+    assert len(view) == 1
+    assert list(view.prices) == [500.0]
+    grass = view.product(0)
+    assert isinstance(grass, LawnGrass)
+    assert grass.germination_period == "7 дней"
+    del view
+    snapshot.close()
+
+
+def test_snapshot_close_with_exported_views(tmp_path, categories):
+    path = tmp_path / "catalog.snap"
+    Category.save_snapshot(path, categories)
+    snapshot = Category.load_snapshot(path)
+    view = snapshot.view(0)
+    prices = view.prices[:1]
+    with pytest.raises(SnapshotError):
+        snapshot.close()
+    assert len(snapshot) == 3
+    assert list(snapshot.view(0).prices) == list(prices) + [123000.0]
+    assert snapshot[1].name == "Сад"
+    prices.release()
+    snapshot.close()
+    snapshot.close()
+    with pytest.raises(ValueError):
+        len(view)
+
+
+def test_snapshot_rejects_corruption(tmp_path, categories):
+    path = tmp_path / "catalog.snap"
+    Category.save_snapshot(path, categories)
+    data = bytearray(path.read_bytes())
+    data[-20] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(SnapshotError):
+        Category.load_snapshot(path)
+    Category.load_snapshot(path, verify=False).close()
+    path.write_bytes(b"NOTASNAP" + bytes(data[8:]))
+    with pytest.raises(SnapshotError):
+        Category.load_snapshot(path)
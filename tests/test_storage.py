@@ -0,0 +1,157 @@
+import gc
+import weakref
+
+import pytest
+from src.main import Product, Category, Smartphone, LawnGrass
+from src.storage import ColumnarProducts
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+@pytest.fixture
+def products():
+    return [
+        Smartphone("Samsung Galaxy S23 Ultra", "256GB, Серый цвет, 200MP камера", 180000.0, 5,
+                   95.5, "S23 Ultra", 256, "Серый"),
+        LawnGrass("Газонная трава", "Элитная трава для газона", 500.0, 20, "Россия", "7 дней", "Зеленый"),
+        Product("55\" QLED 4K", "Фоновая подсветка", 123000.0, 7),
+    ]
+
+
+def test_columnar_category_matches_list_category(products):
+    plain = Category("Test Category", "Description", list(products))
+    columnar = Category("Test Category", "Description", list(products), columnar=True)
+    assert columnar.columnar and not plain.columnar
+    assert columnar.products == plain.products
+    assert str(columnar) == str(plain)
+    assert columnar.middle_price() == plain.middle_price()
+    assert Category.category_count == 2
+    assert Category.product_count == 6
+
+
+def test_columnar_add_product(products):
+    category = Category("Columnar", "Description", columnar=True)
+    for product in products:
+        category.add_product(product)
+    assert len(category._Category__products) == 3
+    assert Category.product_count == 3
+    with pytest.raises(TypeError):
+        category.add_product("Not a Product")
+
+
+def test_columnar_empty_category():
+    category = Category("Empty", "Description", [], columnar=True)
+    assert category.products == ""
+    assert category.middle_price() == 0
+    assert str(category) == "Empty, количество продуктов: 0 шт."
+
+
+def test_lazy_materialization(products, capsys):
+    assert ColumnarProducts(products)[0] is products[0]
+    storage = ColumnarProducts()
+    storage.extend_columns(ColumnarProducts(products))
+    capsys.readouterr()
+    smartphone = storage[0]
+    assert capsys.readouterr().out == ""
+    assert type(smartphone) is Smartphone
+    assert smartphone is not products[0]
+    assert smartphone.model == "S23 Ultra"
+    assert smartphone.memory == 256
+    assert storage[0] is smartphone
+    grass = storage[-2]
+    assert isinstance(grass, LawnGrass)
+    assert grass.germination_period == "7 дней"
+    assert str(storage[2]) == str(products[2])
+    assert [str(p) for p in storage[1:]] == [str(p) for p in products[1:]]
+    with pytest.raises(IndexError):
+        storage[3]
+
+
+def test_columnar_interns_strings():
+    first = Product("".join(["Same", " name"]), "Description", 1.0, 1)
+    second = Product("".join(["Same", " name"]), "Description", 2.0, 1)
+    storage = ColumnarProducts([first, second])
+    assert storage._names[0] is storage._names[1]
+
+
+def test_columnar_follows_product_changes(products):
+    category = Category("Test Category", "Description", list(products), columnar=True)
+    storage = category._Category__products
+    products[0].price = 190000.0
+    assert storage._prices[0] == 190000.0
+    restored = storage[1]
+    restored.quantity = 25
+    assert storage._quantities[1] == 25
+    assert str(category) == "Test Category, количество продуктов: 37 шт."
+    assert category.middle_price() == (190000.0 + 500.0 + 123000.0) / 3
+    products[1].quantity = 30
+    assert restored.quantity == 30
+
+
+def test_columnar_row_has_one_live_object():
+    product = Product("a", "Описание", 10.0, 1)
+    category = Category("Test Category", "Description", columnar=True)
+    category.add_product(product)
+    assert category.product_at(0) is product
+    category.product_at(0).quantity = 7
+    product.quantity = 2
+    assert str(category) == "Test Category, количество продуктов: 2 шт."
+    assert category.totals == (1, 2, 10.0, 20.0)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_discarded_category_is_collected(columnar):
+    product = Product("Чехол", "Силиконовый", 1000.0, 40)
+    kept = Category("Test Category", "Test Description", [product], columnar=columnar)
+    discarded = [weakref.ref(Category("Temp", "Temp", [product], columnar=columnar)) for _ in range(50)]
+    gc.collect()
+    assert all(ref() is None for ref in discarded)
+    product.price = 1500.0
+    assert len(product._listeners) == 1
+    assert kept.totals.price_sum == 1500.0
+
+
+def test_columnar_totals_use_stored_values(products):
+    category = Category("Test Category", "Description", columnar=True)
+    category.add_products(products)
+    stale = products[2]
+    category._Category__products._materialized.pop(2)
+    category.cheapest(1)
+    category.product_at(2).price = 50.0
+    stale.price = 70.0
+    assert category.product_at(2).price == 70.0
+    assert category.totals.price_sum == 180000.0 + 500.0 + 70.0
+    assert category.totals.stock_value == 180000.0 * 5 + 500.0 * 20 + 70.0 * 7
+    assert [product.price for product in category.cheapest(3)] == [70.0, 500.0, 180000.0]
+
+
+def test_same_rendering_on_both_backends():
+    def make():
+        return [Product("a", "Описание", 100, 5), Product("b", "Описание", 99.5, 2)]
+
+    plain = Category("Plain", "Description", make())
+    columnar = Category("Columnar", "Description", make(), columnar=True)
+    assert columnar.products == plain.products == "a, 100 руб. Остаток: 5 шт.\nb, 99.5 руб. Остаток: 2 шт."
+    columnar._Category__products._materialized.clear()
+    assert str(columnar.product_at(0)) == str(plain.product_at(0))
+    assert list(columnar.products_view) == list(plain.products_view)
+    for category in (plain, columnar):
+        category.find("a").price = 150.5
+        category.find("b").price = 80
+    assert columnar.products == plain.products == "a, 150.5 руб. Остаток: 5 шт.\nb, 80 руб. Остаток: 2 шт."
+
+
+def test_columnar_rejects_values_it_cannot_store():
+    category = Category("Columnar", "Description", columnar=True)
+    with pytest.raises(TypeError, match="количество"):
+        category.add_product(Product("a", "Описание", 100.0, 2.5))
+    with pytest.raises(TypeError, match="количество"):
+        category.add_products([Product("b", "Описание", 100.0, 1), Product("c", "Описание", 100.0, 1.5)])
+    assert category.totals.count == 0
+    assert Category.product_count == 0
+    plain = Category("Plain", "Description", [Product("a", "Описание", 100.0, 2.5)])
+    assert plain.products == "a, 100.0 руб. Остаток: 2.5 шт."
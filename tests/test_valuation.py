@@ -0,0 +1,53 @@
+import pytest
+from src.main import Product, Category, Smartphone, LawnGrass
+from src import valuation
+from src.valuation import valuate
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+@pytest.fixture
+def categories():
+    smartphone1 = Smartphone("Samsung Galaxy S23 Ultra", "256GB, Серый цвет, 200MP камера", 180000.0, 5,
+                             95.5, "S23 Ultra", 256, "Серый")
+    smartphone2 = Smartphone("Iphone 15", "512GB, Gray space", 210000.0, 8, 98.2, "15", 512, "Gray space")
+    lawn_grass = LawnGrass("Газонная трава", "Элитная трава для газона", 500.0, 20, "Россия", "7 дней", "Зеленый")
+    tv = Product("55\" QLED 4K", "Фоновая подсветка", 123000.0, 7)
+    return [
+        Category("Смартфоны", "Описание", [smartphone1, smartphone2]),
+        Category("Разное", "Описание", [lawn_grass, tv], columnar=True),
+    ]
+
+
+def test_category_valuation_matches_add(categories):
+    smartphones = categories[0]
+    result = smartphones.valuation(strict=True)
+    products = smartphones._Category__products
+    assert result.total == products[0] + products[1]
+    assert result.by_class == {"Smartphone": 2580000.0}
+
+
+def test_strict_mode_rejects_mixed_classes(categories):
+    with pytest.raises(TypeError):
+        categories[1].valuation(strict=True)
+    assert categories[1].valuation().total == 500.0 * 20 + 123000.0 * 7
+
+
+@pytest.mark.parametrize("use_numpy", [False, pytest.param(True, marks=pytest.mark.skipif(
+    valuation.np is None, reason="NumPy не установлен"))])
+def test_valuate_many_categories(categories, use_numpy):
+    result = valuate(categories, bins=2, use_numpy=use_numpy)
+    assert result.total == 2580000.0 + 10000.0 + 861000.0
+    assert result.by_class == {"Smartphone": 2580000.0, "LawnGrass": 10000.0, "Product": 861000.0}
+    assert result.histogram == [(500.0, 105250.0, 1), (105250.0, 210000.0, 3)]
+    assert result.count == 4
+
+
+def test_valuate_empty():
+    result = valuate([Category("Пустая", "Описание")], use_numpy=False)
+    assert result.total == 0
+    assert result.histogram == []
@@ -0,0 +1,59 @@
+import pytest
+from src.main import Product, Category
+
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    Category.category_count = 0
+    Category.product_count = 0
+
+
+@pytest.fixture(params=[False, True], ids=["list", "columnar"])
+def category(request):
+    products = [Product(f"Product {i}", f"Description {i}", 100.0 * i, i) for i in range(1, 6)]
+    return Category("Test Category", "Test Description", products, columnar=request.param)
+
+
+def test_view_matches_products_string(category):
+    view = category.products_view
+    assert len(view) == 5
+    assert str(view) == category.products
+    assert list(view) == category.products.split("\n")
+
+
+def test_view_index_and_slice(category):
+    view = category.products_view
+    assert view[0] == "Product 1, 100.0 руб. Остаток: 1 шт."
+    assert view[-1] == "Product 5, 500.0 руб. Остаток: 5 шт."
+    assert view[1:3] == ["Product 2, 200.0 руб. Остаток: 2 шт.", "Product 3, 300.0 руб. Остаток: 3 шт."]
+    with pytest.raises(IndexError):
+        view[5]
+
+
+def test_view_renders_lazily(category):
+    view = category.products_view
+    view.page(2, 2)
+    assert sorted(category._lines) == [2, 3]
+
+
+def test_view_pages(category):
+    view = category.products_view
+    first = view.page(0, 2)
+    assert first.lines == ["Product 1, 100.0 руб. Остаток: 1 шт.", "Product 2, 200.0 руб. Остаток: 2 шт."]
+    assert first.next_cursor == 2
+    last = view.page(4, 2)
+    assert last.lines == ["Product 5, 500.0 руб. Остаток: 5 шт."]
+    assert last.next_cursor is None
+    with pytest.raises(ValueError):
+        view.page(0, 0)
+
+
+def test_view_cache_invalidated_on_change():
+    product = Product("Product 1", "Description 1", 100.0, 5)
+    category = Category("Test Category", "Test Description", [product])
+    view = category.products_view
+    assert view[0] == "Product 1, 100.0 руб. Остаток: 5 шт."
+    product.price = 150.0
+    assert view[0] == "Product 1, 150.0 руб. Остаток: 5 шт."
+    product.quantity = 2
+    assert view[0] == "Product 1, 150.0 руб. Остаток: 2 шт."